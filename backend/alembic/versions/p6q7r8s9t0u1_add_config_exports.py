@@ -0,0 +1,45 @@
+"""Add content-addressed config_exports table and export_hash to versions
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-16 09:00:00.000000
+
+Stores the serialized Unity export of each version once, keyed by the
+SHA-256 of the bytes. Existing versions are materialized lazily on first export.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'p6q7r8s9t0u1'
+down_revision: Union[str, None] = 'o5p6q7r8s9t0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('config_exports',
+        sa.Column('hash', sa.String(length=64), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('hash')
+    )
+    
+    op.add_column('section_config_versions', sa.Column('export_hash', sa.String(length=64), nullable=True))
+    op.create_foreign_key(
+        'fk_section_config_versions_export_hash',
+        'section_config_versions',
+        'config_exports',
+        ['export_hash'],
+        ['hash']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_section_config_versions_export_hash', 'section_config_versions', type_='foreignkey')
+    op.drop_column('section_config_versions', 'export_hash')
+    op.drop_table('config_exports')
@@ -0,0 +1,57 @@
+"""Store section_config_versions.config_data as JSONB with a GIN index
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-10-16 11:00:00.000000
+
+PostgreSQL only: converts config_data from json to jsonb and adds a
+jsonb_path_ops GIN index so containment (@>) and JSONPath (@?) searches run
+in the database. Other backends keep the generic JSON column.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'q7r8s9t0u1v2'
+down_revision: Union[str, None] = 'p6q7r8s9t0u1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.alter_column(
+        'section_config_versions',
+        'config_data',
+        type_=postgresql.JSONB(),
+        existing_type=postgresql.JSON(),
+        existing_nullable=True,
+        postgresql_using='config_data::jsonb'
+    )
+    op.create_index(
+        'idx_section_config_version_config_data',
+        'section_config_versions',
+        ['config_data'],
+        postgresql_using='gin',
+        postgresql_ops={'config_data': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_index('idx_section_config_version_config_data', table_name='section_config_versions')
+    op.alter_column(
+        'section_config_versions',
+        'config_data',
+        type_=postgresql.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='config_data::json'
+    )
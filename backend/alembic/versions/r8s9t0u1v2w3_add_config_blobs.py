@@ -0,0 +1,153 @@
+"""Move version payloads into content-addressed config_blobs
+
+Revision ID: r8s9t0u1v2w3
+Revises: q7r8s9t0u1v2
+Create Date: 2026-10-16 13:00:00.000000
+
+Each distinct config payload is stored once in config_blobs, keyed by the
+SHA-256 of its canonical JSON; versions reference it through config_hash.
+Existing config_data is backfilled in batches before the column is dropped.
+The JSONB GIN index moves from section_config_versions to config_blobs.
+"""
+import hashlib
+import json
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'r8s9t0u1v2w3'
+down_revision: Union[str, None] = 'q7r8s9t0u1v2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+json_document = sa.JSON().with_variant(postgresql.JSONB(), 'postgresql')
+
+versions_table = sa.table(
+    'section_config_versions',
+    sa.column('id', sa.String),
+    sa.column('config_data', json_document),
+    sa.column('config_hash', sa.String),
+)
+
+blobs_table = sa.table(
+    'config_blobs',
+    sa.column('hash', sa.String),
+    sa.column('data', json_document),
+    sa.column('size', sa.Integer),
+    sa.column('created_at', sa.DateTime),
+)
+
+
+def _canonical_json(value) -> bytes:
+    # Must match app.utils.canonical_json.canonical_json
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == 'postgresql'
+
+    op.create_table('config_blobs',
+        sa.Column('hash', sa.String(length=64), nullable=False),
+        sa.Column('data', json_document, nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('hash')
+    )
+    op.add_column('section_config_versions', sa.Column('config_hash', sa.String(length=64), nullable=True))
+
+    # Backfill: one blob per distinct payload
+    stored = set()
+    last_id = ''
+    while True:
+        rows = bind.execute(
+            sa.select(versions_table.c.id, versions_table.c.config_data)
+            .where(versions_table.c.id > last_id)
+            .where(versions_table.c.config_data.is_not(None))
+            .order_by(versions_table.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        new_blobs = []
+        version_hashes = []
+        for version_id, config_data in rows:
+            encoded = _canonical_json(config_data)
+            config_hash = hashlib.sha256(encoded).hexdigest()
+            if config_hash not in stored:
+                stored.add(config_hash)
+                new_blobs.append({
+                    'hash': config_hash,
+                    'data': config_data,
+                    'size': len(encoded),
+                    'created_at': datetime.utcnow(),
+                })
+            version_hashes.append({'version_id': version_id, 'blob_hash': config_hash})
+        if new_blobs:
+            bind.execute(blobs_table.insert(), new_blobs)
+        # One executemany per batch instead of a round trip per version
+        bind.execute(
+            versions_table.update()
+            .where(versions_table.c.id == sa.bindparam('version_id'))
+            .values(config_hash=sa.bindparam('blob_hash')),
+            version_hashes
+        )
+
+    op.create_foreign_key(
+        'fk_section_config_versions_config_hash',
+        'section_config_versions',
+        'config_blobs',
+        ['config_hash'],
+        ['hash']
+    )
+    op.create_index('idx_section_config_version_config_hash', 'section_config_versions', ['config_hash'])
+
+    if is_postgresql:
+        op.drop_index('idx_section_config_version_config_data', table_name='section_config_versions')
+        op.create_index(
+            'idx_config_blob_data',
+            'config_blobs',
+            ['data'],
+            postgresql_using='gin',
+            postgresql_ops={'data': 'jsonb_path_ops'}
+        )
+    op.drop_column('section_config_versions', 'config_data')
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == 'postgresql'
+
+    op.add_column('section_config_versions', sa.Column('config_data', json_document, nullable=True))
+    bind.execute(
+        versions_table.update()
+        .values(
+            config_data=sa.select(blobs_table.c.data)
+            .where(blobs_table.c.hash == versions_table.c.config_hash)
+            .scalar_subquery()
+        )
+        .where(versions_table.c.config_hash.is_not(None))
+    )
+
+    if is_postgresql:
+        op.drop_index('idx_config_blob_data', table_name='config_blobs')
+        op.create_index(
+            'idx_section_config_version_config_data',
+            'section_config_versions',
+            ['config_data'],
+            postgresql_using='gin',
+            postgresql_ops={'config_data': 'jsonb_path_ops'}
+        )
+    op.drop_index('idx_section_config_version_config_hash', table_name='section_config_versions')
+    op.drop_constraint('fk_section_config_versions_config_hash', 'section_config_versions', type_='foreignkey')
+    op.drop_column('section_config_versions', 'config_hash')
+    op.drop_table('config_blobs')
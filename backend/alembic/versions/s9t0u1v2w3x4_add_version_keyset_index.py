@@ -0,0 +1,35 @@
+"""Add composite index for keyset pagination of section config versions
+
+Revision ID: s9t0u1v2w3x4
+Revises: r8s9t0u1v2w3
+Create Date: 2026-10-16 15:00:00.000000
+
+Versions are listed newest first by (created_at, id) within a section config.
+The composite index replaces the single-column section_config_id index,
+which it covers as a prefix.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 's9t0u1v2w3x4'
+down_revision: Union[str, None] = 'r8s9t0u1v2w3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_section_config_version_config_created',
+        'section_config_versions',
+        ['section_config_id', sa.text('created_at DESC'), 'id']
+    )
+    op.drop_index('idx_section_config_version_config_id', table_name='section_config_versions')
+
+
+def downgrade() -> None:
+    op.create_index('idx_section_config_version_config_id', 'section_config_versions', ['section_config_id'])
+    op.drop_index('idx_section_config_version_config_created', table_name='section_config_versions')
@@ -0,0 +1,83 @@
+"""Store gzip and brotli encodings of config exports
+
+Revision ID: u1v2w3x4y5z6
+Revises: t0u1v2w3x4y5
+Create Date: 2026-10-16 18:00:00.000000
+
+Exports are compressed once when they are written and served by
+Accept-Encoding. Existing exports are backfilled in batches; brotli variants
+are only backfilled when the brotli package is installed.
+"""
+import gzip
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'u1v2w3x4y5z6'
+down_revision: Union[str, None] = 't0u1v2w3x4y5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 200
+
+# Must match app.utils.compression
+MIN_COMPRESS_SIZE = 256
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+exports_table = sa.table(
+    'config_exports',
+    sa.column('hash', sa.String),
+    sa.column('data', sa.LargeBinary),
+    sa.column('gzip_data', sa.LargeBinary),
+    sa.column('br_data', sa.LargeBinary),
+)
+
+
+def _smaller(encoded: bytes, data: bytes):
+    return encoded if len(encoded) < len(data) else None
+
+
+def upgrade() -> None:
+    op.add_column('config_exports', sa.Column('gzip_data', sa.LargeBinary(), nullable=True))
+    op.add_column('config_exports', sa.Column('br_data', sa.LargeBinary(), nullable=True))
+
+    bind = op.get_bind()
+    last_hash = ''
+    while True:
+        rows = bind.execute(
+            sa.select(exports_table.c.hash, exports_table.c.data)
+            .where(exports_table.c.hash > last_hash)
+            .order_by(exports_table.c.hash)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_hash = rows[-1].hash
+
+        for export_hash, data in rows:
+            if len(data) < MIN_COMPRESS_SIZE:
+                continue
+            values = {'gzip_data': _smaller(gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0), data)}
+            if brotli is not None:
+                values['br_data'] = _smaller(
+                    brotli.compress(data, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY), data
+                )
+            bind.execute(
+                exports_table.update()
+                .where(exports_table.c.hash == export_hash)
+                .values(**values)
+            )
+
+
+def downgrade() -> None:
+    op.drop_column('config_exports', 'br_data')
+    op.drop_column('config_exports', 'gzip_data')
@@ -0,0 +1,37 @@
+"""Add published_version_id pointer to section_configs
+
+Revision ID: v2w3x4y5z6a7
+Revises: u1v2w3x4y5z6
+Create Date: 2026-10-16 19:00:00.000000
+
+Each section config can point at its live (published) baseline version.
+Deleting the published version clears the pointer.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'v2w3x4y5z6a7'
+down_revision: Union[str, None] = 'u1v2w3x4y5z6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('section_configs', sa.Column('published_version_id', sa.String(), nullable=True))
+    op.create_foreign_key(
+        'fk_section_configs_published_version_id',
+        'section_configs',
+        'section_config_versions',
+        ['published_version_id'],
+        ['id'],
+        ondelete='SET NULL'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_section_configs_published_version_id', 'section_configs', type_='foreignkey')
+    op.drop_column('section_configs', 'published_version_id')
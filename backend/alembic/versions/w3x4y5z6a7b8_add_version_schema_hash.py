@@ -0,0 +1,30 @@
+"""Record the schema each version's config_data was validated with
+
+Revision ID: w3x4y5z6a7b8
+Revises: v2w3x4y5z6a7
+Create Date: 2026-10-16 20:00:00.000000
+
+config_data is validated and normalized by its section schema when a version
+is written. Existing versions keep a NULL schema_hash and their stored
+exports; they are normalized the next time they are written, and their
+export is normalized first if it ever has to be rebuilt.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'w3x4y5z6a7b8'
+down_revision: Union[str, None] = 'v2w3x4y5z6a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('section_config_versions', sa.Column('schema_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('section_config_versions', 'schema_hash')
@@ -0,0 +1,42 @@
+"""Add retention_policies table for version pruning
+
+Revision ID: x4y5z6a7b8c9
+Revises: w3x4y5z6a7b8
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'x4y5z6a7b8c9'
+down_revision: Union[str, None] = 'w3x4y5z6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('retention_policies',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('game_id', sa.String(), nullable=False),
+        # Reuses the existing sectiontype enum
+        sa.Column('section_type', postgresql.ENUM(name='sectiontype', create_type=False), nullable=True),
+        sa.Column('keep_last', sa.Integer(), nullable=True),
+        sa.Column('keep_days', sa.Integer(), nullable=True),
+        sa.Column('keep_experiment_versions', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['game_id'], ['games.app_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('game_id', 'section_type', name='uq_retention_policy_game_section')
+    )
+    op.create_index(op.f('ix_retention_policies_id'), 'retention_policies', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_retention_policies_id'), table_name='retention_policies')
+    op.drop_table('retention_policies')
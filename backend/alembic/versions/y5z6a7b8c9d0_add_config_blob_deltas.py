@@ -0,0 +1,121 @@
+"""Store config blobs as keyframes or JSON Patch deltas
+
+Revision ID: y5z6a7b8c9d0
+Revises: x4y5z6a7b8c9
+Create Date: 2026-10-17 01:00:00.000000
+
+A delta blob keeps a patch against its base blob instead of the payload, so
+data becomes nullable. Existing blobs are all keyframes (depth 0).
+Downgrading writes every delta's reconstructed payload back into data.
+"""
+import copy
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'y5z6a7b8c9d0'
+down_revision: Union[str, None] = 'x4y5z6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+json_document = sa.JSON().with_variant(postgresql.JSONB(), 'postgresql')
+
+blobs_table = sa.table(
+    'config_blobs',
+    sa.column('hash', sa.String),
+    sa.column('data', json_document),
+    sa.column('delta', json_document),
+    sa.column('base_hash', sa.String),
+    sa.column('depth', sa.Integer),
+)
+
+
+def _pointer(pointer):
+    return [token.replace('~1', '/').replace('~0', '~') for token in pointer.split('/')[1:]]
+
+
+def _container(document, path):
+    for token in path[:-1]:
+        document = document[int(token) if isinstance(document, list) else token]
+    return document
+
+
+def _remove(document, path):
+    parent = _container(document, path)
+    return parent.pop(int(path[-1]) if isinstance(parent, list) else path[-1])
+
+
+def _add(document, path, value):
+    if not path:
+        return value
+    parent = _container(document, path)
+    if isinstance(parent, list):
+        parent.insert(len(parent) if path[-1] == '-' else int(path[-1]), value)
+    else:
+        parent[path[-1]] = value
+    return document
+
+
+def _apply_patch(document, operations):
+    # Must match app.utils.json_patch.apply_patch for the operations its diff emits
+    document = copy.deepcopy(document)
+    for operation in operations:
+        path = _pointer(operation['path'])
+        if operation['op'] == 'move':
+            document = _add(document, path, _remove(document, _pointer(operation['from'])))
+            continue
+        if operation['op'] in ('remove', 'replace'):
+            if not path:
+                document = None
+            else:
+                _remove(document, path)
+        if operation['op'] in ('add', 'replace'):
+            document = _add(document, path, copy.deepcopy(operation['value']))
+    return document
+
+
+def upgrade() -> None:
+    op.add_column('config_blobs', sa.Column('delta', json_document, nullable=True))
+    op.add_column('config_blobs', sa.Column('base_hash', sa.String(length=64), nullable=True))
+    op.add_column('config_blobs', sa.Column('depth', sa.Integer(), nullable=False, server_default='0'))
+    op.alter_column('config_blobs', 'depth', server_default=None)
+    op.alter_column('config_blobs', 'data', existing_type=json_document, nullable=True)
+    op.create_foreign_key(
+        'fk_config_blobs_base_hash', 'config_blobs', 'config_blobs', ['base_hash'], ['hash']
+    )
+    op.create_index('idx_config_blob_base', 'config_blobs', ['base_hash'], unique=False)
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+
+    # Shallowest first, so every base already holds its payload
+    depth = 1
+    while True:
+        rows = connection.execute(
+            sa.select(blobs_table.c.hash, blobs_table.c.delta, blobs_table.c.base_hash)
+            .where(blobs_table.c.depth == depth)
+        ).all()
+        if not rows:
+            break
+        for blob_hash, delta, base_hash in rows:
+            base = connection.execute(
+                sa.select(blobs_table.c.data).where(blobs_table.c.hash == base_hash)
+            ).scalar_one()
+            connection.execute(
+                blobs_table.update()
+                .where(blobs_table.c.hash == blob_hash)
+                .values(data=_apply_patch(base, delta))
+            )
+        depth += 1
+
+    op.drop_index('idx_config_blob_base', table_name='config_blobs')
+    op.drop_constraint('fk_config_blobs_base_hash', 'config_blobs', type_='foreignkey')
+    op.alter_column('config_blobs', 'data', existing_type=json_document, nullable=False)
+    op.drop_column('config_blobs', 'depth')
+    op.drop_column('config_blobs', 'base_hash')
+    op.drop_column('config_blobs', 'delta')
@@ -0,0 +1,67 @@
+"""Backfill brotli encodings of config exports
+
+Revision ID: z6a7b8c9d0e1
+Revises: y5z6a7b8c9d0
+Create Date: 2026-10-17 09:00:00.000000
+
+u1v2w3x4y5z6 only stored br_data when the brotli package happened to be
+installed, and brotli was not a declared dependency, so neither that
+backfill nor later writes produced brotli variants. brotli is now a main
+dependency; exports still without br_data are compressed here, in batches.
+"""
+from typing import Sequence, Union
+
+import brotli
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'z6a7b8c9d0e1'
+down_revision: Union[str, None] = 'y5z6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 200
+
+# Must match app.utils.compression
+MIN_COMPRESS_SIZE = 256
+BROTLI_QUALITY = 9
+
+exports_table = sa.table(
+    'config_exports',
+    sa.column('hash', sa.String),
+    sa.column('data', sa.LargeBinary),
+    sa.column('br_data', sa.LargeBinary),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    last_hash = ''
+    while True:
+        rows = bind.execute(
+            sa.select(exports_table.c.hash, exports_table.c.data)
+            .where(exports_table.c.hash > last_hash, exports_table.c.br_data.is_(None))
+            .order_by(exports_table.c.hash)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_hash = rows[-1].hash
+
+        for export_hash, data in rows:
+            if len(data) < MIN_COMPRESS_SIZE:
+                continue
+            encoded = brotli.compress(data, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+            if len(encoded) < len(data):
+                bind.execute(
+                    exports_table.update()
+                    .where(exports_table.c.hash == export_hash)
+                    .values(br_data=encoded)
+                )
+
+
+def downgrade() -> None:
+    # The encodings are redundant with data; nothing to undo
+    pass
@@ -11,6 +11,11 @@ from app.api.dependencies.services import (
     get_user_service,
     get_game_service,
     get_section_config_service,
+    get_delivery_service,
+    get_experiment_service,
+    get_export_service,
+    get_archive_service,
+    get_retention_service,
 )
 
 __all__ = [
@@ -25,5 +30,10 @@ __all__ = [
     "get_user_service",
     "get_game_service",
     "get_section_config_service",
+    "get_delivery_service",
+    "get_experiment_service",
+    "get_export_service",
+    "get_archive_service",
+    "get_retention_service",
 ]
 
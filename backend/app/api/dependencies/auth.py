@@ -11,6 +11,7 @@ from sqlalchemy.orm import selectinload
 
 from app.api.dependencies.common import get_db
 from app.core.auth import decode_access_token
+from app.core.principal_cache import Principal, principal_cache
 from app.models.user import User, UserRole
 
 logger = logging.getLogger(__name__)
@@ -22,11 +23,12 @@ security = HTTPBearer(auto_error=False)
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> Principal:
     """
     Get current authenticated user from JWT token in Authorization header.
     
     Token must be provided via Authorization header: Bearer <token>
+    Users are served from the principal cache when possible.
     """
     # Check if credentials are provided
     if not credentials:
@@ -55,6 +57,10 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    
     # Get user from database with assigned games loaded
     result = await db.execute(
         select(User)
@@ -70,16 +76,18 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return user
+    principal = Principal.from_user(user)
+    principal_cache.set(principal)
+    return principal
 
 
-def require_admin(current_user: User = Depends(get_current_user)) -> User:
+def require_admin(current_user: Principal = Depends(get_current_user)) -> Principal:
     """
     Dependency that requires the current user to be an admin.
     
     Usage:
         @router.post("/admin-only")
-        async def admin_endpoint(current_user: User = Depends(require_admin)):
+        async def admin_endpoint(current_user: Principal = Depends(require_admin)):
             ...
     """
     if current_user.role != UserRole.admin:
@@ -90,7 +98,7 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
-def can_access_game(user: User, app_id: str) -> bool:
+def can_access_game(user: Principal, app_id: str) -> bool:
     """
     Check if a user can access a specific game.
     
@@ -105,6 +113,6 @@ def can_access_game(user: User, app_id: str) -> bool:
         return True
     
     # Check if game is in user's assigned games (using app_id as PK)
-    return any(game.app_id == app_id for game in user.assigned_games)
+    return app_id in user.assigned_game_ids
 
 
@@ -29,3 +29,32 @@ def get_section_config_service(db: AsyncSession = Depends(get_db)):
     from app.services.section_config_service import SectionConfigService
     return SectionConfigService(db)
 
+
+def get_delivery_service(db: AsyncSession = Depends(get_db)):
+    """Get DeliveryService instance with database session"""
+    from app.services.delivery_service import DeliveryService
+    return DeliveryService(db)
+
+
+def get_experiment_service(db: AsyncSession = Depends(get_db)):
+    """Get ExperimentService instance with database session"""
+    from app.services.experiment_service import ExperimentService
+    return ExperimentService(db)
+
+
+def get_export_service(db: AsyncSession = Depends(get_db)):
+    """Get ExportService instance with database session"""
+    from app.services.export_service import ExportService
+    return ExportService(db)
+
+
+def get_archive_service(db: AsyncSession = Depends(get_db)):
+    """Get ArchiveService instance with database session"""
+    from app.services.archive_service import ArchiveService
+    return ArchiveService(db)
+
+
+def get_retention_service(db: AsyncSession = Depends(get_db)):
+    """Get RetentionService instance with database session"""
+    from app.services.retention_service import RetentionService
+    return RetentionService(db)
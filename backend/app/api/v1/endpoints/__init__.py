@@ -1,13 +1,19 @@
 """API v1 endpoint routers"""
 
 from app.api.v1.endpoints.auth import router as auth_router
+from app.api.v1.endpoints.delivery import router as delivery_router
+from app.api.v1.endpoints.experiments import router as experiments_router
 from app.api.v1.endpoints.games import router as games_router
+from app.api.v1.endpoints.retention import router as retention_router
 from app.api.v1.endpoints.section_configs import router as section_configs_router
 from app.api.v1.endpoints.users import router as users_router
 
 __all__ = [
     "auth_router",
+    "delivery_router",
+    "experiments_router",
     "games_router",
+    "retention_router",
     "section_configs_router",
     "users_router",
 ]
@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends
 from fastapi import status
 
 from app.api.dependencies import get_current_user, get_auth_service, get_user_service
-from app.models.user import User
+from app.core.principal_cache import Principal
 from app.schemas.auth import (
     CurrentUserResponse,
     LoginRequest,
@@ -44,7 +44,7 @@ async def logout():
 
 @router.get("/me", response_model=CurrentUserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Get current authenticated user info.
@@ -54,14 +54,14 @@ async def get_current_user_info(
         email=current_user.email,
         name=current_user.name,
         role=current_user.role,
-        assigned_game_ids=[game.app_id for game in current_user.assigned_games]
+        assigned_game_ids=sorted(current_user.assigned_game_ids)
     )
 
 
 @router.patch("/me", response_model=CurrentUserResponse)
 async def update_current_user_profile(
     profile_data: ProfileUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service)
 ):
     """
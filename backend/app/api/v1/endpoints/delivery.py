@@ -0,0 +1,144 @@
+"""Config delivery API endpoints for game clients"""
+
+import json
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.api.dependencies import get_current_user, get_delivery_service
+from app.core.config import settings
+from app.core.config_events import Subscription, config_event_broker
+from app.core.principal_cache import Principal
+from app.schemas.experiment import PlayerAssignmentRequest, PlayerAssignmentResponse
+from app.schemas.section_config import ConfigSyncRequest
+from app.services.delivery_service import DeliveryService
+from app.utils.compression import VARY_HEADERS, encoded_etag, encoding_headers, negotiate_encoding
+from app.utils.http_cache import etag_matches
+from app.utils.sse import SSE_HEADERS, SSE_MEDIA_TYPE, sse_comment, sse_message
+
+router = APIRouter()
+
+
+@router.get("/{game_id}/configs")
+async def get_game_configs(
+    game_id: str,
+    experiment: Optional[str] = Query(None, description="Experiment name"),
+    variant: Optional[str] = Query(None, description="Variant within the experiment"),
+    player_id: Optional[str] = Query(None, description="Assign the player to variants server-side"),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    service: DeliveryService = Depends(get_delivery_service)
+):
+    """
+    Get every section config of a game in Unity format.
+    Served from an in-memory snapshot that is rebuilt when a version changes.
+    With player_id, the player is bucketed into the game's active experiments
+    and experiment/variant are ignored.
+    The body is compressed on first request, off the event loop, and reused
+    for the snapshot.
+    """
+    if player_id:
+        _, document = await service.get_player_configs(game_id, player_id)
+    else:
+        document = await service.get_game_configs(game_id, experiment, variant)
+    variants = await document.load_variants()
+    encoding = negotiate_encoding(accept_encoding, variants)
+    etag = encoded_etag(document.content_hash, encoding)
+    
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={**VARY_HEADERS, "ETag": etag},
+        )
+    
+    return Response(
+        content=variants[encoding] if encoding else document.data,
+        media_type="application/json",
+        headers={**encoding_headers(encoding), "ETag": etag},
+    )
+
+
+@router.post("/{game_id}/sync")
+async def sync_game_configs(
+    game_id: str,
+    request: ConfigSyncRequest,
+    service: DeliveryService = Depends(get_delivery_service)
+):
+    """
+    Delta sync for game clients.
+    Send the content hash of every section already held (the hashes field of
+    a previous sync); only changed sections are returned, and sections that
+    are no longer delivered are listed in removed.
+    """
+    data = await service.sync_game_configs(
+        game_id,
+        request.known,
+        experiment=request.experiment,
+        variant=request.variant,
+        player_id=request.player_id,
+    )
+    return Response(content=data, media_type="application/json")
+
+
+async def stream_config_events(
+    subscription: Subscription,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat_seconds: float
+) -> AsyncIterator[bytes]:
+    """
+    Encode a subscription as server-sent events until the client goes away.
+    A keep-alive comment is sent after heartbeat_seconds without events.
+    """
+    yield sse_message(json.dumps({"game_id": subscription.game_id}), event="ready", retry_ms=3000)
+    while not await is_disconnected():
+        event = await subscription.get(heartbeat_seconds)
+        if subscription.overflowed:
+            # Events were dropped: the client has to refetch instead of patching
+            subscription.overflowed = False
+            yield sse_message("{}", event="resync")
+        if event is None:
+            yield sse_comment("keep-alive")
+        else:
+            yield sse_message(event.to_json(), event="change")
+
+
+@router.get("/{game_id}/events")
+async def config_events(
+    game_id: str,
+    request: Request,
+    service: DeliveryService = Depends(get_delivery_service)
+):
+    """
+    Server-sent event stream of a game's config changes.
+    A change event (section, version id, new hashes) is pushed whenever a
+    version is created, updated, duplicated or deleted, on any worker.
+    The session is only used to check the game and is closed before
+    streaming, so an open stream does not hold a pooled connection.
+    """
+    await service.get_snapshot(game_id)
+    await service.db.close()
+    
+    async def stream() -> AsyncIterator[bytes]:
+        async with config_event_broker.subscribe(game_id) as subscription:
+            async for message in stream_config_events(
+                subscription, request.is_disconnected, settings.SSE_HEARTBEAT_SECONDS
+            ):
+                yield message
+    
+    return StreamingResponse(stream(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
+
+
+@router.post("/{game_id}/assignments", response_model=PlayerAssignmentResponse)
+async def assign_players(
+    game_id: str,
+    request: PlayerAssignmentRequest,
+    current_user: Principal = Depends(get_current_user),
+    service: DeliveryService = Depends(get_delivery_service)
+):
+    """
+    Assign up to 10000 players to the game's experiments in one call.
+    Players are grouped into cohorts sharing the same resolved versions.
+    """
+    cohorts = await service.assign_players(game_id, request.player_ids, current_user)
+    return PlayerAssignmentResponse(cohorts=cohorts)
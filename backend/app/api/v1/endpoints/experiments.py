@@ -0,0 +1,59 @@
+"""Experiments API endpoints"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, status
+
+from app.api.dependencies import get_current_user, get_experiment_service
+from app.core.principal_cache import Principal
+from app.schemas.experiment import ExperimentCreate, ExperimentUpdate, ExperimentResponse
+from app.services.experiment_service import ExperimentService
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[ExperimentResponse])
+async def list_experiments(
+    game_id: str = Query(..., description="Game ID"),
+    current_user: Principal = Depends(get_current_user),
+    service: ExperimentService = Depends(get_experiment_service)
+):
+    """List a game's experiments"""
+    experiments = await service.list_experiments(game_id, current_user)
+    return experiments
+
+
+@router.post("", response_model=ExperimentResponse, status_code=status.HTTP_201_CREATED)
+async def create_experiment(
+    experiment_data: ExperimentCreate,
+    current_user: Principal = Depends(get_current_user),
+    service: ExperimentService = Depends(get_experiment_service)
+):
+    """
+    Create an experiment.
+    The name must match the experiment of the versions it should deliver.
+    """
+    experiment = await service.create_experiment(experiment_data, current_user)
+    return experiment
+
+
+@router.patch("/{experiment_id}", response_model=ExperimentResponse)
+async def update_experiment(
+    experiment_id: str,
+    update_data: ExperimentUpdate,
+    current_user: Principal = Depends(get_current_user),
+    service: ExperimentService = Depends(get_experiment_service)
+):
+    """Update an experiment's splits, description or active flag"""
+    experiment = await service.update_experiment(experiment_id, update_data, current_user)
+    return experiment
+
+
+@router.delete("/{experiment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_experiment(
+    experiment_id: str,
+    current_user: Principal = Depends(get_current_user),
+    service: ExperimentService = Depends(get_experiment_service)
+):
+    """Delete an experiment"""
+    await service.delete_experiment(experiment_id, current_user)
@@ -2,12 +2,22 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 
-from app.api.dependencies import get_current_user, require_admin, get_game_service
-from app.models.user import User
-from app.schemas.game import GameUpdate, GameResponse
+from app.api.dependencies import (
+    get_current_user,
+    require_admin,
+    get_game_service,
+    get_export_service,
+    get_archive_service,
+)
+from app.core.principal_cache import Principal
+from app.schemas.game import GameClone, GameUpdate, GameResponse, GameArchiveImportResponse
+from app.services.archive_service import ARCHIVE_MEDIA_TYPE, ArchiveService, iter_lines
+from app.services.export_service import ExportService
 from app.services.game_service import GameService
+from app.utils.http_cache import etag_matches, not_modified, set_etag, strong_etag
 
 router = APIRouter()
 
@@ -16,7 +26,7 @@ router = APIRouter()
 async def list_games(
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     game_service: GameService = Depends(get_game_service)
 ):
     """
@@ -34,7 +44,7 @@ async def create_game(
     name: str = Form(...),
     description: Optional[str] = Form(None),
     logo: Optional[UploadFile] = File(None),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     game_service: GameService = Depends(get_game_service)
 ):
     """Create a new game with optional logo. Admin only."""
@@ -45,7 +55,7 @@ async def create_game(
 @router.get("/{app_id}", response_model=GameResponse)
 async def get_game(
     app_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     game_service: GameService = Depends(get_game_service)
 ):
     """Get a specific game. User must have access to the game."""
@@ -53,11 +63,85 @@ async def get_game(
     return game
 
 
+@router.post("/{app_id}/clone", response_model=GameResponse, status_code=status.HTTP_201_CREATED)
+async def clone_game(
+    app_id: str,
+    clone: GameClone,
+    current_user: Principal = Depends(require_admin),
+    game_service: GameService = Depends(get_game_service)
+):
+    """Create a new game with copies of this game's section configs and versions. Admin only."""
+    game = await game_service.clone_game(app_id, clone)
+    return game
+
+
+@router.get("/{app_id}/bundle")
+async def export_game_bundle(
+    app_id: str,
+    experiment: Optional[str] = Query(None, description="Prefer versions of this experiment"),
+    variant: Optional[str] = Query(None, description="Variant within the experiment"),
+    version_id: List[str] = Query([], description="Explicit version per section (repeatable)"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    export_service: ExportService = Depends(get_export_service)
+):
+    """
+    Export every section of a game in Unity format as one document.
+    The body holds a manifest of per-section versions and hashes and the
+    sections keyed by name; the ETag is the SHA-256 of the body.
+    """
+    bundle = await export_service.build_bundle(
+        app_id, current_user, experiment=experiment, variant=variant, version_ids=version_id
+    )
+    etag = strong_etag(bundle.content_hash)
+    
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    response = Response(content=bundle.data, media_type="application/json")
+    set_etag(response, etag)
+    return response
+
+
+@router.get("/{app_id}/archive")
+async def export_game_archive(
+    app_id: str,
+    current_user: Principal = Depends(get_current_user),
+    archive_service: ArchiveService = Depends(get_archive_service)
+):
+    """
+    Stream every section config and version of a game as NDJSON.
+    Versions are read through a server-side cursor, so memory use does not
+    grow with the number of versions.
+    """
+    lines = await archive_service.open_archive(app_id, current_user)
+    return StreamingResponse(
+        lines,
+        media_type=ARCHIVE_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{app_id}.ndjson"'},
+    )
+
+
+@router.post("/{app_id}/archive", response_model=GameArchiveImportResponse)
+async def import_game_archive(
+    app_id: str,
+    request: Request,
+    current_user: Principal = Depends(require_admin),
+    archive_service: ArchiveService = Depends(get_archive_service)
+):
+    """
+    Import an NDJSON archive (the body, streamed) into a game. Admin only.
+    The game is created if it does not exist; versions are added under new ids
+    in batches, in one transaction.
+    """
+    return await archive_service.import_archive(app_id, iter_lines(request.stream()))
+
+
 @router.patch("/{app_id}", response_model=GameResponse)
 async def update_game(
     app_id: str,
     game_update: GameUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     game_service: GameService = Depends(get_game_service)
 ):
     """Update a game. User must have access to the game."""
@@ -68,7 +152,7 @@ async def update_game(
 @router.delete("/{app_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_game(
     app_id: str,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     game_service: GameService = Depends(get_game_service)
 ):
     """Delete a game. Admin only."""
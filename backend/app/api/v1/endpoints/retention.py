@@ -0,0 +1,80 @@
+"""Retention policy API endpoints"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, status
+
+from app.api.dependencies import get_current_user, get_retention_service
+from app.core.principal_cache import Principal
+from app.schemas.retention import (
+    PruneReport,
+    RetentionPolicyCreate,
+    RetentionPolicyUpdate,
+    RetentionPolicyResponse,
+)
+from app.services.retention_service import RetentionService
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[RetentionPolicyResponse])
+async def list_retention_policies(
+    game_id: str = Query(..., description="Game ID"),
+    current_user: Principal = Depends(get_current_user),
+    service: RetentionService = Depends(get_retention_service)
+):
+    """List a game's retention policies"""
+    policies = await service.list_policies(game_id, current_user)
+    return policies
+
+
+@router.post("", response_model=RetentionPolicyResponse, status_code=status.HTTP_201_CREATED)
+async def create_retention_policy(
+    policy_data: RetentionPolicyCreate,
+    current_user: Principal = Depends(get_current_user),
+    service: RetentionService = Depends(get_retention_service)
+):
+    """
+    Create a retention policy for one section of a game, or for all of its
+    sections without their own policy (section_type omitted).
+    """
+    policy = await service.create_policy(policy_data, current_user)
+    return policy
+
+
+@router.post("/prune", response_model=PruneReport)
+async def prune_versions(
+    game_id: str = Query(..., description="Game ID"),
+    dry_run: bool = Query(True, description="Only report what would be deleted"),
+    current_user: Principal = Depends(get_current_user),
+    service: RetentionService = Depends(get_retention_service)
+):
+    """
+    Apply a game's retention policies now.
+    Published versions and the newest version of every experiment/variant
+    are never deleted. Defaults to a dry run.
+    """
+    report = await service.prune_game(game_id, current_user, dry_run=dry_run)
+    return report
+
+
+@router.patch("/{policy_id}", response_model=RetentionPolicyResponse)
+async def update_retention_policy(
+    policy_id: str,
+    update_data: RetentionPolicyUpdate,
+    current_user: Principal = Depends(get_current_user),
+    service: RetentionService = Depends(get_retention_service)
+):
+    """Update a retention policy's rules"""
+    policy = await service.update_policy(policy_id, update_data, current_user)
+    return policy
+
+
+@router.delete("/{policy_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_retention_policy(
+    policy_id: str,
+    current_user: Principal = Depends(get_current_user),
+    service: RetentionService = Depends(get_retention_service)
+):
+    """Delete a retention policy"""
+    await service.delete_policy(policy_id, current_user)
@@ -1,44 +1,109 @@
 """Section Configs API endpoints"""
 
-from typing import List
+import json
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
 
 from app.api.dependencies import get_current_user, get_section_config_service
-from app.models.user import User
-from app.models.section_config import SectionType
+from app.core.principal_cache import Principal
+from app.models.section_config import SectionConfig, SectionConfigVersion, SectionType
 from app.schemas.section_config import (
     SectionConfigResponse,
+    SectionConfigPublish,
+    SectionConfigUnpublish,
     SectionConfigVersionCreate,
     SectionConfigVersionUpdate,
     SectionConfigVersionResponse,
+    SectionConfigVersionBulkWrite,
+    SectionConfigVersionBulkResponse,
     SectionConfigVersionListResponse,
     SectionConfigSummary,
+    GameSectionConfigSummary,
+    SectionConfigVersionMatch,
+    SectionConfigVersionDiff,
+    JsonPatchOperation,
 )
-from app.services.section_config_service import SectionConfigService
+from app.services.section_config_service import ANY_PUBLISHED_VERSION, SectionConfigService
+from app.utils.compression import VARY_HEADERS, encoded_etag, encoding_headers, negotiate_encoding
+from app.utils.http_cache import (
+    derived_etag,
+    etag_matches,
+    if_match_matches,
+    not_modified,
+    set_etag,
+    weak_etag,
+)
+from app.utils.json_response import JSON_MEDIA_TYPE, embed_json
 
 router = APIRouter()
 
 
+def section_config_etag(config: SectionConfig) -> str:
+    """Validator for a section config representation"""
+    return weak_etag(config.id, config.updated_at.isoformat(), config.published_version_id)
+
+
+def version_etag(version: SectionConfigVersion) -> str:
+    """
+    Validator for a version representation.
+    Strong, so clients can send it back in If-Match when patching the config.
+    """
+    return derived_etag(version.id, version.updated_at.isoformat(), version.config_hash, version.export_hash)
+
+
+async def export_response(
+    service: SectionConfigService,
+    export_hash: str,
+    if_none_match: Optional[str],
+    accept_encoding: Optional[str]
+) -> Response:
+    """Serve stored export bytes, or their gzip/brotli encoding, with a strong ETag per encoding"""
+    export = await service.get_export(export_hash)
+    variants = export.variants
+    encoding = negotiate_encoding(accept_encoding, variants)
+    etag = encoded_etag(export_hash, encoding)
+    
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, VARY_HEADERS)
+    
+    response = Response(
+        content=variants[encoding] if encoding else export.data,
+        media_type="application/json",
+        headers=encoding_headers(encoding),
+    )
+    set_etag(response, etag)
+    return response
+
+
 @router.get("", response_model=SectionConfigResponse)
 async def get_or_create_section_config(
+    response: Response,
     game_id: str = Query(..., description="Game ID"),
     section_type: SectionType = Query(..., description="Section type"),
-    current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
     service: SectionConfigService = Depends(get_section_config_service)
 ):
     """
     Get section config for a game+section combination.
     Auto-creates the config if it doesn't exist (one record per game+section).
+    Supports conditional requests via If-None-Match.
     """
     config = await service.get_or_create_config(game_id, section_type, current_user)
+    etag = section_config_etag(config)
+    
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    set_etag(response, etag)
     return config
 
 
 @router.get("/summary", response_model=List[SectionConfigSummary])
 async def get_section_configs_summary(
     game_id: str = Query(..., description="Game ID"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: SectionConfigService = Depends(get_section_config_service)
 ):
     """Get summary of all section configs for a game"""
@@ -46,30 +111,171 @@ async def get_section_configs_summary(
     return summaries
 
 
+@router.get("/summaries", response_model=List[GameSectionConfigSummary])
+async def get_section_configs_summaries(
+    game_ids: List[str] = Query(..., description="Game IDs"),
+    current_user: Principal = Depends(get_current_user),
+    service: SectionConfigService = Depends(get_section_config_service)
+):
+    """Get section config summaries for several games in one request"""
+    summaries = await service.get_config_summaries(game_ids, current_user)
+    return summaries
+
+
+@router.get("/search", response_model=List[SectionConfigVersionMatch])
+async def search_versions(
+    game_id: str = Query(..., description="Game ID"),
+    contains: Optional[str] = Query(None, description='JSON fragment, e.g. {"currencies":[{"id":"gems"}]}'),
+    path: Optional[str] = Query(None, description="JSONPath expression (PostgreSQL only)"),
+    section_type: Optional[SectionType] = Query(None, description="Section type"),
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: Principal = Depends(get_current_user),
+    service: SectionConfigService = Depends(get_section_config_service)
+):
+    """Find versions of a game whose config data matches a JSON fragment or JSONPath"""
+    fragment = None
+    if contains is not None:
+        try:
+            fragment = json.loads(contains)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="contains must be valid JSON"
+            )
+    
+    return await service.search_versions(
+        game_id, current_user, contains=fragment, path=path,
+        section_type=section_type, limit=limit
+    )
+
+
+@router.post("/versions/bulk", response_model=SectionConfigVersionBulkResponse)
+async def bulk_write_versions(
+    bulk_data: SectionConfigVersionBulkWrite,
+    current_user: Principal = Depends(get_current_user),
+    service: SectionConfigService = Depends(get_section_config_service)
+):
+    """
+    Create or update versions of several sections of a game in one transaction.
+    Items that fail are reported per item; the others are still written.
+    """
+    return await service.bulk_write_versions(bulk_data.game_id, bulk_data.items, current_user)
+
+
 @router.get("/{section_config_id}", response_model=SectionConfigResponse)
 async def get_section_config_by_id(
+    response: Response,
     section_config_id: str,
-    current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
     service: SectionConfigService = Depends(get_section_config_service)
 ):
     """Get a specific section configuration by ID"""
     config = await service.get_config_by_id(section_config_id, current_user)
+    etag = section_config_etag(config)
+    
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    set_etag(response, etag)
     return config
 
 
 # ==================== Version CRUD Endpoints ====================
 
 
+@router.post("/{section_config_id}/publish", response_model=SectionConfigResponse)
+async def publish_version(
+    section_config_id: str,
+    request: SectionConfigPublish,
+    current_user: Principal = Depends(get_current_user),
+    service: SectionConfigService = Depends(get_section_config_service)
+):
+    """
+    Make a baseline version the live config of its section.
+    The pointer is swapped in one UPDATE; with expected_version_id the swap
+    only happens if the currently published version still matches (else 409).
+    """
+    expected = (
+        request.expected_version_id
+        if "expected_version_id" in request.model_fields_set else ANY_PUBLISHED_VERSION
+    )
+    return await service.publish_version(
+        section_config_id, request.version_id, current_user, expected_version_id=expected
+    )
+
+
+@router.post("/{section_config_id}/unpublish", response_model=SectionConfigResponse)
+async def unpublish_version(
+    section_config_id: str,
+    request: Optional[SectionConfigUnpublish] = None,
+    current_user: Principal = Depends(get_current_user),
+    service: SectionConfigService = Depends(get_section_config_service)
+):
+    """
+    Clear the section's live version; delivery falls back to its latest
+    baseline version.
+    """
+    expected = (
+        request.expected_version_id
+        if request is not None and "expected_version_id" in request.model_fields_set
+        else ANY_PUBLISHED_VERSION
+    )
+    return await service.unpublish_version(section_config_id, current_user, expected_version_id=expected)
+
+
+@router.get("/{section_config_id}/published/export")
+async def export_published_version(
+    section_config_id: str,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    service: SectionConfigService = Depends(get_section_config_service)
+):
+    """Get the live version's config in Unity format (404 if nothing is published)"""
+    export_hash = await service.get_published_export_hash(section_config_id, current_user)
+    return await export_response(service, export_hash, if_none_match, accept_encoding)
+
+
 @router.get("/{section_config_id}/versions", response_model=SectionConfigVersionListResponse)
 async def list_versions(
+    response: Response,
     section_config_id: str,
-    skip: int = 0,
-    limit: int = 50,
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, ge=0, description="Offset, ignored when a cursor is given"),
+    include_total: bool = Query(True, description="Include the total version count"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
     service: SectionConfigService = Depends(get_section_config_service)
 ):
-    """List all versions for a section config"""
-    result = await service.list_versions(section_config_id, skip, limit, current_user)
+    """
+    List versions for a section config, newest first.
+    Follow next_cursor for further pages. A matching If-None-Match is answered
+    with 304 before the page is loaded.
+    """
+    config = await service.get_config_by_id(section_config_id, current_user)
+    etag = weak_etag(
+        section_config_id,
+        config.updated_at.isoformat(),
+        cursor,
+        skip,
+        limit,
+        include_total,
+    )
+    
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    result = await service.list_versions(
+        section_config_id,
+        limit,
+        current_user,
+        cursor=cursor,
+        skip=skip,
+        include_total=include_total,
+    )
+    set_etag(response, etag)
     return result
 
 
@@ -77,7 +283,7 @@ async def list_versions(
 async def create_version(
     section_config_id: str,
     version_data: SectionConfigVersionCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: SectionConfigService = Depends(get_section_config_service)
 ):
     """Create a new version for a section config"""
@@ -89,12 +295,53 @@ async def create_version(
 async def get_version(
     section_config_id: str,
     version_id: str,
-    current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
     service: SectionConfigService = Depends(get_section_config_service)
 ):
-    """Get a specific version"""
-    version = await service.get_version(section_config_id, version_id, current_user)
-    return version
+    """
+    Get a specific version.
+    config_data is copied into the body as the JSON text stored in the
+    database instead of being decoded and encoded again.
+    """
+    version, config_json = await service.get_version_with_config_json(
+        section_config_id, version_id, current_user
+    )
+    etag = version_etag(version)
+    
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    document = SectionConfigVersionResponse.model_validate(version).model_dump(
+        mode="json", exclude={"config_data"}
+    )
+    response = Response(
+        content=embed_json(
+            document,
+            config_data=config_json.encode("utf-8") if config_json is not None else b"null",
+        ),
+        media_type=JSON_MEDIA_TYPE,
+    )
+    set_etag(response, etag)
+    return response
+
+
+@router.get("/{section_config_id}/versions/{version_id}/export")
+async def export_version(
+    section_config_id: str,
+    version_id: str,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    service: SectionConfigService = Depends(get_section_config_service)
+):
+    """
+    Get a version's config in Unity format.
+    Serves the precomputed export bytes, or their stored gzip/brotli encoding
+    when Accept-Encoding allows, with a strong ETag per encoding.
+    """
+    export_hash = await service.get_version_export_hash(section_config_id, version_id, current_user)
+    return await export_response(service, export_hash, if_none_match, accept_encoding)
 
 
 @router.patch("/{section_config_id}/versions/{version_id}", response_model=SectionConfigVersionResponse)
@@ -102,7 +349,7 @@ async def update_version(
     section_config_id: str,
     version_id: str,
     update_data: SectionConfigVersionUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: SectionConfigService = Depends(get_section_config_service)
 ):
     """Update a version (title, description, experiment, variant, config_data)"""
@@ -110,11 +357,52 @@ async def update_version(
     return version
 
 
+@router.patch("/{section_config_id}/versions/{version_id}/config", response_model=SectionConfigVersionResponse)
+async def patch_version_config(
+    section_config_id: str,
+    version_id: str,
+    operations: List[JsonPatchOperation],
+    if_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    service: SectionConfigService = Depends(get_section_config_service)
+):
+    """
+    Edit a version's config_data with an RFC 6902 JSON Patch document.
+    Send If-Match with the ETag of the version GET (or the quoted
+    config_hash) to reject concurrent edits (412).
+    """
+    precondition = None
+    if if_match:
+        def precondition(version: SectionConfigVersion) -> bool:
+            return if_match_matches(if_match, version_etag(version), f'"{version.config_hash}"')
+    
+    version = await service.patch_version_config(
+        section_config_id,
+        version_id,
+        [operation.model_dump(by_alias=True, exclude_unset=True) for operation in operations],
+        current_user,
+        precondition=precondition,
+    )
+    return version
+
+
+@router.get("/{section_config_id}/versions/{version_id}/diff", response_model=SectionConfigVersionDiff)
+async def diff_versions(
+    section_config_id: str,
+    version_id: str,
+    base: str = Query(..., description="Version ID to diff against"),
+    current_user: Principal = Depends(get_current_user),
+    service: SectionConfigService = Depends(get_section_config_service)
+):
+    """Get the JSON Patch and change list that turn the base version's config into this version's"""
+    return await service.diff_versions(section_config_id, base, version_id, current_user)
+
+
 @router.delete("/{section_config_id}/versions/{version_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_version(
     section_config_id: str,
     version_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: SectionConfigService = Depends(get_section_config_service)
 ):
     """Delete a version"""
@@ -125,7 +413,7 @@ async def delete_version(
 async def duplicate_version(
     section_config_id: str,
     version_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: SectionConfigService = Depends(get_section_config_service)
 ):
     """Duplicate a version (creates a copy with the same config_data)"""
@@ -5,7 +5,7 @@ from typing import List
 from fastapi import APIRouter, Depends, status
 
 from app.api.dependencies import require_admin, get_user_service
-from app.models.user import User
+from app.core.principal_cache import Principal
 from app.schemas.auth import (
     UserCreate,
     UserUpdate,
@@ -19,7 +19,7 @@ router = APIRouter()
 
 @router.get("", response_model=List[UserListResponse])
 async def list_users(
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     user_service: UserService = Depends(get_user_service)
 ):
     """List all users. Admin only."""
@@ -30,7 +30,7 @@ async def list_users(
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_data: UserCreate,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     user_service: UserService = Depends(get_user_service)
 ):
     """Create a new user. Admin only."""
@@ -41,7 +41,7 @@ async def create_user(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: str,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     user_service: UserService = Depends(get_user_service)
 ):
     """Get a specific user by ID. Admin only."""
@@ -53,7 +53,7 @@ async def get_user(
 async def update_user(
     user_id: str,
     user_data: UserUpdate,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     user_service: UserService = Depends(get_user_service)
 ):
     """Update a user. Admin only."""
@@ -64,7 +64,7 @@ async def update_user(
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: str,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     user_service: UserService = Depends(get_user_service)
 ):
     """Delete a user. Admin only. Cannot delete yourself."""
@@ -75,7 +75,7 @@ async def delete_user(
 async def assign_game_to_user(
     user_id: str,
     app_id: str,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     user_service: UserService = Depends(get_user_service)
 ):
     """Assign a game to a user (for game operators). Admin only."""
@@ -87,7 +87,7 @@ async def assign_game_to_user(
 async def remove_game_from_user(
     user_id: str,
     app_id: str,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     user_service: UserService = Depends(get_user_service)
 ):
     """Remove a game assignment from a user. Admin only."""
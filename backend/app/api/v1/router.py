@@ -4,7 +4,10 @@ from fastapi import APIRouter
 
 from app.api.v1.endpoints import (
     auth_router,
+    delivery_router,
+    experiments_router,
     games_router,
+    retention_router,
     section_configs_router,
     users_router,
 )
@@ -17,3 +20,6 @@ api_router.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(users_router, prefix="/users", tags=["Users"])
 api_router.include_router(games_router, prefix="/games", tags=["Games"])
 api_router.include_router(section_configs_router, prefix="/section-configs", tags=["Section Configurations"])
+api_router.include_router(experiments_router, prefix="/experiments", tags=["Experiments"])
+api_router.include_router(retention_router, prefix="/retention-policies", tags=["Retention"])
+api_router.include_router(delivery_router, prefix="/delivery", tags=["Delivery"])
@@ -1,16 +1,21 @@
 """Authentication utilities - password hashing and JWT token management"""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.exceptions import ServiceBusyError
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password"""
@@ -22,6 +27,94 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated, size-limited thread pool.
+    
+    bcrypt releases the GIL, so hashing on these threads keeps the event loop
+    free. At most max_workers hashes run at once; once max_pending calls are
+    running or queued, new calls fail fast with ServiceBusyError instead of
+    piling up behind a login burst.
+    """
+    
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hash",
+        )
+        self._pending = 0
+        self._rejected = 0
+    
+    @property
+    def pending(self) -> int:
+        """Calls currently running or waiting for a worker"""
+        return self._pending
+    
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker"""
+        return max(0, self._pending - self.max_workers)
+    
+    def stats(self) -> Dict[str, int]:
+        """Pool usage counters for monitoring"""
+        return {
+            "workers": self.max_workers,
+            "pending": self.pending,
+            "queue_depth": self.queue_depth,
+            "max_pending": self.max_pending,
+            "rejected": self._rejected,
+        }
+    
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a hashing function on the pool.
+        
+        Raises:
+            ServiceBusyError: If max_pending calls are already in flight
+        """
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise ServiceBusyError("password hashing")
+        
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+    
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password off the event loop"""
+        return await self.run(verify_password, plain_password, hashed_password)
+    
+    async def hash(self, password: str) -> str:
+        """Hash a password off the event loop"""
+        return await self.run(get_password_hash, password)
+    
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued work has finished"""
+        self._executor.shutdown(wait=True)
+
+
+# Shared per-process password hashing pool
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the password hashing pool"""
+    return await password_hasher.verify(plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the password hashing pool"""
+    return await password_hasher.hash(password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token. If expires_delta is None, token will not expire."""
     to_encode = data.copy()
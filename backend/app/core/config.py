@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Literal, Optional
 from pydantic import Field, field_validator, ConfigDict
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,6 +20,36 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, ge=5, le=1440)
     
+    # Password hashing pool (bcrypt runs off the event loop)
+    PASSWORD_HASH_WORKERS: int = Field(default=2, ge=1)
+    PASSWORD_HASH_MAX_PENDING: int = Field(default=64, ge=1)
+    
+    # Authenticated user cache (0 disables caching)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = Field(default=60, ge=0)
+    PRINCIPAL_CACHE_MAX_SIZE: int = Field(default=10000, ge=0)
+    
+    # Server-sent config change events
+    SSE_HEARTBEAT_SECONDS: float = Field(default=15, gt=0)
+    SSE_MAX_PENDING_EVENTS: int = Field(default=100, ge=1)
+    
+    # Delivery snapshots are rebuilt at least this often, so changes missed by
+    # a worker are served within the interval (0 keeps them until a write)
+    CONFIG_SNAPSHOT_TTL_SECONDS: float = Field(default=30, ge=0)
+    
+    # Version retention pruning (0 disables the background job)
+    RETENTION_PRUNE_INTERVAL_SECONDS: float = Field(default=0, ge=0)
+    RETENTION_PRUNE_BATCH_SIZE: int = Field(default=500, ge=1)
+    
+    # Version history storage: "full" stores every payload whole, "delta"
+    # stores a JSON Patch against the section's previous payload with a full
+    # keyframe every CONFIG_KEYFRAME_INTERVAL payloads
+    CONFIG_HISTORY_MODE: Literal["full", "delta"] = Field(default="full")
+    CONFIG_KEYFRAME_INTERVAL: int = Field(default=10, ge=1, le=32)
+    CONFIG_RECONSTRUCTION_CACHE_SIZE: int = Field(default=256, ge=0)
+    
+    # Static publish target for nginx/CDN origin (unset disables publishing on write)
+    STATIC_PUBLISH_DIR: Optional[str] = Field(default=None)
+    
     # CORS - Parse from comma-separated string or JSON array
     BACKEND_CORS_ORIGINS: List[str] = Field(default_factory=list)
     
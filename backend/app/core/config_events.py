@@ -0,0 +1,231 @@
+"""
+Config change events - fan-out of version writes to server-sent event streams.
+
+Every committed version write produces a compact ConfigChangeEvent. Within a
+worker, subscribers (one per open SSE stream) receive it through the
+ConfigEventBroker. Across uvicorn workers, events travel through PostgreSQL
+NOTIFY on CONFIG_EVENTS_CHANNEL and each worker's PostgresEventListener
+(LISTEN on a dedicated asyncpg connection) hands them to its on_event hook
+(which drops the worker's stale delivery snapshot) and dispatches them locally.
+Without PostgreSQL, events are dispatched in the writing process only.
+"""
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CONFIG_EVENTS_CHANNEL = "config_events"
+
+# Seconds between reconnect attempts of the LISTEN connection
+LISTENER_RETRY_SECONDS = (1, 2, 5, 10, 30)
+
+
+@dataclass(frozen=True)
+class ConfigChangeEvent:
+    """A version of a game's section was written, deleted, published or unpublished"""
+    game_id: str
+    section_type: str
+    action: str  # created | updated | deleted | published | unpublished
+    version_id: str
+    config_hash: Optional[str] = None
+    export_hash: Optional[str] = None
+    experiment: Optional[str] = None
+    variant: Optional[str] = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> "ConfigChangeEvent":
+        return cls(**json.loads(payload))
+
+
+class Subscription:
+    """Bounded queue of one stream's pending events"""
+
+    def __init__(self, game_id: str, max_pending: int):
+        self.game_id = game_id
+        self.queue: "asyncio.Queue[ConfigChangeEvent]" = asyncio.Queue(maxsize=max_pending)
+        # Set when events were dropped; the stream tells the client to resync
+        self.overflowed = False
+
+    def put(self, event: ConfigChangeEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self, timeout: float) -> Optional[ConfigChangeEvent]:
+        """Next event, or None after timeout seconds without one"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ConfigEventBroker:
+    """Process-local registry of SSE subscribers per game"""
+
+    def __init__(self, max_pending: int):
+        self.max_pending = max_pending
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self.listener: Optional["PostgresEventListener"] = None
+
+    @asynccontextmanager
+    async def subscribe(self, game_id: str) -> AsyncIterator[Subscription]:
+        """Receive a game's events for the duration of the context"""
+        subscription = Subscription(game_id, self.max_pending)
+        self._subscriptions.setdefault(game_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscriptions = self._subscriptions.get(game_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[game_id]
+
+    def dispatch(self, event: ConfigChangeEvent) -> None:
+        """Deliver an event to this worker's subscribers of its game"""
+        for subscription in self._subscriptions.get(event.game_id, ()):
+            subscription.put(event)
+
+    async def publish(self, db: AsyncSession, event: ConfigChangeEvent) -> None:
+        """
+        Publish a committed change to every worker.
+
+        On PostgreSQL the event is sent with pg_notify; this worker receives
+        it back through its listener, or is dispatched to directly while the
+        listener is not connected.
+        """
+        if db.bind.dialect.name == "postgresql":
+            try:
+                await db.execute(select(func.pg_notify(CONFIG_EVENTS_CHANNEL, event.to_json())))
+                await db.commit()
+            except Exception:
+                # The write itself is committed; a lost notification only delays clients
+                logger.exception(f"Could not notify change of version {event.version_id}")
+                await db.rollback()
+        if self.listener is None or not self.listener.connected:
+            self.dispatch(event)
+
+    def stats(self) -> Dict[str, Any]:
+        """Subscriber and listener state for health checks"""
+        return {
+            "games": len(self._subscriptions),
+            "subscribers": sum(len(subscriptions) for subscriptions in self._subscriptions.values()),
+            "listening": self.listener is not None and self.listener.connected,
+        }
+
+
+class PostgresEventListener:
+    """
+    LISTEN for config events on a dedicated asyncpg connection and dispatch
+    them to the broker. on_event sees every event first, so process caches
+    are updated before subscribers refetch. Reconnects with backoff when the
+    connection drops.
+    """
+
+    def __init__(
+        self,
+        broker: ConfigEventBroker,
+        database_url: str,
+        on_event: Optional[Callable[[ConfigChangeEvent], None]] = None
+    ):
+        self.broker = broker
+        self.on_event = on_event
+        # asyncpg takes a plain postgresql:// DSN
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        self.connected = False
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self.broker.listener = self
+        self._task = asyncio.create_task(self._run(), name="config-events-listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.broker.listener is self:
+            self.broker.listener = None
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            event = ConfigChangeEvent.from_json(payload)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed config event: {payload!r}")
+            return
+        if self.on_event is not None:
+            try:
+                self.on_event(event)
+            except Exception:
+                logger.exception(f"Could not apply change of version {event.version_id}")
+        self.broker.dispatch(event)
+
+    async def _run(self) -> None:
+        import asyncpg
+
+        attempt = 0
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(CONFIG_EVENTS_CHANNEL, self._on_notification)
+                self.connected = True
+                attempt = 0
+                logger.info("Listening for config events")
+                await closed.wait()
+                logger.warning("Config events connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Config events listener failed, reconnecting")
+            finally:
+                self.connected = False
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            await asyncio.sleep(LISTENER_RETRY_SECONDS[min(attempt, len(LISTENER_RETRY_SECONDS) - 1)])
+            attempt += 1
+
+
+@asynccontextmanager
+async def config_events_listener(
+    database_url: str,
+    on_event: Optional[Callable[[ConfigChangeEvent], None]] = None
+) -> AsyncIterator[None]:
+    """Run a listener for the app's lifetime when the database is PostgreSQL"""
+    if make_url(database_url).get_backend_name() != "postgresql":
+        yield
+        return
+
+    listener = PostgresEventListener(config_event_broker, database_url, on_event)
+    listener.start()
+    try:
+        yield
+    finally:
+        await listener.stop()
+
+
+# Shared per-process broker
+config_event_broker = ConfigEventBroker(max_pending=settings.SSE_MAX_PENDING_EVENTS)
@@ -47,6 +47,15 @@ class InvalidWorkflowTransitionError(AppException):
         )
 
 
+class ServiceBusyError(AppException):
+    """Raised when a bounded resource pool is saturated"""
+    def __init__(self, resource: str):
+        super().__init__(
+            message=f"Too many concurrent {resource} requests, please retry shortly",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+
 class ValidationError(AppException):
     """Raised when data validation fails"""
     def __init__(self, field: str, message: str):
@@ -0,0 +1,105 @@
+"""Authenticated principal cache - avoids reloading users on every request"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.user import User, UserRole
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Immutable snapshot of an authenticated user.
+    Carries what authorization checks need; assigned games are a frozenset for O(1) lookups.
+    """
+    id: str
+    email: str
+    name: str
+    role: UserRole
+    assigned_game_ids: FrozenSet[str]
+    
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Build a principal from a User with assigned_games loaded"""
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            role=user.role,
+            assigned_game_ids=frozenset(game.app_id for game in user.assigned_games),
+        )
+
+
+class PrincipalCache:
+    """
+    TTL- and size-bounded LRU cache of principals keyed by user id.
+    
+    Entries expire after ttl_seconds so changes made by other workers are
+    picked up; changes made through UserService invalidate entries explicitly.
+    """
+    
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+    
+    def get(self, user_id: str) -> Optional[Principal]:
+        """Return a cached principal if present and not expired"""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(user_id, None)
+            return None
+        
+        self._entries.move_to_end(user_id)
+        return principal
+    
+    def set(self, principal: Principal) -> None:
+        """Cache a principal, evicting the least recently used entries when full"""
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+        
+        self._entries[principal.id] = (time.monotonic() + self.ttl_seconds, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, user_id: str) -> None:
+        """Drop a cached principal"""
+        self._entries.pop(user_id, None)
+    
+    def invalidate_on_commit(self, db: AsyncSession, user_id: str) -> None:
+        """
+        Drop a cached principal now and again once the session commits,
+        so a request racing the commit cannot re-cache the old state.
+        """
+        self.invalidate(user_id)
+        event.listen(
+            db.sync_session,
+            "after_commit",
+            lambda session: self.invalidate(user_id),
+            once=True,
+        )
+    
+    def clear(self) -> None:
+        """Drop every cached principal"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared per-process principal cache
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+)
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -6,8 +7,13 @@ from fastapi.responses import FileResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import IntegrityError
 
+from app.core.auth import password_hasher
 from app.core.config import settings
+from app.core.config_events import config_event_broker, config_events_listener
 from app.api.v1.router import api_router
+from app.services.delivery_service import config_snapshot_cache
+from app.services.retention_service import retention_pruner
+from app.utils.json_response import FastJSONResponse
 from app.core.exceptions import AppException
 from app.core.error_handlers import (
     app_exception_handler,
@@ -16,11 +22,23 @@ from app.core.error_handlers import (
     general_exception_handler
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks"""
+    async with config_events_listener(settings.DATABASE_URL, config_snapshot_cache.apply_event), \
+            retention_pruner(settings.RETENTION_PRUNE_INTERVAL_SECONDS):
+        yield
+    password_hasher.shutdown()
+
+
 app = FastAPI(
     title="Sunstudio Config Management API",
     version="1.0.0",
     description="Configuration management portal for game configs",
     redirect_slashes=False,  # Prevent 307 redirects for trailing slashes
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Create uploads directory if it doesn't exist
@@ -73,6 +91,8 @@ async def health_check():
         "status": "healthy",
         "environment": settings.ENVIRONMENT,
         "version": settings.VERSION,
+        "password_hashing": password_hasher.stats(),
+        "config_events": config_event_broker.stats(),
     }
 
 
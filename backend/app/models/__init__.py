@@ -1,12 +1,20 @@
 # Models package
 from app.models.base import BaseModel
+from app.models.config_blob import ConfigBlob
+from app.models.config_export import ConfigExport
+from app.models.experiment import Experiment
 from app.models.game import Game
+from app.models.retention_policy import RetentionPolicy
 from app.models.section_config import SectionConfig, SectionType, SectionConfigVersion
 from app.models.user import User, UserRole, user_game_assignments
 
 __all__ = [
     "BaseModel",
+    "ConfigBlob",
+    "ConfigExport",
+    "Experiment",
     "Game",
+    "RetentionPolicy",
     "SectionConfig",
     "SectionType",
     "SectionConfigVersion",
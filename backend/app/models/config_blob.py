@@ -0,0 +1,194 @@
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import relationship
+from app.core.config import settings
+from app.core.database import Base
+from app.utils.canonical_json import canonical_json
+from app.utils.json_patch import apply_patch, diff, json_equal
+from app.utils.json_query import JSONDocument
+from app.utils.unity_export import content_hash
+
+
+class ReconstructionCache:
+    """
+    Process-local payloads of delta blobs, least recently used first out.
+    Blobs are content-addressed, so an entry never goes stale.
+    """
+    
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._payloads: "OrderedDict[str, Any]" = OrderedDict()
+    
+    def get(self, blob_hash: str) -> Optional[Any]:
+        payload = self._payloads.get(blob_hash)
+        if payload is not None:
+            self._payloads.move_to_end(blob_hash)
+        return payload
+    
+    def set(self, blob_hash: str, payload: Any) -> None:
+        if self.max_size <= 0:
+            return
+        self._payloads[blob_hash] = payload
+        self._payloads.move_to_end(blob_hash)
+        while len(self._payloads) > self.max_size:
+            self._payloads.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._payloads.clear()
+
+
+reconstruction_cache = ReconstructionCache(settings.CONFIG_RECONSTRUCTION_CACHE_SIZE)
+
+
+class ConfigBlob(Base):
+    """
+    Config payload of one or more versions.
+    Content-addressed by the SHA-256 of its canonical JSON, so identical
+    payloads are stored once and compared by hash.
+    
+    A keyframe stores the payload in data. A delta stores a JSON Patch
+    against its base blob instead; depth counts the deltas between it and
+    its keyframe. Chains are never loaded implicitly: load_payloads
+    reconstructs the deltas a caller is about to read.
+    """
+    __tablename__ = "config_blobs"
+    
+    hash = Column(String(64), primary_key=True, nullable=False)
+    data = Column(JSONDocument, nullable=True)
+    delta = Column(JSONDocument, nullable=True)
+    base_hash = Column(String(64), ForeignKey("config_blobs.hash"), nullable=True)
+    depth = Column(Integer, nullable=False, default=0)
+    # Bytes stored: the canonical payload of a keyframe, the patch of a delta
+    size = Column(Integer, nullable=False)
+    
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    base = relationship("ConfigBlob", remote_side=[hash], lazy="raise")
+    
+    __table_args__ = (
+        # Serves @> containment and @? JSONPath searches over config data
+        Index(
+            'idx_config_blob_data',
+            'data',
+            postgresql_using='gin',
+            postgresql_ops={'data': 'jsonb_path_ops'},
+        ).ddl_if(dialect='postgresql'),
+        Index('idx_config_blob_base', 'base_hash'),
+    )
+    
+    @classmethod
+    def from_data(cls, data: Any) -> "ConfigBlob":
+        """Build the keyframe blob for a payload, addressed by its canonical hash"""
+        encoded = canonical_json(data)
+        return cls(hash=content_hash(encoded), data=data, depth=0, size=len(encoded))
+    
+    def delta_against(self, base: Optional["ConfigBlob"], keyframe_interval: int) -> "ConfigBlob":
+        """
+        Store this keyframe as a JSON Patch against base instead, unless the
+        chain would reach keyframe_interval blobs or the patch is no smaller
+        than the payload. Returns the blob.
+        """
+        if base is None or base.hash == self.hash or (base.depth or 0) + 1 >= keyframe_interval:
+            return self
+        patch = diff(base.payload, self.data).patch
+        encoded = canonical_json(patch)
+        if len(encoded) >= self.size or not json_equal(apply_patch(base.payload, patch), self.data):
+            return self
+    
+        reconstruction_cache.set(self.hash, self.data)
+        self._payload = self.data
+        self.data = None
+        self.delta = patch
+        self.base_hash = base.hash
+        self.base = base
+        self.depth = (base.depth or 0) + 1
+        self.size = len(encoded)
+        return self
+    
+    @property
+    def payload(self) -> Any:
+        """
+        The full payload. A delta's is taken from load_payloads or the
+        reconstruction cache; otherwise its base must already be loaded.
+        """
+        if self.base_hash is None:
+            return self.data
+        payload = getattr(self, "_payload", None)
+        if payload is None:
+            payload = reconstruction_cache.get(self.hash)
+        if payload is None:
+            payload = apply_patch(self.base.payload, self.delta)
+            reconstruction_cache.set(self.hash, payload)
+        self._payload = payload
+        return payload
+    
+    def row(self) -> Dict[str, Any]:
+        """Column values for inserting this blob"""
+        return {
+            "hash": self.hash,
+            # SQL NULL rather than JSON null for the column a blob does not use
+            "data": null() if self.base_hash is not None else self.data,
+            "delta": self.delta if self.base_hash is not None else null(),
+            "base_hash": self.base_hash,
+            "depth": self.depth or 0,
+            "size": self.size,
+        }
+
+
+async def load_payloads(db: AsyncSession, blobs: Iterable[Optional[ConfigBlob]]) -> None:
+    """
+    Reconstruct the payloads of the delta blobs among blobs that are not
+    cached, fetching every chain they need with one recursive query.
+    """
+    missing: Dict[str, ConfigBlob] = {}
+    for blob in blobs:
+        if blob is None or blob.base_hash is None or getattr(blob, "_payload", None) is not None:
+            continue
+        payload = reconstruction_cache.get(blob.hash)
+        if payload is not None:
+            blob._payload = payload
+        else:
+            missing[blob.hash] = blob
+    if not missing:
+        return
+    
+    chain = (
+        select(ConfigBlob.hash, ConfigBlob.base_hash)
+        .where(ConfigBlob.hash.in_(list(missing)))
+        .cte("chain", recursive=True)
+    )
+    chain = chain.union(
+        select(ConfigBlob.hash, ConfigBlob.base_hash).join(chain, ConfigBlob.hash == chain.c.base_hash)
+    )
+    result = await db.execute(
+        select(ConfigBlob.hash, ConfigBlob.data, ConfigBlob.delta, ConfigBlob.base_hash)
+        .where(ConfigBlob.hash.in_(select(chain.c.hash)))
+    )
+    rows = {row.hash: row for row in result.all()}
+    
+    payloads: Dict[str, Any] = {}
+    
+    def reconstruct(blob_hash: str) -> Any:
+        # Walk down to the nearest keyframe or cached payload, then patch back up
+        pending = []
+        while blob_hash not in payloads:
+            row = rows[blob_hash]
+            if row.base_hash is None:
+                payloads[blob_hash] = row.data
+                break
+            cached = reconstruction_cache.get(blob_hash)
+            if cached is not None:
+                payloads[blob_hash] = cached
+                break
+            pending.append(row)
+            blob_hash = row.base_hash
+        for row in reversed(pending):
+            payloads[row.hash] = apply_patch(payloads[row.base_hash], row.delta)
+            reconstruction_cache.set(row.hash, payloads[row.hash])
+        return payloads[pending[0].hash] if pending else payloads[blob_hash]
+    
+    for blob_hash, blob in missing.items():
+        blob._payload = reconstruct(blob_hash)
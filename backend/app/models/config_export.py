@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Dict
+from sqlalchemy import Column, String, Integer, DateTime, LargeBinary
+from app.core.database import Base
+from app.utils.compression import BROTLI, GZIP
+
+
+class ConfigExport(Base):
+    """
+    Serialized Unity export of a config payload.
+    Content-addressed by the SHA-256 of the bytes, so identical exports are stored once.
+    Gzip and brotli encodings are stored alongside when they are smaller than the bytes.
+    """
+    __tablename__ = "config_exports"
+    
+    hash = Column(String(64), primary_key=True, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    size = Column(Integer, nullable=False)
+    gzip_data = Column(LargeBinary, nullable=True)
+    br_data = Column(LargeBinary, nullable=True)
+    
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    @property
+    def variants(self) -> Dict[str, bytes]:
+        """Stored precompressed encodings, by content-coding"""
+        variants = {GZIP: self.gzip_data, BROTLI: self.br_data}
+        return {encoding: data for encoding, data in variants.items() if data is not None}
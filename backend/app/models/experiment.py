@@ -0,0 +1,30 @@
+from sqlalchemy import Column, String, Boolean, ForeignKey, JSON, UniqueConstraint
+from sqlalchemy.orm import relationship
+from app.models.base import BaseModel
+
+
+class Experiment(BaseModel):
+    """
+    A/B experiment of a game.
+    
+    Players are bucketed by hashing (experiment name, player_id); splits
+    assign bucket ranges to the variants used by SectionConfigVersion.variant.
+    """
+    __tablename__ = "experiments"
+    
+    game_id = Column(String, ForeignKey("games.app_id", ondelete="CASCADE"), nullable=False)
+    
+    # Matches SectionConfigVersion.experiment
+    name = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+    
+    # [{"variant": "b", "weight": 5000}, ...] - weights in basis points
+    splits = Column(JSON, nullable=False, default=list)
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    # Relationships
+    game = relationship("Game", back_populates="experiments")
+    
+    __table_args__ = (
+        UniqueConstraint('game_id', 'name', name='uq_experiment_game_name'),
+    )
@@ -20,6 +20,8 @@ class Game(Base):
     
     # Relationships
     section_configs = relationship("SectionConfig", back_populates="game", cascade="all, delete-orphan")
+    experiments = relationship("Experiment", back_populates="game", cascade="all, delete-orphan")
+    retention_policies = relationship("RetentionPolicy", back_populates="game", cascade="all, delete-orphan")
     
     # Assigned operators (game operators who can access this game)
     assigned_operators = relationship(
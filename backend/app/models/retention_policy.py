@@ -0,0 +1,33 @@
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy.orm import relationship
+from app.models.base import BaseModel
+from app.models.section_config import SectionType
+
+
+class RetentionPolicy(BaseModel):
+    """
+    Version retention rules of a game, or of one section of it.
+    
+    A section uses its own policy if it has one, else the game-wide policy
+    (section_type NULL). Versions beyond keep_last and older than keep_days
+    are pruned; published versions and the newest version of every
+    experiment/variant are always kept.
+    """
+    __tablename__ = "retention_policies"
+    
+    game_id = Column(String, ForeignKey("games.app_id", ondelete="CASCADE"), nullable=False)
+    section_type = Column(SQLEnum(SectionType), nullable=True)
+    
+    # NULL disables the rule
+    keep_last = Column(Integer, nullable=True)
+    keep_days = Column(Integer, nullable=True)
+    
+    # Keep every version whose experiment is defined for the game
+    keep_experiment_versions = Column(Boolean, nullable=False, default=True)
+    
+    # Relationships
+    game = relationship("Game", back_populates="retention_policies")
+    
+    __table_args__ = (
+        UniqueConstraint('game_id', 'section_type', name='uq_retention_policy_game_section'),
+    )
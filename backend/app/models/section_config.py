@@ -1,5 +1,6 @@
 from enum import Enum
-from sqlalchemy import Column, String, ForeignKey, JSON, Enum as SQLEnum, Index, UniqueConstraint
+from typing import Any, Optional
+from sqlalchemy import Column, String, ForeignKey, Enum as SQLEnum, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 
@@ -30,16 +31,34 @@ class SectionType(str, Enum):
 class SectionConfig(BaseModel):
     """
     Single config record per game+section_type combination.
-    Acts as a container for versions.
+    Acts as a container for versions; published_version_id points at the live one.
     """
     __tablename__ = "section_configs"
     
     game_id = Column(String, ForeignKey("games.app_id", ondelete="CASCADE"), nullable=False)
     section_type = Column(SQLEnum(SectionType), nullable=False, index=True)
     
+    # Live baseline version; sections without one serve their latest baseline version.
+    # Added after both tables exist (the tables reference each other).
+    published_version_id = Column(
+        String,
+        ForeignKey(
+            "section_config_versions.id",
+            ondelete="SET NULL",
+            use_alter=True,
+            name="fk_section_configs_published_version_id",
+        ),
+        nullable=True,
+    )
+    
     # Relationships
     game = relationship("Game", back_populates="section_configs")
-    versions = relationship("SectionConfigVersion", back_populates="section_config", cascade="all, delete-orphan")
+    versions = relationship(
+        "SectionConfigVersion",
+        back_populates="section_config",
+        cascade="all, delete-orphan",
+        foreign_keys="SectionConfigVersion.section_config_id",
+    )
     
     # Indexes and constraints - one record per game+section
     __table_args__ = (
@@ -63,13 +82,36 @@ class SectionConfigVersion(BaseModel):
     experiment = Column(String, nullable=True)
     variant = Column(String, nullable=True)
     
-    # Config data
-    config_data = Column(JSON, nullable=True)
+    # Config data, stored once per distinct payload (see config_blobs)
+    config_hash = Column(String(64), ForeignKey("config_blobs.hash"), nullable=True)
+    
+    # Hash of the section schema config_data was normalized with; NULL if unvalidated
+    schema_hash = Column(String(64), nullable=True)
+    
+    # Precomputed Unity export of config_data (see config_exports)
+    export_hash = Column(String(64), ForeignKey("config_exports.hash"), nullable=True)
     
     # Relationships
-    section_config = relationship("SectionConfig", back_populates="versions")
+    section_config = relationship(
+        "SectionConfig", back_populates="versions", foreign_keys=[section_config_id]
+    )
+    blob = relationship("ConfigBlob", lazy="joined")
     
     # Indexes and constraints
     __table_args__ = (
-        Index('idx_section_config_version_config_id', 'section_config_id'),
+        Index('idx_section_config_version_config_hash', 'config_hash'),
     )
+    
+    @property
+    def config_data(self) -> Optional[Any]:
+        """Config payload of this version"""
+        return self.blob.payload if self.blob is not None else None
+
+
+# Serves newest-first keyset pagination of a section's versions
+Index(
+    'idx_section_config_version_config_created',
+    SectionConfigVersion.section_config_id,
+    SectionConfigVersion.created_at.desc(),
+    SectionConfigVersion.id,
+)
@@ -1,3 +1,4 @@
+from typing import FrozenSet
 from sqlalchemy import Column, String, Boolean, Table, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from enum import Enum
@@ -36,3 +37,8 @@ class User(BaseModel):
         secondary=user_game_assignments,
         back_populates="assigned_operators"
     )
+    
+    @property
+    def assigned_game_ids(self) -> FrozenSet[str]:
+        """App IDs of assigned games (requires assigned_games to be loaded)"""
+        return frozenset(game.app_id for game in self.assigned_games)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+CLI tool for applying version retention policies.
+
+Deletes the versions each game's retention policies do not keep, then the
+payload blobs and exports no version references. The API server does the
+same periodically when RETENTION_PRUNE_INTERVAL_SECONDS is set.
+
+Usage:
+    # Report what would be pruned in every game with a policy
+    python -m app.prune --dry-run
+
+    # Prune selected games
+    python -m app.prune --game my-game --game other-game
+"""
+
+import asyncio
+from typing import List, Optional, Tuple
+
+import click
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.schemas.retention import PruneReport
+from app.services.retention_service import RetentionService
+
+
+async def prune(game_ids: Optional[List[str]], dry_run: bool) -> List[PruneReport]:
+    """Prune games from the configured database."""
+    engine = create_async_engine(settings.DATABASE_URL)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with async_session() as session:
+            service = RetentionService(session)
+            reports = [
+                await service.prune(game_id, dry_run=dry_run)
+                for game_id in game_ids or await service.policy_game_ids()
+            ]
+            if not dry_run:
+                await service.collect_garbage()
+            return reports
+    finally:
+        await engine.dispose()
+
+
+@click.command()
+@click.option(
+    "--game", "-g",
+    "games",
+    multiple=True,
+    help="App ID to prune (repeatable; every game with a policy if omitted)",
+)
+@click.option("--dry-run", is_flag=True, help="Only report what would be deleted")
+def prune_command(games: Tuple[str, ...], dry_run: bool) -> None:
+    """Apply version retention policies."""
+    reports = asyncio.run(prune(list(games) or None, dry_run))
+
+    verb = "would prune" if dry_run else "pruned"
+    for report in reports:
+        click.echo(f"✓ {report.game_id}: {verb} {report.versions} versions")
+        for section in report.sections:
+            click.echo(f"  {section.section_type.value}: {section.versions}")
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    prune_command()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+CLI tool for publishing game configs as static files.
+
+Writes {output}/{app_id}/{section}.{sha256}.json files and an atomically
+swapped {output}/{app_id}/latest.json manifest for nginx or a CDN origin.
+
+Usage:
+    # Publish every game to STATIC_PUBLISH_DIR
+    python -m app.publish
+
+    # Publish selected games to a directory
+    python -m app.publish --output /srv/gamify/configs --game my-game --game other-game
+"""
+
+import asyncio
+import sys
+from typing import List, Optional, Tuple
+
+import click
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.services.publish_service import PublishResult, PublishService
+
+
+async def publish(output: str, game_ids: Optional[List[str]]) -> List[PublishResult]:
+    """Publish games from the configured database."""
+    engine = create_async_engine(settings.DATABASE_URL)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with async_session() as session:
+            return await PublishService(session).publish_games(output, game_ids)
+    finally:
+        await engine.dispose()
+
+
+@click.command()
+@click.option(
+    "--output", "-o",
+    default=None,
+    help="Publish directory (defaults to STATIC_PUBLISH_DIR)",
+)
+@click.option(
+    "--game", "-g",
+    "games",
+    multiple=True,
+    help="App ID to publish (repeatable; all games if omitted)",
+)
+def publish_command(output: Optional[str], games: Tuple[str, ...]) -> None:
+    """Publish game configs as immutable static files."""
+    output = output or settings.STATIC_PUBLISH_DIR
+    if not output:
+        click.echo("Error: pass --output or set STATIC_PUBLISH_DIR.", err=True)
+        sys.exit(1)
+
+    try:
+        results = asyncio.run(publish(output, list(games) or None))
+    except HTTPException as e:
+        click.echo(f"Error: {e.detail}", err=True)
+        sys.exit(1)
+
+    for result in results:
+        click.echo(
+            f"✓ {result.game_id}: {len(result.written)} written, "
+            f"{len(result.removed)} removed -> {result.manifest_path}"
+        )
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    publish_command()
+
+
+if __name__ == "__main__":
+    main()
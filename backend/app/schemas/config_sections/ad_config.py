@@ -40,7 +40,7 @@ class AdPlacementItem(BaseModel):
     """Individual ad placement configuration"""
     name: str = Field(..., min_length=1, description="Placement name/identifier")
     type: PlacementType = Field(default=PlacementType.BANNER, description="Ad type")
-    action: PlacementAction = Field(default=PlacementAction.LOAD_AND_SHOW, description="Ad action")
+    action: PlacementAction = Field(default=PlacementAction.LOAD, description="Ad action")
     enabled: bool = Field(default=True, description="Whether this placement is enabled")
     minLevel: int = Field(default=1, ge=0, description="Minimum player level to show this ad")
     timeBetween: int = Field(default=0, ge=0, description="Time between ads in seconds")
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class AnalyticsConfig(BaseModel):
+    """Analytics SDK configuration"""
+    dev_key: str = Field(default="", description="Analytics developer key")
+    app_id: str = Field(default="", description="Analytics app ID")
@@ -1,17 +1,19 @@
+from typing import Union
 from pydantic import BaseModel, Field
 
 
 class BoosterItem(BaseModel):
     """Individual booster configuration"""
-    UnlockLevel: int = Field(ge=1, description="Level at which booster unlocks")
-    RefillAmount: int = Field(ge=0, description="Amount to refill per interval")
-    Start: int = Field(ge=0, description="Starting amount for new players")
+    unlock_level: int = Field(default=0, ge=0, description="Level at which booster unlocks")
+    refill_amount: int = Field(default=0, ge=0, description="Amount to refill per interval")
+    start: int = Field(default=0, ge=0, description="Starting amount for new players")
 
 
 class BoosterConfig(BaseModel):
     """Booster configuration for power-ups"""
-    Undo: BoosterItem = Field(..., description="Undo booster configuration")
-    Hint: BoosterItem = Field(..., description="Hint booster configuration")
-    Shuffle: BoosterItem = Field(..., description="Shuffle booster configuration")
-    AutoUseAfterAds: bool = Field(default=True, description="Auto-use booster after watching ad")
-    
+    undo: BoosterItem = Field(default_factory=BoosterItem, description="Undo booster configuration")
+    hint: BoosterItem = Field(default_factory=BoosterItem, description="Hint booster configuration")
+    shuffle: BoosterItem = Field(default_factory=BoosterItem, description="Shuffle booster configuration")
+    auto_use_after_ads: bool = Field(default=False, description="Auto-use booster after watching ad")
+    time_auto_suggestion: Union[int, float] = Field(default=0, ge=0, description="Seconds before a booster is suggested")
+    auto_suggestion_enabled: bool = Field(default=False, description="Whether boosters are suggested automatically")
@@ -3,7 +3,6 @@ from pydantic import BaseModel, Field
 
 class ChapterRewardConfig(BaseModel):
     """Chapter completion reward configuration"""
-    Undo: int = Field(ge=0, description="Number of Undo boosters rewarded")
-    Hint: int = Field(ge=0, description="Number of Hint boosters rewarded")
-    Shuffle: int = Field(ge=0, description="Number of Shuffle boosters rewarded")
-    
+    undo: int = Field(default=0, ge=0, description="Number of Undo boosters rewarded")
+    hint: int = Field(default=0, ge=0, description="Number of Hint boosters rewarded")
+    shuffle: int = Field(default=0, ge=0, description="Number of Shuffle boosters rewarded")
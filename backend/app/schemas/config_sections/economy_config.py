@@ -26,11 +26,11 @@ class Currency(BaseModel):
     id: str = Field(..., min_length=1, description="Unique currency identifier")
     
     # New format fields (optional, but one of name/displayName required)
-    displayName: Optional[str] = Field(default=None, description="Display name")
+    displayName: Optional[str] = Field(default="", description="Display name")
     description: Optional[str] = Field(default="", description="Currency description")
     iconPath: Optional[str] = Field(default="", description="Icon path in assets")
-    startingBalance: Optional[int] = Field(default=None, ge=0, description="Starting balance")
-    maxValue: Optional[int] = Field(default=0, ge=0, description="Max value (0 = unlimited)")
+    startingBalance: Optional[int] = Field(default=0, ge=0, description="Starting balance")
+    maxValue: Optional[int] = Field(default=999999999, ge=0, description="Max value")
     allowNegative: Optional[bool] = Field(default=False, description="Allow negative balance")
     
     # Legacy format fields (optional for backward compatibility)
@@ -41,30 +41,12 @@ class Currency(BaseModel):
     
     @model_validator(mode='after')
     def ensure_required_fields(self):
-        """Ensure we have either new or legacy field values"""
-        # Handle name/displayName
+        """
+        Ensure we have a name in either format. Both formats are stored as
+        given: the export reads the new fields only, as it always has.
+        """
         if not self.name and not self.displayName:
             raise ValueError('Either name or displayName is required')
-        if not self.name:
-            self.name = self.displayName
-        if not self.displayName:
-            self.displayName = self.name
-            
-        # Handle starting_amount/startingBalance
-        if self.starting_amount is None and self.startingBalance is None:
-            self.starting_amount = 0
-            self.startingBalance = 0
-        elif self.starting_amount is None:
-            self.starting_amount = self.startingBalance
-        elif self.startingBalance is None:
-            self.startingBalance = self.starting_amount
-            
-        # Handle icon_url/iconPath
-        if not self.icon_url and self.iconPath:
-            self.icon_url = self.iconPath
-        if not self.iconPath and self.icon_url:
-            self.iconPath = self.icon_url
-            
         return self
     
 
@@ -81,7 +63,7 @@ class InventoryItem(BaseModel):
     iconPath: Optional[str] = Field(default="", description="Icon path in assets")
     startingQuantity: int = Field(default=0, ge=0, description="Starting quantity")
     isStackable: bool = Field(default=True, description="Whether item can stack")
-    maxStackSize: int = Field(default=0, ge=0, description="Max stack size (0 = unlimited)")
+    maxStackSize: int = Field(default=999, ge=0, description="Max stack size")
     
 
 
@@ -1,11 +1,11 @@
-from typing import Optional
+from typing import Optional, Union
 from pydantic import BaseModel, Field
 
 
 class Vector2(BaseModel):
     """2D Vector for coordinate pairs"""
-    x: float = Field(..., description="X coordinate")
-    y: float = Field(..., description="Y coordinate")
+    x: Union[int, float] = Field(..., description="X coordinate")
+    y: Union[int, float] = Field(..., description="Y coordinate")
     
 
 
@@ -42,10 +42,10 @@ class GridView(BaseModel):
 class HolderView(BaseModel):
     """Holder view configuration"""
     slotSize: Vector2 = Field(..., description="Size of slots")
-    slotSpace: float = Field(..., ge=0, description="Space between slots")
-    ratioBetweenTwoTile: float = Field(..., ge=0, description="Ratio between two tiles")
-    slotYPadding: float = Field(..., ge=0, description="Slot Y padding")
-    tileInHolderYPadding: float = Field(..., ge=0, description="Tile in holder Y padding")
+    slotSpace: Union[int, float] = Field(..., ge=0, description="Space between slots")
+    ratioBetweenTwoTile: Union[int, float] = Field(..., ge=0, description="Ratio between two tiles")
+    slotYPadding: Union[int, float] = Field(..., ge=0, description="Slot Y padding")
+    tileInHolderYPadding: Union[int, float] = Field(..., ge=0, description="Tile in holder Y padding")
     
 
 
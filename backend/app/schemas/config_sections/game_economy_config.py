@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+
+
+class GameEconomyConfig(BaseModel):
+    """Coin costs and rewards of core game actions"""
+    revive_coin_cost: int = Field(default=0, ge=0, description="Coins spent to revive")
+    ad_level_complete_coin_reward: int = Field(default=0, ge=0, description="Coins for watching an ad on level complete")
+    scenery_complete_coin_reward: int = Field(default=0, ge=0, description="Coins for completing a scenery")
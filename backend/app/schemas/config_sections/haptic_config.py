@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Union
 
 
 class AndroidHaptic(BaseModel):
@@ -11,9 +11,9 @@ class AndroidHaptic(BaseModel):
 
 class IOSHaptic(BaseModel):
     """iOS-specific haptic settings"""
-    intensity: float = Field(..., ge=0, le=1, description="Intensity (0.0-1.0)")
-    sharpness: float = Field(..., ge=0, le=1, description="Sharpness (0.0-1.0)")
-    duration: float = Field(..., ge=0, description="Duration in seconds")
+    intensity: Union[int, float] = Field(..., ge=0, le=1, description="Intensity (0.0-1.0)")
+    sharpness: Union[int, float] = Field(..., ge=0, le=1, description="Sharpness (0.0-1.0)")
+    duration: Union[int, float] = Field(..., ge=0, description="Duration in seconds")
     
 
 
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+
+class HintOfferConfig(BaseModel):
+    """Hint offer popup configuration"""
+    enabled: bool = Field(default=False, description="Whether the hint offer is enabled")
+    duration: int = Field(default=0, ge=0, description="Offer duration in seconds")
+    delay_before_countdown: int = Field(default=0, ge=0, description="Delay before the countdown starts in seconds")
+    min_level: int = Field(default=0, ge=0, description="Minimum level to show the offer")
+    idle_time_trigger: int = Field(default=0, ge=0, description="Idle seconds that trigger the offer")
+    max_appearances_per_level: int = Field(default=0, ge=0, description="Maximum offers per level")
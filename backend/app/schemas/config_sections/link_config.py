@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class LinkConfig(BaseModel):
+    """Privacy and terms links"""
+    privacy_link: str = Field(default="", description="Privacy policy URL")
+    terms_link: str = Field(default="", description="Terms of service URL")
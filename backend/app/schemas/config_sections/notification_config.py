@@ -47,7 +47,7 @@ class NotificationStrategy(BaseModel):
     repeatPolicy: RepeatPolicy = Field(..., description="Repeat policy")
     repeatSeconds: int = Field(default=0, ge=0, description="Repeat interval in seconds")
     active: bool = Field(default=True, description="Whether strategy is active")
-    autoScheduled: bool = Field(default=True, description="Auto-schedule on trigger")
+    autoScheduled: bool = Field(default=False, description="Auto-schedule on trigger")
     schedulingMode: SchedulingMode = Field(..., description="Random or sequential selection")
     defaultChannelId: str = Field(..., min_length=1, description="Default notification channel")
     notifications: List[NotificationMessage] = Field(min_length=1, description="List of notification messages")
@@ -60,13 +60,13 @@ class NotificationChannel(BaseModel):
     id: str = Field(..., min_length=1, description="Channel identifier")
     name: str = Field(..., min_length=1, description="Channel name")
     description: str = Field(default="", description="Channel description")
-    defaultBadge: int = Field(default=1, ge=0, description="Default badge count")
+    defaultBadge: int = Field(default=0, ge=0, description="Default badge count")
     importance: int = Field(default=3, ge=0, le=5, description="Channel importance (0-5)")
     enableLights: bool = Field(default=True, description="Enable notification lights")
     enableVibration: bool = Field(default=True, description="Enable vibration")
     canBypassDnd: bool = Field(default=False, description="Can bypass Do Not Disturb")
     canShowBadge: bool = Field(default=True, description="Can show badge")
-    lockScreenVisibility: int = Field(default=0, ge=-1, le=1, description="Lock screen visibility")
+    lockScreenVisibility: int = Field(default=1, ge=-1, le=1, description="Lock screen visibility")
 
 
 class NotificationConfig(BaseModel):
@@ -0,0 +1,11 @@
+from typing import Union
+from pydantic import BaseModel, Field
+
+
+class RatingConfig(BaseModel):
+    """In-app rating prompt configuration"""
+    enabled: bool = Field(default=False, description="Whether the rating prompt is enabled")
+    min_star_required: int = Field(default=0, ge=0, le=5, description="Stars required to open the store page")
+    interval_hours: Union[int, float] = Field(default=0, ge=0, description="Hours between prompts")
+    min_levels: int = Field(default=0, ge=0, description="Levels to complete before the first prompt")
+    max_show_count: int = Field(default=0, ge=0, description="Maximum number of prompts")
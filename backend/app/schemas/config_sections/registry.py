@@ -0,0 +1,107 @@
+"""
+Schema registry - config_data validation per section type.
+
+Payloads are validated and normalized once, when a version is written: the
+stored config_data is the schema's canonical JSON dump (defaults filled in,
+enums as values, legacy fields reconciled), so exports can map fields
+directly. Sections without a schema are stored as sent.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.models.section_config import SectionType
+from app.schemas.config_sections.ad_config import AdConfig
+from app.schemas.config_sections.analytics_config import AnalyticsConfig
+from app.schemas.config_sections.booster_config import BoosterConfig
+from app.schemas.config_sections.chapter_reward_config import ChapterRewardConfig
+from app.schemas.config_sections.economy_config import EconomyConfig
+from app.schemas.config_sections.game_config import GameConfig
+from app.schemas.config_sections.game_economy_config import GameEconomyConfig
+from app.schemas.config_sections.haptic_config import HapticConfig
+from app.schemas.config_sections.hint_offer_config import HintOfferConfig
+from app.schemas.config_sections.link_config import LinkConfig
+from app.schemas.config_sections.notification_config import NotificationConfig
+from app.schemas.config_sections.rating_config import RatingConfig
+from app.schemas.config_sections.remove_ads_config import RemoveAdsConfig
+from app.schemas.config_sections.shop_settings_config import ShopSettingsConfig
+from app.schemas.config_sections.spin_config import SpinConfig
+from app.schemas.config_sections.tile_bundle_config import TileBundleConfig
+from app.schemas.config_sections.tutorial_config import TutorialConfig
+from app.utils.canonical_json import canonical_json
+from app.utils.unity_export import content_hash
+
+# Schema of each section's config_data.
+# shop and ux have no Unity export and are stored unvalidated.
+SECTION_SCHEMAS: Dict[SectionType, Type[BaseModel]] = {
+    SectionType.ECONOMY: EconomyConfig,
+    SectionType.ADS: AdConfig,
+    SectionType.NOTIFICATION: NotificationConfig,
+    SectionType.BOOSTER: BoosterConfig,
+    SectionType.CHAPTER_REWARD: ChapterRewardConfig,
+    SectionType.GAME: GameConfig,
+    SectionType.ANALYTICS: AnalyticsConfig,
+    SectionType.HAPTIC: HapticConfig,
+    SectionType.REMOVE_ADS: RemoveAdsConfig,
+    SectionType.TILE_BUNDLE: TileBundleConfig,
+    SectionType.RATING: RatingConfig,
+    SectionType.LINK: LinkConfig,
+    SectionType.GAME_ECONOMY: GameEconomyConfig,
+    SectionType.SHOP_SETTINGS: ShopSettingsConfig,
+    SectionType.SPIN: SpinConfig,
+    SectionType.HINT_OFFER: HintOfferConfig,
+    SectionType.TUTORIAL: TutorialConfig,
+}
+
+
+@lru_cache(maxsize=None)
+def get_adapter(section_type: SectionType) -> Optional[TypeAdapter]:
+    """Compiled validator of a section's config_data, built once per process"""
+    schema = SECTION_SCHEMAS.get(SectionType(section_type))
+    return TypeAdapter(schema) if schema is not None else None
+
+
+@lru_cache(maxsize=None)
+def schema_hash(section_type: SectionType) -> Optional[str]:
+    """
+    SHA-256 of a section's JSON schema.
+    Stored with each validated version; a different hash means the payload
+    was normalized by another revision of the schema.
+    """
+    adapter = get_adapter(section_type)
+    if adapter is None:
+        return None
+    return content_hash(canonical_json(adapter.json_schema()))
+
+
+def normalize_config(
+    section_type: Union[SectionType, str],
+    config_data: Any
+) -> Tuple[Any, Optional[str]]:
+    """
+    Validate config_data against its section's schema.
+
+    Returns:
+        The canonical payload and the schema hash it was validated with;
+        the payload unchanged and None for sections without a schema
+
+    Raises:
+        ValidationError: If the payload does not match the schema
+    """
+    section_type = SectionType(section_type)
+    adapter = get_adapter(section_type)
+    if adapter is None or config_data is None:
+        return config_data, None
+
+    model = adapter.validate_python(config_data)
+    return adapter.dump_python(model, mode="json"), schema_hash(section_type)
+
+
+def describe_errors(error: ValidationError) -> str:
+    """One-line summary of validation errors, e.g. for an HTTP error detail"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'config_data'}: {item['msg']}"
+        for item in error.errors(include_url=False)
+    )
@@ -3,7 +3,7 @@ from pydantic import BaseModel, Field
 
 class RemoveAdsConfig(BaseModel):
     """Remove Ads offer configuration"""
-    enabled: bool = Field(default=True, description="Whether the remove ads offer is enabled")
+    enabled: bool = Field(default=False, description="Whether the remove ads offer is enabled")
     minLevel: int = Field(..., ge=1, description="Minimum level to show the offer")
     adWatchedTrigger: int = Field(..., ge=0, description="Number of ads watched to trigger the offer")
     daysPlayedTrigger: int = Field(..., ge=0, description="Days played to trigger the offer")
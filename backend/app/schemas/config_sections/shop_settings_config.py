@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class ShopSettingsConfig(BaseModel):
+    """Shop enable and restore settings"""
+    enabled: bool = Field(default=False, description="Whether the shop is enabled")
+    restore_min_level: int = Field(default=0, ge=0, description="Minimum level to restore purchases")
@@ -0,0 +1,20 @@
+from typing import List, Union
+from pydantic import BaseModel, Field
+
+
+class RewardSlot(BaseModel):
+    """Single reward slot on the spin wheel"""
+    probability: Union[int, float] = Field(default=0, ge=0, le=1, description="Chance of landing on this slot (0-1)")
+    item_id: str = Field(default="", description="Rewarded item or currency ID")
+    amount: int = Field(default=0, ge=0, description="Amount rewarded")
+    upgrade_multiplier: Union[int, float] = Field(default=1, ge=0, description="Multiplier applied when the reward is upgraded")
+
+
+class SpinConfig(BaseModel):
+    """Spin wheel configuration"""
+    enabled: bool = Field(default=False, description="Whether the spin wheel is enabled")
+    min_level: int = Field(default=0, ge=0, description="Minimum level to unlock the spin wheel")
+    free_spin_count: int = Field(default=0, ge=0, description="Free spins per cooldown")
+    ad_spin_count: int = Field(default=0, ge=0, description="Spins unlocked by watching ads")
+    cooldown_hours: Union[int, float] = Field(default=0, ge=0, description="Cooldown between spin refills in hours")
+    reward_slots: List[RewardSlot] = Field(default_factory=list, description="Reward slots on the wheel")
@@ -3,7 +3,7 @@ from pydantic import BaseModel, Field
 
 class TileBundleConfig(BaseModel):
     """Tile Bundle offer configuration"""
-    enabled: bool = Field(default=True, description="Whether the tile bundle offer is enabled")
+    enabled: bool = Field(default=False, description="Whether the tile bundle offer is enabled")
     discount: int = Field(..., ge=0, le=100, description="Discount percentage (0-100)")
     minLevel: int = Field(..., ge=1, description="Minimum level to show the offer")
     daysPlayedTrigger: int = Field(..., ge=0, description="Days played to trigger the offer")
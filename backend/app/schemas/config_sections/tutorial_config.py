@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Any, Tuple
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional, Any, Tuple, Union
 from enum import IntEnum
 
 
@@ -13,16 +13,16 @@ class ETutorialStep(IntEnum):
 
 
 # GridTile is a tuple of [column, -row, skinId]
-GridTile = Tuple[float, float, int]
+GridTile = Tuple[Union[int, float], Union[int, float], int]
 
 
 class ToastModel(BaseModel):
     """Toast message configuration"""
     M: str = Field(..., description="Message key for localization")
-    W: float = Field(..., gt=0, description="Width in world units")
-    H: float = Field(..., gt=0, description="Height in world units")
-    X: float = Field(..., ge=0, le=1, description="X position (0-1 viewport)")
-    Y: float = Field(..., ge=0, le=1, description="Y position (0-1 viewport)")
+    W: Union[int, float] = Field(..., gt=0, description="Width in world units")
+    H: Union[int, float] = Field(..., gt=0, description="Height in world units")
+    X: Union[int, float] = Field(..., ge=0, le=1, description="X position (0-1 viewport)")
+    Y: Union[int, float] = Field(..., ge=0, le=1, description="Y position (0-1 viewport)")
     
 
 
@@ -49,7 +49,7 @@ class LoadBoardData(BaseModel):
     """Data for LoadBoard step type"""
     Level: int = Field(..., ge=1, description="Level number")
     Moves: int = Field(..., ge=0, description="Number of moves allowed")
-    GridTiles: List[List[float]] = Field(default_factory=list, description="Grid tiles as [column, -row, skinId]")
+    GridTiles: List[List[Union[int, float]]] = Field(default_factory=list, description="Grid tiles as [column, -row, skinId]")
     HolderTiles: List[int] = Field(default_factory=list, description="Holder tiles skin IDs")
     
 
@@ -84,6 +84,13 @@ class TutorialStep(BaseModel):
     Data: Any = Field(..., description="Step-specific data")
     Focus: bool = Field(default=False, description="Dim background for focus")
     
+    @model_validator(mode='after')
+    def validate_load_board_data(self):
+        """LoadBoard steps carry a board the game loads as-is, so its data is checked"""
+        if self.Type == ETutorialStep.LOAD_BOARD:
+            self.Data = LoadBoardData.model_validate(self.Data)
+        return self
+    
 
 
 class TutorialLevel(BaseModel):
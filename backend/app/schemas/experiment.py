@@ -0,0 +1,77 @@
+from typing import Dict, List, Optional
+from datetime import datetime
+from pydantic import BaseModel, Field, field_validator
+
+from app.schemas import ORMBaseModel
+from app.utils.bucketing import BUCKET_COUNT
+
+
+class VariantSplit(BaseModel):
+    """Share of an experiment's traffic assigned to one variant"""
+    variant: str = Field(..., min_length=1)
+    weight: int = Field(..., ge=0, le=BUCKET_COUNT, description="Basis points (10000 = 100%)")
+
+
+def _validate_splits(splits: List[VariantSplit]) -> List[VariantSplit]:
+    variants = [split.variant for split in splits]
+    if len(set(variants)) != len(variants):
+        raise ValueError("Variant names must be unique")
+    if sum(split.weight for split in splits) > BUCKET_COUNT:
+        raise ValueError(f"Variant weights must add up to at most {BUCKET_COUNT}")
+    return splits
+
+
+class ExperimentCreate(BaseModel):
+    """Schema for creating an experiment"""
+    game_id: str
+    name: str = Field(..., min_length=1)
+    description: Optional[str] = None
+    splits: List[VariantSplit]
+    is_active: bool = True
+    
+    @field_validator('splits')
+    @classmethod
+    def check_splits(cls, splits: List[VariantSplit]) -> List[VariantSplit]:
+        return _validate_splits(splits)
+
+
+class ExperimentUpdate(BaseModel):
+    """Schema for updating an experiment (name is fixed once versions reference it)"""
+    description: Optional[str] = None
+    splits: Optional[List[VariantSplit]] = None
+    is_active: Optional[bool] = None
+    
+    @field_validator('splits')
+    @classmethod
+    def check_splits(cls, splits: Optional[List[VariantSplit]]) -> Optional[List[VariantSplit]]:
+        return _validate_splits(splits) if splits is not None else splits
+
+
+class ExperimentResponse(ORMBaseModel):
+    """Schema for experiment response"""
+    id: str
+    game_id: str
+    name: str
+    description: Optional[str] = None
+    splits: List[VariantSplit]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class PlayerAssignmentRequest(BaseModel):
+    """Players to assign to experiment variants"""
+    player_ids: List[str] = Field(..., min_length=1, max_length=10000)
+
+
+class PlayerCohort(BaseModel):
+    """Players that share the same variant assignments and therefore the same configs"""
+    assignments: Dict[str, str]
+    versions: Dict[str, str]
+    content_hash: str
+    player_ids: List[str]
+
+
+class PlayerAssignmentResponse(BaseModel):
+    """Players grouped by resolved variant assignments"""
+    cohorts: List[PlayerCohort]
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 from datetime import datetime
 from pydantic import BaseModel
 
@@ -28,7 +28,24 @@ class GameUpdate(BaseModel):
     # app_id cannot be updated after creation
 
 
+class GameClone(BaseModel):
+    """Schema for cloning a game's section configs into a new game"""
+    app_id: str  # App ID of the new game
+    name: Optional[str] = None  # Defaults to the source game's
+    description: Optional[str] = None  # Defaults to the source game's
+    # Versions to copy: every version, the newest of each section, or the published ones
+    versions: Literal["all", "latest", "published"] = "all"
+
+
 class GameResponse(GameBase, ORMBaseModel):
     """Schema for game response - app_id is the primary key"""
     created_at: datetime
     updated_at: datetime
+
+
+class GameArchiveImportResponse(ORMBaseModel):
+    """Counts of an archive import"""
+    game_id: str
+    game_created: bool
+    sections_created: int
+    versions_imported: int
@@ -0,0 +1,60 @@
+from typing import List, Optional
+from datetime import datetime
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas import ORMBaseModel
+from app.models.section_config import SectionType
+
+
+class RetentionPolicyCreate(BaseModel):
+    """Schema for creating a retention policy (section_type null: game-wide default)"""
+    game_id: str
+    section_type: Optional[SectionType] = None
+    keep_last: Optional[int] = Field(None, ge=1, description="Versions to keep per section, newest first")
+    keep_days: Optional[int] = Field(None, ge=0, description="Keep versions created within this many days")
+    keep_experiment_versions: bool = True
+    
+    @model_validator(mode="after")
+    def check_rules(self) -> "RetentionPolicyCreate":
+        if self.keep_last is None and self.keep_days is None:
+            raise ValueError("Set keep_last, keep_days or both")
+        return self
+
+
+class RetentionPolicyUpdate(BaseModel):
+    """Schema for updating a retention policy"""
+    keep_last: Optional[int] = Field(None, ge=1)
+    keep_days: Optional[int] = Field(None, ge=0)
+    keep_experiment_versions: Optional[bool] = None
+
+
+class RetentionPolicyResponse(ORMBaseModel):
+    """Schema for retention policy response"""
+    id: str
+    game_id: str
+    section_type: Optional[SectionType] = None
+    keep_last: Optional[int] = None
+    keep_days: Optional[int] = None
+    keep_experiment_versions: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class SectionPruneReport(BaseModel):
+    """Versions pruned (or, in a dry run, prunable) in one section"""
+    section_config_id: str
+    section_type: SectionType
+    policy_id: str
+    versions: int
+    version_ids: List[str] = Field(default_factory=list, description="Listed in dry runs only")
+
+
+class PruneReport(BaseModel):
+    """Outcome of applying a game's retention policies"""
+    game_id: str
+    dry_run: bool
+    versions: int
+    sections: List[SectionPruneReport]
+    # Unreferenced payloads and exports removed afterwards (not collected in dry runs)
+    blobs: Optional[int] = None
+    exports: Optional[int] = None
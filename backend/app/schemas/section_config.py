@@ -1,6 +1,6 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, Dict, List, Literal
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas import ORMBaseModel
 from app.models.section_config import SectionType
@@ -11,10 +11,24 @@ class SectionConfigResponse(ORMBaseModel):
     id: str
     game_id: str
     section_type: SectionType
+    published_version_id: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
 
+class SectionConfigPublish(BaseModel):
+    """Schema for publishing a version; expected_version_id makes it a compare-and-swap"""
+    version_id: str
+    expected_version_id: Optional[str] = Field(
+        None, description="Currently published version id (null: nothing published); omit to skip the check"
+    )
+
+
+class SectionConfigUnpublish(BaseModel):
+    """Schema for unpublishing; expected_version_id makes it a compare-and-swap"""
+    expected_version_id: Optional[str] = None
+
+
 class SectionConfigVersionCreate(BaseModel):
     """Schema for creating a new version"""
     title: Optional[str] = None
@@ -42,14 +56,51 @@ class SectionConfigVersionResponse(ORMBaseModel):
     experiment: Optional[str] = None
     variant: Optional[str] = None
     config_data: Optional[Any] = None
+    config_hash: Optional[str] = None
+    schema_hash: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
 
+class SectionConfigVersionBulkItem(BaseModel):
+    """One version write of a bulk request: an update if version_id is set, else a create"""
+    section_config_id: str
+    version_id: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    experiment: Optional[str] = None
+    variant: Optional[str] = None
+    config_data: Optional[Any] = None
+
+
+class SectionConfigVersionBulkWrite(BaseModel):
+    """Schema for writing versions of one or more sections of a game at once"""
+    game_id: str
+    items: List[SectionConfigVersionBulkItem] = Field(..., min_length=1, max_length=500)
+
+
+class SectionConfigVersionBulkResult(BaseModel):
+    """Outcome of one bulk item, in request order"""
+    index: int
+    status: Literal["created", "updated", "failed"]
+    status_code: int
+    detail: Optional[str] = None
+    version: Optional[SectionConfigVersionResponse] = None
+
+
+class SectionConfigVersionBulkResponse(BaseModel):
+    """Schema for bulk write results"""
+    results: List[SectionConfigVersionBulkResult]
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+
+
 class SectionConfigVersionListResponse(BaseModel):
     """Schema for list of versions"""
     versions: List[SectionConfigVersionResponse]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class SectionConfigSummary(BaseModel):
@@ -57,3 +108,57 @@ class SectionConfigSummary(BaseModel):
     section_type: SectionType
     version_count: int = 0
     updated_at: Optional[datetime] = None
+
+
+class GameSectionConfigSummary(BaseModel):
+    """Section config summaries for a single game (multi-game dashboard views)"""
+    game_id: str
+    sections: List[SectionConfigSummary]
+
+
+class SectionConfigVersionMatch(BaseModel):
+    """Version matched by a config data search"""
+    id: str
+    section_config_id: str
+    section_type: SectionType
+    title: Optional[str] = None
+    experiment: Optional[str] = None
+    variant: Optional[str] = None
+    updated_at: datetime
+
+
+class JsonPatchOperation(BaseModel):
+    """Single RFC 6902 JSON Patch operation"""
+    model_config = ConfigDict(populate_by_name=True)
+    
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    path: str
+    value: Optional[Any] = None
+    from_: Optional[str] = Field(None, alias="from")
+
+
+class ConfigChange(BaseModel):
+    """Human-readable entry of a version diff"""
+    kind: Literal["added", "removed", "modified", "moved"]
+    path: str
+    old_value: Optional[Any] = None
+    new_value: Optional[Any] = None
+
+
+class SectionConfigVersionDiff(BaseModel):
+    """Structural diff between two versions of a section config"""
+    base_version_id: str
+    version_id: str
+    base_config_hash: Optional[str] = None
+    config_hash: Optional[str] = None
+    identical: bool
+    patch: List[Dict[str, Any]]
+    changes: List[ConfigChange]
+
+
+class ConfigSyncRequest(BaseModel):
+    """Section content hashes a game client already holds"""
+    known: Dict[str, str] = Field(default_factory=dict, description="section_type -> content hash")
+    experiment: Optional[str] = None
+    variant: Optional[str] = None
+    player_id: Optional[str] = None
@@ -4,11 +4,19 @@ from app.services.auth_service import AuthService
 from app.services.user_service import UserService
 from app.services.game_service import GameService
 from app.services.section_config_service import SectionConfigService
+from app.services.delivery_service import DeliveryService
+from app.services.experiment_service import ExperimentService
+from app.services.export_service import ExportService
+from app.services.publish_service import PublishService
 
 __all__ = [
     "AuthService",
     "UserService",
     "GameService",
     "SectionConfigService",
+    "DeliveryService",
+    "ExperimentService",
+    "ExportService",
+    "PublishService",
 ]
 
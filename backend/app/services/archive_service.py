@@ -0,0 +1,385 @@
+"""
+Archive service - streaming export and import of a game's full configuration.
+
+An archive is NDJSON: one JSON object per line, in this order
+
+    {"type": "game", "format": 1, "app_id": ..., "name": ..., "description": ...}
+    {"type": "section", "id": ..., "section_type": ..., "published_version_id": ...}
+    {"type": "version", "id": ..., "section_config_id": ..., "title": ..., "config_data": ...}
+
+with every section line before the first version line. Both directions hold
+at most one batch of rows in memory: versions are read through a
+server-side cursor and written with one multi-row INSERT per batch.
+"""
+
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import Text, cast, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth import can_access_game
+from app.core.principal_cache import Principal
+from app.models.config_blob import ConfigBlob, load_payloads
+from app.models.config_export import ConfigExport
+from app.models.game import Game
+from app.models.section_config import SectionConfig, SectionConfigVersion, SectionType
+from app.schemas.config_sections.registry import describe_errors, normalize_config
+from app.services.delivery_service import config_snapshot_cache
+from app.services.publish_service import publish_if_configured
+from app.services.section_config_service import REFRESH_ON_REUSE, chain_tip, export_row, stage_blob
+from app.utils.db_utils import insert_many_if_absent
+from app.utils.json_response import dumps, embed_json
+
+ARCHIVE_FORMAT = 1
+ARCHIVE_MEDIA_TYPE = "application/x-ndjson"
+
+# Versions fetched per cursor round trip and inserted per statement
+ARCHIVE_BATCH_SIZE = 500
+
+
+@dataclass
+class ArchiveImportResult:
+    """Counts of an archive import"""
+    game_id: str
+    game_created: bool = False
+    sections_created: int = 0
+    versions_imported: int = 0
+
+
+def _timestamp(value: Optional[str]) -> datetime:
+    return datetime.fromisoformat(value) if value else datetime.utcnow()
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into its non-empty lines"""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if pending.strip():
+        yield pending
+
+
+class ArchiveService:
+    """Service for moving a game's section configs and versions between environments"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def open_archive(self, game_id: str, current_user: Principal) -> AsyncIterator[bytes]:
+        """
+        Check access and return the archive of a game as a stream of lines.
+
+        Raises:
+            HTTPException: If the game is missing or inaccessible
+        """
+        if not can_access_game(current_user, game_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have access to this game"
+            )
+
+        game = await self.db.get(Game, game_id)
+        if not game:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+
+        return self._archive_lines(game)
+
+    async def _archive_lines(self, game: Game) -> AsyncIterator[bytes]:
+        yield dumps({
+            "type": "game",
+            "format": ARCHIVE_FORMAT,
+            "app_id": game.app_id,
+            "name": game.name,
+            "description": game.description,
+        }) + b"\n"
+
+        sections = await self.db.execute(
+            select(SectionConfig.id, SectionConfig.section_type, SectionConfig.published_version_id)
+            .where(SectionConfig.game_id == game.app_id)
+            .order_by(SectionConfig.id)
+        )
+        for section_id, section_type, published_version_id in sections.all():
+            yield dumps({
+                "type": "section",
+                "id": section_id,
+                "section_type": SectionType(section_type).value,
+                "published_version_id": published_version_id,
+            }) + b"\n"
+
+        version = SectionConfigVersion
+        rows = await self.db.stream(
+            select(
+                version.id,
+                version.section_config_id,
+                version.title,
+                version.description,
+                version.experiment,
+                version.variant,
+                version.created_at,
+                version.updated_at,
+                version.config_hash,
+                ConfigBlob.base_hash,
+                # Payloads are copied into the archive as stored, without decoding
+                cast(ConfigBlob.data, Text).label("config_json"),
+            )
+            .join(SectionConfig, SectionConfig.id == version.section_config_id)
+            .outerjoin(ConfigBlob, ConfigBlob.hash == version.config_hash)
+            .where(SectionConfig.game_id == game.app_id)
+            .order_by(version.section_config_id, version.created_at, version.id)
+            .execution_options(yield_per=ARCHIVE_BATCH_SIZE)
+        )
+        async for batch in rows.partitions():
+            # Payloads stored as deltas are reconstructed, two queries per batch
+            delta_hashes = {row.config_hash for row in batch if row.base_hash is not None}
+            payloads: Dict[str, bytes] = {}
+            if delta_hashes:
+                result = await self.db.execute(select(ConfigBlob).where(ConfigBlob.hash.in_(delta_hashes)))
+                blobs = result.scalars().all()
+                await load_payloads(self.db, blobs)
+                payloads = {blob.hash: dumps(blob.payload) for blob in blobs}
+
+            for row in batch:
+                if row.base_hash is not None:
+                    config_json = payloads[row.config_hash]
+                elif row.config_json is not None:
+                    config_json = row.config_json.encode("utf-8")
+                else:
+                    config_json = b"null"
+                yield embed_json(
+                    {
+                        "type": "version",
+                        "id": row.id,
+                        "section_config_id": row.section_config_id,
+                        "title": row.title,
+                        "description": row.description,
+                        "experiment": row.experiment,
+                        "variant": row.variant,
+                        "created_at": row.created_at.isoformat(),
+                        "updated_at": row.updated_at.isoformat(),
+                    },
+                    config_data=config_json,
+                ) + b"\n"
+
+    async def import_archive(self, game_id: str, lines: AsyncIterator[bytes]) -> ArchiveImportResult:
+        """
+        Import an archive into a game, creating the game if it does not exist.
+
+        Every version is added under a new id, to the game's existing section
+        of its type or to a new one; config_data is validated like any other
+        version write and its export materialized. A section's published
+        version is carried over unless the target section already has one.
+        The import is a single transaction.
+
+        Raises:
+            HTTPException: 400 for a malformed archive, 422 for invalid config_data
+        """
+        importer = _ArchiveImport(self.db, game_id)
+        try:
+            async for number, line in _numbered(lines):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Line {number}: invalid JSON"
+                    )
+                if not isinstance(record, dict):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Line {number}: expected a JSON object"
+                    )
+                await importer.add(number, record)
+            result = await importer.finish()
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        snapshot = await config_snapshot_cache.refresh(self.db, game_id)
+        await publish_if_configured(snapshot)
+        return result
+
+
+async def _numbered(lines: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, bytes]]:
+    number = 0
+    async for line in lines:
+        number += 1
+        yield number, line
+
+
+class _ArchiveImport:
+    """Import state: section id mapping and the pending batch of rows"""
+
+    def __init__(self, db: AsyncSession, game_id: str):
+        self.db = db
+        self.result = ArchiveImportResult(game_id=game_id)
+        self.game: Optional[Game] = None
+        # archive section id -> (target section id, section type)
+        self.sections: Dict[str, Tuple[str, SectionType]] = {}
+        # archive published version id -> target section id, for sections that take it over
+        self.published: Dict[str, str] = {}
+        self.new_published: Dict[str, str] = {}
+        self.versions: List[Dict[str, Any]] = []
+        self.blobs: Dict[str, ConfigBlob] = {}
+        # target section id -> the blob its next payload may be a delta against
+        self.tips: Dict[str, Optional[ConfigBlob]] = {}
+        self.exports: Dict[str, Dict[str, Any]] = {}
+        self.export_hashes: Dict[Tuple[SectionType, str], Optional[str]] = {}
+
+    def _error(self, number: int, detail: str, status_code: int = status.HTTP_400_BAD_REQUEST) -> HTTPException:
+        return HTTPException(status_code=status_code, detail=f"Line {number}: {detail}")
+
+    async def add(self, number: int, record: Dict[str, Any]) -> None:
+        kind = record.get("type")
+        if self.game is None:
+            if kind != "game" or record.get("format") != ARCHIVE_FORMAT:
+                raise self._error(number, f"expected a format {ARCHIVE_FORMAT} game header")
+            await self._add_game(record)
+        elif kind == "section":
+            await self._add_section(number, record)
+        elif kind == "version":
+            await self._add_version(number, record)
+        else:
+            raise self._error(number, f"unexpected record type {kind!r}")
+
+    async def _add_game(self, record: Dict[str, Any]) -> None:
+        self.game = await self.db.get(Game, self.result.game_id)
+        if self.game is None:
+            self.game = Game(
+                app_id=self.result.game_id,
+                name=record.get("name") or self.result.game_id,
+                description=record.get("description"),
+            )
+            self.db.add(self.game)
+            await self.db.flush()
+            self.result.game_created = True
+
+    async def _add_section(self, number: int, record: Dict[str, Any]) -> None:
+        if self.versions or self.result.versions_imported:
+            raise self._error(number, "section records must precede version records")
+        try:
+            section_type = SectionType(record.get("section_type"))
+        except ValueError:
+            raise self._error(number, f"unknown section type {record.get('section_type')!r}")
+
+        result = await self.db.execute(
+            select(SectionConfig).where(
+                SectionConfig.game_id == self.game.app_id,
+                SectionConfig.section_type == section_type,
+            )
+        )
+        section_config = result.scalar_one_or_none()
+        if section_config is None:
+            section_config = SectionConfig(game_id=self.game.app_id, section_type=section_type)
+            self.db.add(section_config)
+            await self.db.flush()
+            self.result.sections_created += 1
+
+        self.sections[record.get("id")] = (section_config.id, section_type)
+        if record.get("published_version_id") and section_config.published_version_id is None:
+            self.published[record["published_version_id"]] = section_config.id
+
+    async def _add_version(self, number: int, record: Dict[str, Any]) -> None:
+        section = self.sections.get(record.get("section_config_id"))
+        if section is None:
+            raise self._error(number, "version of a section not in the archive")
+        section_config_id, section_type = section
+
+        try:
+            config_data, validated_with = normalize_config(section_type, record.get("config_data"))
+        except ValidationError as e:
+            raise self._error(
+                number,
+                f"Invalid {section_type.value} config: {describe_errors(e)}",
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+
+        config_hash = export_hash = None
+        if config_data is not None:
+            if section_config_id not in self.tips:
+                self.tips[section_config_id] = await chain_tip(self.db, section_config_id)
+            blob = await stage_blob(
+                self.db, ConfigBlob.from_data(config_data), self.tips[section_config_id], self.blobs
+            )
+            self.tips[section_config_id] = blob
+            config_hash = blob.hash
+            key = (section_type, blob.hash)
+            if key not in self.export_hashes:
+                export = export_row(section_config_id, section_type, config_data)
+                self.export_hashes[key] = export["hash"] if export is not None else None
+                if export is not None:
+                    self.exports.setdefault(export["hash"], export)
+            export_hash = self.export_hashes[key]
+
+        version_id = str(uuid.uuid4())
+        if record.get("id") in self.published:
+            self.new_published[self.published.pop(record["id"])] = version_id
+
+        try:
+            created_at = _timestamp(record.get("created_at"))
+            updated_at = _timestamp(record.get("updated_at"))
+        except (TypeError, ValueError):
+            raise self._error(number, "invalid timestamp")
+
+        self.versions.append({
+            "id": version_id,
+            "section_config_id": section_config_id,
+            "title": record.get("title"),
+            "description": record.get("description"),
+            "experiment": record.get("experiment"),
+            "variant": record.get("variant"),
+            "config_hash": config_hash,
+            "schema_hash": validated_with,
+            "export_hash": export_hash,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        })
+        if len(self.versions) >= ARCHIVE_BATCH_SIZE:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """Write the pending batch: blobs, exports, then versions, one multi-row INSERT each"""
+        if not self.versions:
+            return
+        await insert_many_if_absent(
+            self.db, ConfigBlob, [blob.row() for blob in self.blobs.values()], REFRESH_ON_REUSE
+        )
+        await insert_many_if_absent(self.db, ConfigExport, list(self.exports.values()), REFRESH_ON_REUSE)
+        await self.db.execute(insert(SectionConfigVersion).values(self.versions))
+        self.result.versions_imported += len(self.versions)
+        self.versions.clear()
+        self.blobs.clear()
+        self.exports.clear()
+        self.export_hashes.clear()
+
+    async def finish(self) -> ArchiveImportResult:
+        if self.game is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Empty archive"
+            )
+        await self._flush()
+
+        now = datetime.utcnow()
+        target_ids = {section_id for section_id, _ in self.sections.values()}
+        if target_ids:
+            result = await self.db.execute(select(SectionConfig).where(SectionConfig.id.in_(target_ids)))
+            for section_config in result.scalars().all():
+                if section_config.id in self.new_published:
+                    section_config.published_version_id = self.new_published[section_config.id]
+                # New versions change the version list revision
+                section_config.updated_at = now
+        return self.result
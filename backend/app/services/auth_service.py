@@ -5,7 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.auth import create_access_token, verify_password
+from app.core.auth import create_access_token, verify_password_async
 from app.models.user import User
 
 
@@ -37,7 +37,7 @@ class AuthService:
         )
         user = result.scalar_one_or_none()
         
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await verify_password_async(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
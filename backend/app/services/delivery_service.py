@@ -0,0 +1,593 @@
+"""Delivery service - read-only config delivery for game clients"""
+
+import asyncio
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import case, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.config_blob import ConfigBlob, load_payloads
+from app.api.dependencies.auth import can_access_game
+from app.core.config import settings
+from app.core.config_events import ConfigChangeEvent
+from app.core.principal_cache import Principal
+from app.models.config_export import ConfigExport
+from app.models.experiment import Experiment
+from app.models.game import Game
+from app.models.section_config import SectionConfig, SectionConfigVersion, SectionType
+from app.schemas.experiment import PlayerCohort
+from app.utils.bucketing import VariantAllocator
+from app.utils.compression import compress_variants
+from app.utils.unity_export import serialize_unity_export, content_hash
+
+logger = logging.getLogger(__name__)
+
+# (section_type, experiment, variant)
+SnapshotKey = Tuple[str, Optional[str], Optional[str]]
+
+# Sorted (experiment, variant) pairs of a player
+AssignmentKey = Tuple[Tuple[str, str], ...]
+
+
+def normalize_variant_key(value: Optional[str]) -> Optional[str]:
+    """Treat empty experiment/variant strings the same as unset"""
+    return value or None
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    """Serialized Unity export for one (section, experiment, variant) combination"""
+    section_type: str
+    version_id: str
+    experiment: Optional[str]
+    variant: Optional[str]
+    updated_at: datetime
+    data: bytes
+    content_hash: str
+
+
+@dataclass(frozen=True)
+class DeliveryDocument:
+    """Pre-serialized delivery response body and its content hash"""
+    data: bytes
+    content_hash: str
+    _variants: Optional[Dict[str, bytes]] = field(default=None, compare=False, repr=False)
+
+    @property
+    def variants(self) -> Dict[str, bytes]:
+        """
+        Precompressed encodings of data, computed on first use and kept for
+        the lifetime of the document (and so of its snapshot).
+        """
+        if self._variants is None:
+            object.__setattr__(self, "_variants", compress_variants(self.data))
+        return self._variants
+
+    async def load_variants(self) -> Dict[str, bytes]:
+        """variants, compressed in a worker thread so the event loop is not blocked"""
+        if self._variants is None:
+            variants = await asyncio.to_thread(compress_variants, self.data)
+            object.__setattr__(self, "_variants", variants)
+        return self._variants
+
+
+@dataclass
+class GameSnapshot:
+    """
+    Precomputed delivery view of a game's configs.
+
+    Holds the latest version of every (section, experiment, variant)
+    combination as serialized Unity export bytes, and the allocators of the
+    game's active experiments.
+    """
+    game_id: str
+    entries: Dict[SnapshotKey, SnapshotEntry]
+    allocators: List[VariantAllocator] = field(default_factory=list)
+    built_at: datetime = field(default_factory=datetime.utcnow)
+    _documents: Dict[Tuple[Optional[str], Optional[str]], DeliveryDocument] = field(
+        default_factory=dict, repr=False
+    )
+    _player_documents: Dict[AssignmentKey, DeliveryDocument] = field(
+        default_factory=dict, repr=False
+    )
+    _variant_keys: Set[Tuple[Optional[str], Optional[str]]] = field(
+        init=False, default_factory=set, repr=False
+    )
+
+    def __post_init__(self):
+        self._variant_keys = {
+            (experiment, variant) for _, experiment, variant in self.entries
+            if experiment is not None
+        }
+
+    def reflects(self, event: ConfigChangeEvent) -> bool:
+        """Whether the snapshot already serves the version an event wrote"""
+        if event.action in ("deleted", "unpublished") or event.export_hash is None:
+            return False
+        entry = self.entries.get((
+            event.section_type,
+            normalize_variant_key(event.experiment),
+            normalize_variant_key(event.variant),
+        ))
+        return (
+            entry is not None
+            and entry.version_id == event.version_id
+            and entry.content_hash == event.export_hash
+        )
+
+    def resolve(
+        self,
+        experiment: Optional[str] = None,
+        variant: Optional[str] = None
+    ) -> Dict[str, SnapshotEntry]:
+        """
+        Pick one entry per section.
+
+        The exact (experiment, variant) entry wins; sections without one fall
+        back to the baseline version (no experiment, no variant).
+        """
+        experiment = normalize_variant_key(experiment)
+        variant = normalize_variant_key(variant)
+
+        resolved: Dict[str, SnapshotEntry] = {}
+        for (section_type, entry_experiment, entry_variant), entry in self.entries.items():
+            if entry_experiment is None and entry_variant is None:
+                resolved.setdefault(section_type, entry)
+            if (
+                experiment is not None
+                and entry_experiment == experiment
+                and entry_variant == variant
+            ):
+                resolved[section_type] = entry
+        return resolved
+
+    def document(
+        self,
+        experiment: Optional[str] = None,
+        variant: Optional[str] = None
+    ) -> DeliveryDocument:
+        """
+        Delivery document for a variant, serialized once per snapshot.
+
+        Variants the snapshot has no entries for resolve to the baseline, and
+        are served the baseline document instead of getting a cache entry of
+        their own, so arbitrary query strings cannot grow the cache.
+        """
+        key = (normalize_variant_key(experiment), normalize_variant_key(variant))
+        if key not in self._variant_keys:
+            key = (None, None)
+        document = self._documents.get(key)
+        if document is None:
+            header = {"game_id": self.game_id, "experiment": key[0], "variant": key[1]}
+            document = render_delivery_document(header, self.resolve(*key))
+            self._documents[key] = document
+        return document
+
+    def assign(self, player_id: str) -> Dict[str, str]:
+        """Variant of each active experiment the player is enrolled in"""
+        assignments = {}
+        for allocator in self.allocators:
+            variant = allocator.assign(player_id)
+            if variant is not None:
+                assignments[allocator.experiment] = variant
+        return assignments
+
+    def assign_many(self, player_ids: List[str]) -> List[Dict[str, str]]:
+        """Assignments of many players, one experiment at a time"""
+        columns = [
+            (allocator.experiment, allocator.assign_many(player_ids))
+            for allocator in self.allocators
+        ]
+        return [
+            {
+                experiment: variants[index]
+                for experiment, variants in columns
+                if variants[index] is not None
+            }
+            for index in range(len(player_ids))
+        ]
+
+    def resolve_assignments(self, assignments: Dict[str, str]) -> Dict[str, SnapshotEntry]:
+        """
+        Pick one entry per section for a player's assignments.
+
+        Sections start from the baseline; a version of an assigned
+        (experiment, variant) overrides it. When several experiments touch
+        the same section, the first experiment by name wins.
+        """
+        resolved = self.resolve()
+        overridden = set()
+        for experiment in sorted(assignments):
+            variant = assignments[experiment]
+            for (section_type, entry_experiment, entry_variant), entry in self.entries.items():
+                if (
+                    entry_experiment == experiment
+                    and entry_variant == variant
+                    and section_type not in overridden
+                ):
+                    resolved[section_type] = entry
+                    overridden.add(section_type)
+        return resolved
+
+    def player_document(self, assignments: Dict[str, str]) -> DeliveryDocument:
+        """Delivery document for a set of assignments, serialized once per snapshot"""
+        key: AssignmentKey = tuple(sorted(assignments.items()))
+        document = self._player_documents.get(key)
+        if document is None:
+            header = {"game_id": self.game_id, "assignments": dict(key)}
+            document = render_delivery_document(header, self.resolve_assignments(assignments))
+            self._player_documents[key] = document
+        return document
+
+
+def render_delivery_document(
+    header: Dict[str, Any],
+    resolved: Dict[str, SnapshotEntry]
+) -> DeliveryDocument:
+    """
+    Assemble the delivery body around the stored export bytes.
+
+    Section exports are spliced in as-is, so they are never decoded or
+    re-encoded.
+    """
+    sections = sorted(resolved.items())
+    header = json.dumps(
+        {
+            **header,
+            "versions": {name: entry.version_id for name, entry in sections},
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    body = b",".join(
+        json.dumps(name).encode("utf-8") + b":" + entry.data
+        for name, entry in sections
+    )
+    data = header[:-1] + b',"sections":{' + body + b"}}"
+    return DeliveryDocument(data=data, content_hash=content_hash(data))
+
+
+def render_sync_document(
+    header: Dict[str, Any],
+    resolved: Dict[str, SnapshotEntry],
+    known: Dict[str, str]
+) -> bytes:
+    """
+    Assemble a delta sync body.
+
+    hashes lists the current content hash of every section; sections only
+    carries the exports whose hash differs from the client's; removed lists
+    sections the client holds that are no longer delivered.
+    """
+    current = sorted(resolved.items())
+    changed = [(name, entry) for name, entry in current if known.get(name) != entry.content_hash]
+    encoded_header = json.dumps(
+        {
+            **header,
+            "versions": {name: entry.version_id for name, entry in current},
+            "hashes": {name: entry.content_hash for name, entry in current},
+            "removed": sorted(name for name in known if name not in resolved),
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    body = b",".join(
+        json.dumps(name).encode("utf-8") + b":" + entry.data
+        for name, entry in changed
+    )
+    return encoded_header[:-1] + b',"sections":{' + body + b"}}"
+
+
+class ConfigSnapshotCache:
+    """
+    Process-local cache of game snapshots.
+
+    Snapshots are rebuilt by the writer whenever a version changes and loaded
+    on first access otherwise, so delivery reads do not touch the database
+    once a game is warm. Other workers' writes arrive through apply_event;
+    snapshots also expire after ttl_seconds (0 keeps them until invalidated)
+    so changes without an event, or whose notification was lost, are
+    picked up.
+    """
+
+    def __init__(self, ttl_seconds: float = 0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._snapshots: Dict[str, Tuple[float, GameSnapshot]] = {}
+        self._generations: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def get(self, game_id: str) -> Optional[GameSnapshot]:
+        """Return the cached snapshot for a game if present and not expired"""
+        entry = self._snapshots.get(game_id)
+        if entry is None:
+            return None
+
+        expires_at, snapshot = entry
+        if expires_at <= time.monotonic():
+            self._snapshots.pop(game_id, None)
+            return None
+        return snapshot
+
+    def invalidate(self, game_id: str) -> None:
+        """Drop a game's snapshot; in-flight loads will not repopulate it"""
+        self._generations[game_id] = self._generations.get(game_id, 0) + 1
+        self._snapshots.pop(game_id, None)
+
+    def apply_event(self, event: ConfigChangeEvent) -> None:
+        """
+        Drop the snapshot of a game another worker changed, unless it already
+        serves the written version (the writer refreshes its own snapshot).
+        """
+        snapshot = self.get(event.game_id)
+        if snapshot is not None and not snapshot.reflects(event):
+            self.invalidate(event.game_id)
+
+    def clear(self) -> None:
+        """Drop every cached snapshot"""
+        for game_id in list(self._snapshots):
+            self.invalidate(game_id)
+
+    async def load(self, db: AsyncSession, game_id: str) -> GameSnapshot:
+        """Return the cached snapshot, building it once if missing or expired"""
+        snapshot = self.get(game_id)
+        if snapshot is not None:
+            return snapshot
+
+        lock = self._locks.setdefault(game_id, asyncio.Lock())
+        async with lock:
+            snapshot = self.get(game_id)
+            if snapshot is not None:
+                return snapshot
+
+            generation = self._generations.get(game_id, 0)
+            snapshot = await build_game_snapshot(db, game_id)
+            if self._generations.get(game_id, 0) == generation:
+                expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else math.inf
+                self._snapshots[game_id] = (expires_at, snapshot)
+            return snapshot
+
+    async def refresh(self, db: AsyncSession, game_id: str) -> GameSnapshot:
+        """Rebuild a game's snapshot after one of its versions changed"""
+        self.invalidate(game_id)
+        return await self.load(db, game_id)
+
+
+async def build_game_snapshot(db: AsyncSession, game_id: str) -> GameSnapshot:
+    """
+    Load one export per (section, experiment, variant) of a game: the
+    published version for a section's baseline, the latest version otherwise.
+    """
+    is_published = case(
+        (SectionConfigVersion.id == SectionConfig.published_version_id, 1), else_=0
+    )
+    latest = (
+        select(
+            SectionConfigVersion.id.label("version_id"),
+            is_published.label("is_published"),
+            func.row_number().over(
+                partition_by=(
+                    SectionConfigVersion.section_config_id,
+                    SectionConfigVersion.experiment,
+                    SectionConfigVersion.variant,
+                ),
+                order_by=(
+                    is_published.desc(),
+                    SectionConfigVersion.updated_at.desc(),
+                    SectionConfigVersion.id.desc(),
+                ),
+            ).label("rank"),
+        )
+        .join(SectionConfig, SectionConfig.id == SectionConfigVersion.section_config_id)
+        .where(SectionConfig.game_id == game_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            SectionConfig.section_type,
+            SectionConfigVersion.id,
+            SectionConfigVersion.experiment,
+            SectionConfigVersion.variant,
+            SectionConfigVersion.updated_at,
+            latest.c.is_published,
+            SectionConfigVersion.export_hash,
+            ConfigExport.data,
+        )
+        .join(SectionConfigVersion, SectionConfigVersion.section_config_id == SectionConfig.id)
+        .join(latest, latest.c.version_id == SectionConfigVersion.id)
+        .outerjoin(ConfigExport, ConfigExport.hash == SectionConfigVersion.export_hash)
+        .where(latest.c.rank == 1)
+    )
+    rows = result.all()
+
+    # Versions written before exports were precomputed are serialized here
+    missing_ids = [row.id for row in rows if row.data is None]
+    legacy_configs: Dict[str, Any] = {}
+    if missing_ids:
+        legacy_result = await db.execute(
+            select(SectionConfigVersion.id, ConfigBlob)
+            .join(ConfigBlob, ConfigBlob.hash == SectionConfigVersion.config_hash)
+            .where(SectionConfigVersion.id.in_(missing_ids))
+        )
+        legacy_rows = legacy_result.all()
+        await load_payloads(db, [blob for _, blob in legacy_rows])
+        legacy_configs = {version_id: blob.payload for version_id, blob in legacy_rows}
+
+    entries: Dict[SnapshotKey, SnapshotEntry] = {}
+    published_keys = set()
+    for section_type, version_id, experiment, variant, updated_at, published, export_hash, data in rows:
+        section_name = SectionType(section_type).value
+        if data is None:
+            config_data = legacy_configs.get(version_id)
+            if config_data is None:
+                continue
+            try:
+                data = serialize_unity_export(section_name, config_data)
+            except ValueError:
+                logger.warning(
+                    f"Skipping version {version_id} of {section_name} for game {game_id}: "
+                    "config could not be transformed"
+                )
+                continue
+            export_hash = content_hash(data)
+
+        experiment = normalize_variant_key(experiment)
+        variant = normalize_variant_key(variant)
+        key = (section_name, experiment, variant)
+        existing = entries.get(key)
+        # Empty and NULL experiment/variant collapse to the same key
+        if existing is not None and (
+            key in published_keys or (not published and existing.updated_at >= updated_at)
+        ):
+            continue
+        if published:
+            published_keys.add(key)
+        entries[key] = SnapshotEntry(
+            section_type=section_name,
+            version_id=version_id,
+            experiment=experiment,
+            variant=variant,
+            updated_at=updated_at,
+            data=data,
+            content_hash=export_hash,
+        )
+
+    return GameSnapshot(
+        game_id=game_id,
+        entries=entries,
+        allocators=await load_allocators(db, game_id),
+    )
+
+
+async def load_allocators(db: AsyncSession, game_id: str) -> List[VariantAllocator]:
+    """Build bucketing allocators for a game's active experiments, ordered by name"""
+    result = await db.execute(
+        select(Experiment.name, Experiment.splits)
+        .where(Experiment.game_id == game_id, Experiment.is_active.is_(True))
+        .order_by(Experiment.name)
+    )
+    allocators = []
+    for name, splits in result.all():
+        try:
+            allocators.append(VariantAllocator(
+                name, [(split["variant"], split["weight"]) for split in splits or []]
+            ))
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Skipping experiment {name} of game {game_id}: invalid splits")
+    return allocators
+
+
+# Shared per-process snapshot cache
+config_snapshot_cache = ConfigSnapshotCache(ttl_seconds=settings.CONFIG_SNAPSHOT_TTL_SECONDS)
+
+
+class DeliveryService:
+    """Service for delivering transformed configs to game clients"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_snapshot(self, game_id: str) -> GameSnapshot:
+        """
+        Get the delivery snapshot for a game.
+
+        Raises:
+            HTTPException: If the game does not exist
+        """
+        snapshot = config_snapshot_cache.get(game_id)
+        if snapshot is not None:
+            return snapshot
+
+        result = await self.db.execute(
+            select(Game.app_id).where(Game.app_id == game_id)
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+
+        return await config_snapshot_cache.load(self.db, game_id)
+
+    async def get_game_configs(
+        self,
+        game_id: str,
+        experiment: Optional[str] = None,
+        variant: Optional[str] = None
+    ) -> DeliveryDocument:
+        """Get the serialized Unity configs of every section for a game variant"""
+        snapshot = await self.get_snapshot(game_id)
+        return snapshot.document(experiment, variant)
+
+    async def sync_game_configs(
+        self,
+        game_id: str,
+        known: Dict[str, str],
+        experiment: Optional[str] = None,
+        variant: Optional[str] = None,
+        player_id: Optional[str] = None
+    ) -> bytes:
+        """
+        Get only the sections whose content hash differs from what the client holds.
+        With player_id the player's experiment assignments decide the versions.
+        """
+        snapshot = await self.get_snapshot(game_id)
+        if player_id:
+            assignments = snapshot.assign(player_id)
+            header = {"game_id": game_id, "assignments": assignments}
+            resolved = snapshot.resolve_assignments(assignments)
+        else:
+            experiment = normalize_variant_key(experiment)
+            variant = normalize_variant_key(variant)
+            header = {"game_id": game_id, "experiment": experiment, "variant": variant}
+            resolved = snapshot.resolve(experiment, variant)
+        return render_sync_document(header, resolved, known)
+
+    async def get_player_configs(
+        self,
+        game_id: str,
+        player_id: str
+    ) -> Tuple[Dict[str, str], DeliveryDocument]:
+        """Assign a player to the game's experiments and get their configs"""
+        snapshot = await self.get_snapshot(game_id)
+        assignments = snapshot.assign(player_id)
+        return assignments, snapshot.player_document(assignments)
+
+    async def assign_players(
+        self,
+        game_id: str,
+        player_ids: List[str],
+        current_user: Principal
+    ) -> List[PlayerCohort]:
+        """
+        Assign many players at once, grouped into cohorts that share the same
+        assignments and therefore the same resolved versions.
+        """
+        if not can_access_game(current_user, game_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have access to this game"
+            )
+
+        snapshot = await self.get_snapshot(game_id)
+        cohorts: Dict[AssignmentKey, PlayerCohort] = {}
+        for player_id, assignments in zip(player_ids, snapshot.assign_many(player_ids)):
+            key: AssignmentKey = tuple(sorted(assignments.items()))
+            cohort = cohorts.get(key)
+            if cohort is None:
+                resolved = snapshot.resolve_assignments(assignments)
+                cohort = PlayerCohort(
+                    assignments=dict(key),
+                    versions={name: entry.version_id for name, entry in sorted(resolved.items())},
+                    content_hash=snapshot.player_document(assignments).content_hash,
+                    player_ids=[],
+                )
+                cohorts[key] = cohort
+            cohort.player_ids.append(player_id)
+        return list(cohorts.values())
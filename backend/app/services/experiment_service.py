@@ -0,0 +1,131 @@
+"""Experiment service - A/B experiment definitions for server-side bucketing"""
+
+from typing import List
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth import can_access_game
+from app.core.principal_cache import Principal
+from app.models.experiment import Experiment
+from app.models.game import Game
+from app.schemas.experiment import ExperimentCreate, ExperimentUpdate
+from app.services.delivery_service import config_snapshot_cache
+
+
+class ExperimentService:
+    """Service for experiment operations"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    def _verify_game_access(self, game_id: str, current_user: Principal) -> None:
+        """Verify user has access to the game"""
+        if not can_access_game(current_user, game_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have access to this game"
+            )
+    
+    async def _get_experiment(self, experiment_id: str, current_user: Principal) -> Experiment:
+        """Helper to get an accessible experiment or raise 404"""
+        result = await self.db.execute(
+            select(Experiment).where(Experiment.id == experiment_id)
+        )
+        experiment = result.scalar_one_or_none()
+        
+        if not experiment:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Experiment not found"
+            )
+        
+        # Check game access
+        self._verify_game_access(experiment.game_id, current_user)
+        
+        return experiment
+    
+    async def _on_experiments_changed(self, game_id: str) -> None:
+        """Rebuild the game's delivery snapshot so new splits take effect"""
+        await config_snapshot_cache.refresh(self.db, game_id)
+    
+    async def list_experiments(self, game_id: str, current_user: Principal) -> List[Experiment]:
+        """List a game's experiments ordered by name"""
+        # Check game access
+        self._verify_game_access(game_id, current_user)
+        
+        result = await self.db.execute(
+            select(Experiment)
+            .where(Experiment.game_id == game_id)
+            .order_by(Experiment.name)
+        )
+        return list(result.scalars().all())
+    
+    async def create_experiment(
+        self,
+        experiment_data: ExperimentCreate,
+        current_user: Principal
+    ) -> Experiment:
+        """
+        Create an experiment.
+        
+        Raises:
+            HTTPException: If the game does not exist or the name is taken
+        """
+        # Check game access
+        self._verify_game_access(experiment_data.game_id, current_user)
+        
+        game = await self.db.get(Game, experiment_data.game_id)
+        if not game:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+        
+        result = await self.db.execute(
+            select(Experiment.id).where(
+                Experiment.game_id == experiment_data.game_id,
+                Experiment.name == experiment_data.name
+            )
+        )
+        if result.scalar_one_or_none():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Experiment '{experiment_data.name}' already exists for this game"
+            )
+        
+        experiment = Experiment(**experiment_data.model_dump())
+        self.db.add(experiment)
+        await self.db.commit()
+        await self.db.refresh(experiment)
+        await self._on_experiments_changed(experiment.game_id)
+        
+        return experiment
+    
+    async def update_experiment(
+        self,
+        experiment_id: str,
+        update_data: ExperimentUpdate,
+        current_user: Principal
+    ) -> Experiment:
+        """Update an experiment's description, splits or active flag"""
+        experiment = await self._get_experiment(experiment_id, current_user)
+        
+        for field, value in update_data.model_dump(exclude_unset=True).items():
+            setattr(experiment, field, value)
+        
+        await self.db.commit()
+        await self.db.refresh(experiment)
+        await self._on_experiments_changed(experiment.game_id)
+        
+        return experiment
+    
+    async def delete_experiment(self, experiment_id: str, current_user: Principal) -> None:
+        """Delete an experiment; its players fall back to baseline configs"""
+        experiment = await self._get_experiment(experiment_id, current_user)
+        game_id = experiment.game_id
+        
+        await self.db.delete(experiment)
+        await self.db.commit()
+        await self._on_experiments_changed(game_id)
@@ -0,0 +1,210 @@
+"""Export service - game-level bundles of every section's Unity export"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, case, false, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth import can_access_game
+from app.core.principal_cache import Principal
+from app.models.config_blob import ConfigBlob, load_payloads
+from app.models.config_export import ConfigExport
+from app.models.game import Game
+from app.models.section_config import SectionConfig, SectionConfigVersion, SectionType
+from app.services.delivery_service import normalize_variant_key
+from app.utils.unity_export import serialize_unity_export, content_hash
+
+logger = logging.getLogger(__name__)
+
+# Sections whose transforms are expensive enough to run on a worker thread
+HEAVY_SECTIONS = frozenset({SectionType.TUTORIAL.value, SectionType.ECONOMY.value})
+
+
+@dataclass(frozen=True)
+class BundleSection:
+    """Unity export of the version chosen for one section"""
+    section_type: str
+    version_id: str
+    data: bytes
+    content_hash: str
+
+
+@dataclass(frozen=True)
+class GameBundle:
+    """Serialized bundle document and its content hash"""
+    data: bytes
+    content_hash: str
+    sections: List[BundleSection]
+
+
+async def serialize_section(section_type: str, config_data: Any) -> Optional[bytes]:
+    """
+    Serialize a section's Unity export, off the event loop for heavy sections.
+    Returns None if the config cannot be transformed.
+    """
+    try:
+        if section_type in HEAVY_SECTIONS:
+            return await asyncio.to_thread(serialize_unity_export, section_type, config_data)
+        return serialize_unity_export(section_type, config_data)
+    except ValueError:
+        logger.warning(f"Leaving {section_type} out of bundle: config cannot be transformed")
+        return None
+
+
+def render_bundle(header: Dict[str, Any], sections: List[BundleSection]) -> GameBundle:
+    """
+    Assemble the bundle around the export bytes.
+    The manifest lists the version and content hash of every section.
+    """
+    sections = sorted(sections, key=lambda section: section.section_type)
+    encoded_header = json.dumps(
+        {
+            **header,
+            "manifest": {
+                section.section_type: {
+                    "version_id": section.version_id,
+                    "hash": section.content_hash,
+                    "size": len(section.data),
+                }
+                for section in sections
+            },
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    body = b",".join(
+        json.dumps(section.section_type).encode("utf-8") + b":" + section.data
+        for section in sections
+    )
+    data = encoded_header[:-1] + b',"sections":{' + body + b"}}"
+    return GameBundle(data=data, content_hash=content_hash(data), sections=sections)
+
+
+class ExportService:
+    """Service for exporting a game's configs as one bundle"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def build_bundle(
+        self,
+        game_id: str,
+        current_user: Principal,
+        experiment: Optional[str] = None,
+        variant: Optional[str] = None,
+        version_ids: Optional[List[str]] = None
+    ) -> GameBundle:
+        """
+        Build the Unity export bundle of every section of a game.
+
+        Each section uses, in order of preference: a version listed in
+        version_ids, the latest version of (experiment, variant), the published
+        version, the latest baseline version. The versions are chosen and their stored exports
+        loaded in a single query; only versions without a stored export are
+        transformed, concurrently.
+
+        Raises:
+            HTTPException: If the game is missing or inaccessible, or
+                version_ids are not versions of this game (one per section)
+        """
+        if not can_access_game(current_user, game_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have access to this game"
+            )
+
+        game = await self.db.get(Game, game_id)
+        if not game:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+
+        experiment = normalize_variant_key(experiment)
+        variant = normalize_variant_key(variant)
+        version_ids = list(dict.fromkeys(version_ids or []))
+
+        version = SectionConfigVersion
+        is_baseline = and_(
+            or_(version.experiment.is_(None), version.experiment == ""),
+            or_(version.variant.is_(None), version.variant == ""),
+        )
+        is_variant = (
+            and_(version.experiment == experiment, func.coalesce(version.variant, "") == (variant or ""))
+            if experiment is not None else false()
+        )
+        is_chosen = version.id.in_(version_ids) if version_ids else false()
+        priority = case((is_chosen, 0), (is_variant, 1), else_=2)
+
+        ranked = (
+            select(
+                version.id.label("version_id"),
+                priority.label("priority"),
+                func.row_number().over(
+                    partition_by=version.section_config_id,
+                    order_by=(
+                        priority,
+                        case((version.id == SectionConfig.published_version_id, 0), else_=1),
+                        version.updated_at.desc(),
+                        version.id.desc(),
+                    ),
+                ).label("rank"),
+            )
+            .join(SectionConfig, SectionConfig.id == version.section_config_id)
+            .where(SectionConfig.game_id == game_id)
+            .where(or_(is_chosen, is_variant, is_baseline))
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(
+                SectionConfig.section_type,
+                version.id,
+                ranked.c.priority,
+                version.export_hash,
+                ConfigExport.data,
+                ConfigBlob,
+            )
+            .join(version, version.section_config_id == SectionConfig.id)
+            .join(ranked, ranked.c.version_id == version.id)
+            .outerjoin(ConfigExport, ConfigExport.hash == version.export_hash)
+            # Payloads are only needed where no export is stored
+            .outerjoin(
+                ConfigBlob,
+                and_(ConfigBlob.hash == version.config_hash, ConfigExport.hash.is_(None)),
+            )
+            .where(ranked.c.rank == 1)
+        )
+        rows = result.all()
+
+        chosen = {row.id for row in rows if row.priority == 0}
+        if chosen != set(version_ids):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="version_ids must be versions of this game, at most one per section"
+            )
+
+        await load_payloads(self.db, [row[-1] for row in rows])
+        sections: List[BundleSection] = []
+        pending = []
+        for section_type, version_id, _, export_hash, data, blob in rows:
+            section_name = SectionType(section_type).value
+            if data is not None:
+                sections.append(BundleSection(section_name, version_id, data, export_hash))
+            elif blob is not None:
+                pending.append((section_name, version_id, blob.payload))
+
+        serialized = await asyncio.gather(*(
+            serialize_section(section_name, config_data)
+            for section_name, _, config_data in pending
+        ))
+        for (section_name, version_id, _), data in zip(pending, serialized):
+            if data is not None:
+                sections.append(BundleSection(section_name, version_id, data, content_hash(data)))
+
+        header = {"game_id": game_id, "experiment": experiment, "variant": variant}
+        return render_bundle(header, sections)
@@ -1,15 +1,23 @@
 """Game service - business logic for game operations"""
 
+import uuid
+from datetime import datetime
 from typing import List, Optional
 
 from fastapi import HTTPException, status, UploadFile
-from sqlalchemy import select
+from sqlalchemy import DateTime, String, exists, insert, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.api.dependencies.auth import can_access_game
 from app.models.game import Game
-from app.models.user import User, UserRole
-from app.schemas.game import GameUpdate
+from app.core.principal_cache import Principal, principal_cache
+from app.models.section_config import SectionConfig, SectionConfigVersion
+from app.models.user import UserRole
+from app.schemas.game import GameClone, GameUpdate
+from app.services.delivery_service import config_snapshot_cache
+from app.services.publish_service import unpublish_if_configured
+from app.utils.db_utils import derived_id
 from app.utils.file_utils import save_logo
 
 
@@ -21,7 +29,7 @@ class GameService:
     
     async def list_games(
         self, 
-        current_user: User, 
+        current_user: Principal, 
         skip: int = 0, 
         limit: int = 100
     ) -> List[Game]:
@@ -41,7 +49,7 @@ class GameService:
             return list(result.scalars().all())
         else:
             # Game operator sees only assigned games
-            assigned_app_ids = [game.app_id for game in current_user.assigned_games]
+            assigned_app_ids = list(current_user.assigned_game_ids)
             if not assigned_app_ids:
                 return []
             
@@ -54,7 +62,7 @@ class GameService:
             )
             return list(result.scalars().all())
     
-    async def get_game(self, app_id: str, current_user: User) -> Game:
+    async def get_game(self, app_id: str, current_user: Principal) -> Game:
         """
         Get a game by app_id with access check.
         
@@ -123,11 +131,124 @@ class GameService:
         
         return game
     
+    async def clone_game(self, source_app_id: str, clone: GameClone) -> Game:
+        """
+        Create a new game with copies of a game's section configs and versions.
+        
+        Sections and versions are copied with INSERT ... SELECT statements and
+        the published pointers remapped with one UPDATE, so no config rows
+        pass through the application; new ids are derived from the source ids
+        in SQL. Copies reference the same content-addressed payloads and
+        exports. clone.versions limits the copy to the newest version of each
+        section or to the published versions; sections are always copied.
+        
+        Raises:
+            HTTPException: If the source game is missing or the new app_id exists
+        """
+        source = await self.db.get(Game, source_app_id)
+        if not source:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+        
+        if await self.db.get(Game, clone.app_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Game with app_id '{clone.app_id}' already exists"
+            )
+        
+        fields = clone.model_dump(exclude_unset=True)
+        game = Game(
+            app_id=clone.app_id,
+            name=clone.name or source.name,
+            description=fields["description"] if "description" in fields else source.description,
+            logo_url=source.logo_url,
+        )
+        self.db.add(game)
+        await self.db.flush()
+        
+        salt = uuid.uuid4().hex
+        now = literal(datetime.utcnow(), DateTime)
+        section = SectionConfig
+        version = SectionConfigVersion
+        
+        await self.db.execute(
+            insert(section).from_select(
+                ["id", "game_id", "section_type", "created_at", "updated_at"],
+                select(
+                    derived_id(self.db, salt, section.id),
+                    literal(clone.app_id, String),
+                    section.section_type,
+                    now,
+                    now,
+                ).where(section.game_id == source_app_id),
+            )
+        )
+        
+        versions = (
+            select(
+                derived_id(self.db, salt, version.id),
+                derived_id(self.db, salt, version.section_config_id),
+                version.title,
+                version.description,
+                version.experiment,
+                version.variant,
+                version.config_hash,
+                version.schema_hash,
+                version.export_hash,
+                version.created_at,
+                now,
+            )
+            .join(section, section.id == version.section_config_id)
+            .where(section.game_id == source_app_id)
+        )
+        if clone.versions == "published":
+            versions = versions.where(version.id == section.published_version_id)
+        elif clone.versions == "latest":
+            newer = aliased(version)
+            versions = versions.where(~exists().where(
+                newer.section_config_id == version.section_config_id,
+                tuple_(newer.created_at, newer.id) > tuple_(version.created_at, version.id),
+            ))
+        await self.db.execute(
+            insert(version).from_select(
+                [
+                    "id", "section_config_id", "title", "description", "experiment", "variant",
+                    "config_hash", "schema_hash", "export_hash", "created_at", "updated_at",
+                ],
+                versions,
+            )
+        )
+        
+        # Point each copied section at the copy of its source's published version, if copied
+        source_section = aliased(section)
+        copied = aliased(version)
+        await self.db.execute(
+            update(section)
+            .where(section.game_id == clone.app_id)
+            .values(published_version_id=(
+                select(copied.id)
+                .join(source_section, copied.id == derived_id(self.db, salt, source_section.published_version_id))
+                .where(
+                    source_section.game_id == source_app_id,
+                    source_section.section_type == section.section_type,
+                )
+                .scalar_subquery()
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        
+        await self.db.commit()
+        await self.db.refresh(game)
+        
+        return game
+    
     async def update_game(
         self, 
         app_id: str, 
         update_data: GameUpdate, 
-        current_user: User
+        current_user: Principal
     ) -> Game:
         """
         Update a game with access check.
@@ -183,8 +304,12 @@ class GameService:
         
         await self.db.delete(game)
         await self.db.commit()
+        config_snapshot_cache.invalidate(app_id)
+        unpublish_if_configured(app_id)
+        # Assignments to the deleted game are gone for every cached user
+        principal_cache.clear()
     
-    def verify_game_access(self, game_id: str, current_user: User) -> None:
+    def verify_game_access(self, game_id: str, current_user: Principal) -> None:
         """
         Verify user has access to the game.
         
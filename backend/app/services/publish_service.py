@@ -0,0 +1,296 @@
+"""
+Static publish service - immutable, content-hashed config files for nginx/CDN.
+
+Each game is written to {root}/{app_id}/ as:
+
+    {section}.{sha256}.json        Unity export of one section version
+    configs.{sha256}.json          full delivery document (as GET /delivery/{app_id}/configs)
+    *.json.gz / *.json.br          precompressed variants for gzip_static / brotli_static
+    latest.json                    manifest naming the current files
+
+Hashed files never change once written, so they can be cached forever.
+latest.json is replaced with an atomic rename, so readers see either the
+previous manifest or the new one, never a partial write.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth import can_access_game
+from app.core.config import settings
+from app.core.principal_cache import Principal
+from app.models.game import Game
+from app.services.delivery_service import (
+    DeliveryDocument,
+    GameSnapshot,
+    SnapshotEntry,
+    config_snapshot_cache,
+)
+from app.utils.compression import BROTLI, GZIP, compress_variants
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "latest.json"
+DOCUMENT_NAME = "configs"
+
+# File suffix of each precompressed variant (nginx gzip_static / brotli_static)
+VARIANT_SUFFIXES = {GZIP: ".gz", BROTLI: ".br"}
+
+
+@dataclass
+class PublishResult:
+    """Outcome of publishing one game"""
+    game_id: str
+    manifest_path: str
+    written: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+
+def game_directory(root: str, game_id: str) -> Path:
+    """Directory of a game's published files; rejects ids that are not a single path segment"""
+    if not game_id or game_id in (".", "..") or Path(game_id).name != game_id or "\\" in game_id:
+        raise ValueError(f"Cannot publish game id {game_id!r} as a directory name")
+    return Path(root) / game_id
+
+
+def hashed_name(name: str, content_hash: str) -> str:
+    """Immutable file name for content"""
+    return f"{name}.{content_hash}.json"
+
+
+def _fsync_directory(directory: Path) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # pragma: no cover - e.g. Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write a file through a temporary sibling and an atomic rename"""
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def write_immutable(
+    directory: Path,
+    name: str,
+    data: bytes,
+    written: List[str],
+    variants: Optional[Dict[str, bytes]] = None
+) -> Set[str]:
+    """
+    Write content-hashed bytes and their precompressed variants unless they
+    already exist. Returns every file name that belongs to the content.
+    """
+    path = directory / name
+    if path.exists():
+        # Variants are written first, so the main file marks a complete set
+        return {name} | {
+            name + suffix
+            for suffix in VARIANT_SUFFIXES.values()
+            if (directory / (name + suffix)).exists()
+        }
+
+    if variants is None:
+        variants = compress_variants(data)
+    names = {name}
+    for encoding, encoded in variants.items():
+        variant_name = name + VARIANT_SUFFIXES[encoding]
+        write_atomic(directory / variant_name, encoded)
+        written.append(variant_name)
+        names.add(variant_name)
+    write_atomic(path, data)
+    written.append(name)
+    return names
+
+
+def _read_manifest_files(directory: Path) -> Set[str]:
+    """Files referenced by the currently published manifest"""
+    try:
+        manifest = json.loads((directory / MANIFEST_NAME).read_bytes())
+    except (OSError, ValueError):
+        return set()
+    return set(manifest.get("files", []))
+
+
+def publish_snapshot(snapshot: GameSnapshot, root: str) -> PublishResult:
+    """
+    Write a game's snapshot as static files and swap in a new manifest.
+
+    The baseline and every (experiment, variant) of the snapshot are
+    published; player-level bucketing stays on the delivery API. Files that
+    neither the new nor the previous manifest reference are removed, so
+    clients holding the previous manifest can still fetch its files.
+    """
+    directory = game_directory(root, snapshot.game_id)
+    directory.mkdir(parents=True, exist_ok=True)
+    result = PublishResult(game_id=snapshot.game_id, manifest_path=str(directory / MANIFEST_NAME))
+    files: Set[str] = set()
+
+    def publish_entry(entry: SnapshotEntry) -> Dict[str, Any]:
+        name = hashed_name(entry.section_type, entry.content_hash)
+        files.update(write_immutable(directory, name, entry.data, result.written))
+        return {
+            "file": name,
+            "hash": entry.content_hash,
+            "version_id": entry.version_id,
+            "size": len(entry.data),
+        }
+
+    def publish_document(document: DeliveryDocument) -> Dict[str, Any]:
+        name = hashed_name(DOCUMENT_NAME, document.content_hash)
+        files.update(write_immutable(
+            directory, name, document.data, result.written, document.variants
+        ))
+        return {"file": name, "hash": document.content_hash, "size": len(document.data)}
+
+    variants = sorted({
+        (experiment, variant)
+        for (_, experiment, variant) in snapshot.entries
+        if experiment is not None or variant is not None
+    }, key=lambda key: (key[0] or "", key[1] or ""))
+
+    manifest = {
+        "game_id": snapshot.game_id,
+        "published_at": datetime.utcnow().isoformat(),
+        "document": publish_document(snapshot.document()),
+        "sections": {
+            name: publish_entry(entry)
+            for name, entry in sorted(snapshot.resolve().items())
+        },
+        "variants": [
+            {
+                "experiment": experiment,
+                "variant": variant,
+                "document": publish_document(snapshot.document(experiment, variant)),
+                "sections": {
+                    name: publish_entry(entry)
+                    for name, entry in sorted(snapshot.resolve(experiment, variant).items())
+                },
+            }
+            for experiment, variant in variants
+        ],
+    }
+    manifest["files"] = sorted(files)
+
+    keep = files | _read_manifest_files(directory) | {MANIFEST_NAME}
+    write_atomic(
+        directory / MANIFEST_NAME,
+        json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+    )
+    _fsync_directory(directory)
+
+    for path in directory.iterdir():
+        if path.is_file() and path.name not in keep and not path.name.startswith("."):
+            path.unlink()
+            result.removed.append(path.name)
+
+    return result
+
+
+def unpublish_game(root: str, game_id: str) -> bool:
+    """
+    Withdraw a game by removing its manifest.
+    Hashed files are left for the next publish or manual cleanup.
+    """
+    path = game_directory(root, game_id) / MANIFEST_NAME
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+async def publish_if_configured(snapshot: GameSnapshot) -> Optional[PublishResult]:
+    """Publish a freshly rebuilt snapshot when STATIC_PUBLISH_DIR is set"""
+    if not settings.STATIC_PUBLISH_DIR:
+        return None
+    try:
+        return await asyncio.to_thread(publish_snapshot, snapshot, settings.STATIC_PUBLISH_DIR)
+    except (OSError, ValueError):
+        # The database write already succeeded; the next publish catches up
+        logger.exception(f"Static publish of game {snapshot.game_id} failed")
+        return None
+
+
+def unpublish_if_configured(game_id: str) -> None:
+    """Withdraw a deleted game's manifest when STATIC_PUBLISH_DIR is set"""
+    if not settings.STATIC_PUBLISH_DIR:
+        return
+    try:
+        unpublish_game(settings.STATIC_PUBLISH_DIR, game_id)
+    except (OSError, ValueError):
+        logger.exception(f"Static unpublish of game {game_id} failed")
+
+
+class PublishService:
+    """Service for publishing game configs as static files"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def publish_game(
+        self,
+        game_id: str,
+        root: str,
+        current_user: Optional[Principal] = None
+    ) -> PublishResult:
+        """
+        Publish one game from a freshly built snapshot.
+
+        Raises:
+            HTTPException: If the game is missing or inaccessible
+        """
+        if current_user is not None and not can_access_game(current_user, game_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have access to this game"
+            )
+
+        game = await self.db.get(Game, game_id)
+        if not game:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+
+        snapshot = await config_snapshot_cache.refresh(self.db, game_id)
+        return await asyncio.to_thread(publish_snapshot, snapshot, root)
+
+    async def publish_games(
+        self,
+        root: str,
+        game_ids: Optional[Iterable[str]] = None
+    ) -> List[PublishResult]:
+        """Publish the given games, or every game"""
+        if game_ids is None:
+            result = await self.db.execute(select(Game.app_id).order_by(Game.app_id))
+            game_ids = result.scalars().all()
+        return [await self.publish_game(game_id, root) for game_id in game_ids]
@@ -0,0 +1,389 @@
+"""
+Retention service - version retention policies and pruning.
+
+Pruning applies each section's policy (its own, else the game-wide one) and
+deletes the versions it does not keep in batches of
+RETENTION_PRUNE_BATCH_SIZE, one transaction per batch. It never deletes a
+version that a section publishes or the newest version of any
+(experiment, variant), which is what delivery serves when nothing is
+published. Payload blobs and exports that no version references any more
+are collected afterwards.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.api.dependencies.auth import can_access_game
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.core.principal_cache import Principal
+from app.models.config_blob import ConfigBlob
+from app.models.config_export import ConfigExport
+from app.models.experiment import Experiment
+from app.models.game import Game
+from app.models.retention_policy import RetentionPolicy
+from app.models.section_config import SectionConfig, SectionConfigVersion, SectionType
+from app.schemas.retention import (
+    PruneReport,
+    RetentionPolicyCreate,
+    RetentionPolicyUpdate,
+    SectionPruneReport,
+)
+from app.utils.db_utils import AdvisoryLock
+
+logger = logging.getLogger(__name__)
+
+# Unreferenced blobs and exports younger than this are left alone: a write
+# may have stored one and not yet committed the version that references it.
+# Writes that reuse a stored blob or export refresh its created_at.
+ORPHAN_GRACE_PERIOD = timedelta(hours=1)
+
+# PostgreSQL advisory lock key of the scheduled prune ("retn")
+RETENTION_PRUNE_LOCK_KEY = 0x7265746E
+
+
+class RetentionService:
+    """Service for retention policies and version pruning"""
+
+    def __init__(self, db: AsyncSession, batch_size: Optional[int] = None):
+        self.db = db
+        self.batch_size = batch_size or settings.RETENTION_PRUNE_BATCH_SIZE
+
+    def _verify_game_access(self, game_id: str, current_user: Principal) -> None:
+        """Verify user has access to the game"""
+        if not can_access_game(current_user, game_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have access to this game"
+            )
+
+    async def _get_policy(self, policy_id: str, current_user: Principal) -> RetentionPolicy:
+        """Helper to get an accessible policy or raise 404"""
+        policy = await self.db.get(RetentionPolicy, policy_id)
+
+        if not policy:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Retention policy not found"
+            )
+
+        # Check game access
+        self._verify_game_access(policy.game_id, current_user)
+
+        return policy
+
+    async def list_policies(self, game_id: str, current_user: Principal) -> List[RetentionPolicy]:
+        """List a game's retention policies, the game-wide one first"""
+        # Check game access
+        self._verify_game_access(game_id, current_user)
+
+        result = await self.db.execute(
+            select(RetentionPolicy).where(RetentionPolicy.game_id == game_id)
+        )
+        return sorted(
+            result.scalars().all(),
+            key=lambda policy: (policy.section_type is not None, policy.section_type or ""),
+        )
+
+    async def create_policy(
+        self,
+        policy_data: RetentionPolicyCreate,
+        current_user: Principal
+    ) -> RetentionPolicy:
+        """
+        Create a retention policy.
+
+        Raises:
+            HTTPException: If the game does not exist or already has a policy for the section
+        """
+        # Check game access
+        self._verify_game_access(policy_data.game_id, current_user)
+
+        game = await self.db.get(Game, policy_data.game_id)
+        if not game:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+
+        # Checked here too: the unique constraint does not cover NULL section types
+        result = await self.db.execute(
+            select(RetentionPolicy.id).where(
+                RetentionPolicy.game_id == policy_data.game_id,
+                RetentionPolicy.section_type.is_(None) if policy_data.section_type is None
+                else RetentionPolicy.section_type == policy_data.section_type
+            )
+        )
+        if result.scalar_one_or_none():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A retention policy for this section already exists"
+            )
+
+        policy = RetentionPolicy(**policy_data.model_dump())
+        self.db.add(policy)
+        await self.db.commit()
+        await self.db.refresh(policy)
+
+        return policy
+
+    async def update_policy(
+        self,
+        policy_id: str,
+        update_data: RetentionPolicyUpdate,
+        current_user: Principal
+    ) -> RetentionPolicy:
+        """Update a policy's rules"""
+        policy = await self._get_policy(policy_id, current_user)
+
+        for field, value in update_data.model_dump(exclude_unset=True).items():
+            setattr(policy, field, value)
+
+        if policy.keep_last is None and policy.keep_days is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Set keep_last, keep_days or both"
+            )
+
+        await self.db.commit()
+        await self.db.refresh(policy)
+
+        return policy
+
+    async def delete_policy(self, policy_id: str, current_user: Principal) -> None:
+        """Delete a policy; its sections fall back to the game-wide policy, if any"""
+        policy = await self._get_policy(policy_id, current_user)
+
+        await self.db.delete(policy)
+        await self.db.commit()
+
+    def _prunable(self, section_config: SectionConfig, policy: RetentionPolicy):
+        """Query for the ids of a section's versions its policy does not keep, oldest first"""
+        version = SectionConfigVersion
+        newest_first = (version.created_at.desc(), version.id.desc())
+        ranked = (
+            select(
+                version.id,
+                version.created_at,
+                version.experiment,
+                func.row_number().over(order_by=newest_first).label("rank"),
+                func.row_number().over(
+                    partition_by=(func.coalesce(version.experiment, ""), func.coalesce(version.variant, "")),
+                    order_by=newest_first,
+                ).label("group_rank"),
+            )
+            .where(version.section_config_id == section_config.id)
+            .subquery()
+        )
+
+        query = select(ranked.c.id).where(
+            # The newest version of each experiment/variant may be delivered
+            ranked.c.group_rank > 1,
+            ~exists().where(SectionConfig.published_version_id == ranked.c.id),
+        )
+        if policy.keep_last is not None:
+            query = query.where(ranked.c.rank > policy.keep_last)
+        if policy.keep_days is not None:
+            query = query.where(ranked.c.created_at < datetime.utcnow() - timedelta(days=policy.keep_days))
+        if policy.keep_experiment_versions:
+            query = query.where(or_(
+                ranked.c.experiment.is_(None),
+                ~exists().where(
+                    Experiment.game_id == section_config.game_id,
+                    Experiment.name == ranked.c.experiment,
+                ),
+            ))
+        return query.order_by(ranked.c.created_at, ranked.c.id)
+
+    async def _prune_section(
+        self,
+        section_config: SectionConfig,
+        policy: RetentionPolicy,
+        dry_run: bool
+    ) -> SectionPruneReport:
+        report = SectionPruneReport(
+            section_config_id=section_config.id,
+            section_type=section_config.section_type,
+            policy_id=policy.id,
+            versions=0,
+        )
+
+        if dry_run:
+            result = await self.db.execute(self._prunable(section_config, policy))
+            report.version_ids = list(result.scalars().all())
+            report.versions = len(report.version_ids)
+            return report
+
+        while True:
+            result = await self.db.execute(self._prunable(section_config, policy).limit(self.batch_size))
+            version_ids = list(result.scalars().all())
+            if not version_ids:
+                break
+
+            deleted = await self.db.execute(
+                delete(SectionConfigVersion)
+                .where(
+                    SectionConfigVersion.id.in_(version_ids),
+                    # Re-checked at delete time: a version may have been published since
+                    ~exists().where(SectionConfig.published_version_id == SectionConfigVersion.id),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            # Version lists are revisioned by the section's updated_at
+            await self.db.execute(
+                update(SectionConfig)
+                .where(SectionConfig.id == section_config.id)
+                .values(updated_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+            report.versions += deleted.rowcount
+
+            if len(version_ids) < self.batch_size:
+                break
+
+        return report
+
+    async def _collect_orphans(self, model, *references) -> int:
+        """
+        Delete rows of a content-addressed table that none of references
+        points at, in batches until none is left (deleting a delta blob may
+        orphan its base).
+        The deleted row's own created_at is checked again, so a row a
+        concurrent write refreshed while the batch was selected is kept.
+        """
+        candidate = aliased(model)
+        cutoff = datetime.utcnow() - ORPHAN_GRACE_PERIOD
+        orphans = (
+            select(candidate.hash)
+            .where(
+                candidate.created_at < cutoff,
+                *(~exists().where(reference == candidate.hash) for reference in references),
+            )
+            .limit(self.batch_size)
+        )
+
+        total = 0
+        while True:
+            result = await self.db.execute(
+                delete(model)
+                .where(model.hash.in_(orphans.scalar_subquery()), model.created_at < cutoff)
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+            total += result.rowcount
+            if not result.rowcount:
+                return total
+
+    async def collect_garbage(self) -> Dict[str, int]:
+        """Delete payload blobs and exports no version (or delta blob) references"""
+        return {
+            "blobs": await self._collect_orphans(
+                ConfigBlob, SectionConfigVersion.config_hash, aliased(ConfigBlob).base_hash
+            ),
+            "exports": await self._collect_orphans(ConfigExport, SectionConfigVersion.export_hash),
+        }
+
+    async def policy_game_ids(self) -> List[str]:
+        """Games with at least one retention policy"""
+        result = await self.db.execute(
+            select(RetentionPolicy.game_id).distinct().order_by(RetentionPolicy.game_id)
+        )
+        return list(result.scalars().all())
+
+    async def prune(self, game_id: str, dry_run: bool) -> PruneReport:
+        """Apply a game's retention policies, without access checks or garbage collection"""
+        result = await self.db.execute(
+            select(RetentionPolicy).where(RetentionPolicy.game_id == game_id)
+        )
+        policies = {policy.section_type: policy for policy in result.scalars().all()}
+
+        result = await self.db.execute(
+            select(SectionConfig)
+            .where(SectionConfig.game_id == game_id)
+            .order_by(SectionConfig.section_type)
+        )
+        sections = []
+        for section_config in result.scalars().all():
+            policy = policies.get(SectionType(section_config.section_type), policies.get(None))
+            if policy is not None:
+                sections.append(await self._prune_section(section_config, policy, dry_run))
+
+        return PruneReport(
+            game_id=game_id,
+            dry_run=dry_run,
+            versions=sum(section.versions for section in sections),
+            sections=sections,
+        )
+
+    async def prune_game(self, game_id: str, current_user: Principal, dry_run: bool = True) -> PruneReport:
+        """
+        Apply a game's retention policies.
+        A dry run lists the versions that would be deleted and deletes nothing.
+        """
+        # Check game access
+        self._verify_game_access(game_id, current_user)
+
+        game = await self.db.get(Game, game_id)
+        if not game:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+
+        report = await self.prune(game_id, dry_run)
+        if not dry_run:
+            collected = await self.collect_garbage()
+            report.blobs, report.exports = collected["blobs"], collected["exports"]
+        return report
+
+    async def prune_all(self) -> List[PruneReport]:
+        """Apply every game's retention policies, then collect unreferenced blobs and exports"""
+        reports = [await self.prune(game_id, dry_run=False) for game_id in await self.policy_game_ids()]
+        await self.collect_garbage()
+        return reports
+
+
+@asynccontextmanager
+async def retention_pruner(interval_seconds: float) -> AsyncIterator[None]:
+    """
+    Run prune_all every interval_seconds for the app's lifetime (0 disables it).
+    Every worker runs the schedule, but only the one holding the retention
+    advisory lock prunes; another takes over once its connection is gone.
+    """
+    if interval_seconds <= 0:
+        yield
+        return
+
+    lock = AdvisoryLock(engine, RETENTION_PRUNE_LOCK_KEY)
+
+    async def run() -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                if not await lock.acquire():
+                    continue
+                async with AsyncSessionLocal() as db:
+                    reports = await RetentionService(db).prune_all()
+                pruned = sum(report.versions for report in reports)
+                if pruned:
+                    logger.info(f"Pruned {pruned} versions of {len(reports)} games")
+            except Exception:
+                logger.exception("Retention pruning failed")
+
+    task = asyncio.create_task(run())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        await lock.release()
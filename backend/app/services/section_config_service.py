@@ -1,20 +1,178 @@
 """Section config service - business logic for section config operations"""
 
-from typing import List
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy import select, desc, and_, func
+from pydantic import ValidationError
+from sqlalchemy import Text, and_, cast, desc, exists, func, insert, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import noload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import can_access_game
-from app.models.user import User
+from app.core.config import settings
+from app.core.config_events import ConfigChangeEvent, config_event_broker
+from app.models.config_blob import ConfigBlob, load_payloads
+from app.models.config_export import ConfigExport
+from app.core.principal_cache import Principal
 from app.models.section_config import SectionConfig, SectionType, SectionConfigVersion
+from app.services.delivery_service import config_snapshot_cache
+from app.services.publish_service import publish_if_configured
 from app.schemas.section_config import (
     SectionConfigVersionCreate,
     SectionConfigVersionUpdate,
+    SectionConfigVersionBulkItem,
+    SectionConfigVersionBulkResponse,
+    SectionConfigVersionBulkResult,
+    SectionConfigVersionResponse,
     SectionConfigVersionListResponse,
     SectionConfigSummary,
+    GameSectionConfigSummary,
+    SectionConfigVersionMatch,
+    SectionConfigVersionDiff,
+    ConfigChange,
 )
+from app.schemas.config_sections.registry import describe_errors, normalize_config
+from app.utils.compression import BROTLI, GZIP, compress_variants
+from app.utils.db_utils import insert_if_absent, insert_many_if_absent
+from app.utils.json_patch import Diff, JsonPatchError, apply_patch, diff
+from app.utils.json_query import json_contains, jsonb_contains, jsonb_path_exists
+from app.utils.json_response import dumps
+from app.utils.pagination import CursorError, decode_cursor, encode_cursor
+from app.utils.unity_export import serialize_unity_export, content_hash
+
+logger = logging.getLogger(__name__)
+
+
+class VersionTotalCache:
+    """
+    Process-local version counts per section config.
+    An entry is only valid for the revision (section updated_at) it was counted at.
+    """
+    
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._totals: "OrderedDict[str, Tuple[datetime, int]]" = OrderedDict()
+    
+    def get(self, section_config_id: str, revision: datetime) -> Optional[int]:
+        """Return the cached total if it was counted at this revision"""
+        entry = self._totals.get(section_config_id)
+        if entry is None or entry[0] != revision:
+            return None
+        self._totals.move_to_end(section_config_id)
+        return entry[1]
+    
+    def set(self, section_config_id: str, revision: datetime, total: int) -> None:
+        """Cache a total, evicting the least recently used entry when full"""
+        self._totals[section_config_id] = (revision, total)
+        self._totals.move_to_end(section_config_id)
+        while len(self._totals) > self.max_size:
+            self._totals.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every cached total"""
+        self._totals.clear()
+
+
+# Shared per-process version total cache
+version_total_cache = VersionTotalCache()
+
+
+def export_row(
+    section_config_id: str,
+    section_type: SectionType,
+    config_data: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    Run the Unity transform for config_data and return the config_exports
+    row holding the serialized bytes and their gzip and brotli encodings,
+    or None if the config cannot be exported.
+    Payloads stored before validation are exported as stored: the transform
+    defaults every field it reads, so they export as they always have.
+    """
+    if config_data is None:
+        return None
+    
+    try:
+        data = serialize_unity_export(SectionType(section_type).value, config_data)
+    except ValueError:
+        logger.warning(
+            f"Could not export {section_type} config of section config "
+            f"{section_config_id}: config cannot be transformed"
+        )
+        return None
+    
+    variants = compress_variants(data)
+    return {
+        "hash": content_hash(data),
+        "data": data,
+        "size": len(data),
+        "gzip_data": variants.get(GZIP),
+        "br_data": variants.get(BROTLI),
+    }
+
+
+async def chain_tip(db: AsyncSession, section_config_id: str) -> Optional[ConfigBlob]:
+    """
+    In delta history mode, the payload blob of a section's most recently
+    written version, which its next payload is stored as a delta against.
+    None in full history mode.
+    """
+    if settings.CONFIG_HISTORY_MODE != "delta":
+        return None
+    
+    result = await db.execute(
+        select(ConfigBlob)
+        .join(SectionConfigVersion, SectionConfigVersion.config_hash == ConfigBlob.hash)
+        .where(SectionConfigVersion.section_config_id == section_config_id)
+        .order_by(desc(SectionConfigVersion.updated_at), desc(SectionConfigVersion.id))
+        .limit(1)
+    )
+    tip = result.scalars().first()
+    # The next delta is computed against its payload
+    await load_payloads(db, [tip])
+    return tip
+
+
+# Columns refreshed when a write stores a blob or export that already exists,
+# so the orphan grace period of garbage collection starts over on reuse
+REFRESH_ON_REUSE = ("created_at",)
+
+
+async def stage_blob(
+    db: AsyncSession,
+    blob: ConfigBlob,
+    base: Optional[ConfigBlob],
+    pending: Dict[str, ConfigBlob]
+) -> ConfigBlob:
+    """
+    Return the blob to reference for a keyframe built by ConfigBlob.from_data,
+    adding it to pending (blobs to insert, by hash) unless it is stored or
+    pending already. With a base (see chain_tip), a new payload is staged as
+    a delta against it.
+    """
+    if blob.hash in pending:
+        return pending[blob.hash]
+    if base is not None:
+        # A stored blob is reused as is; its depth is what later deltas build on
+        stored = await db.get(ConfigBlob, blob.hash)
+        if stored is not None:
+            await load_payloads(db, [stored])
+            stored.created_at = datetime.utcnow()
+            return stored
+        blob.delta_against(base, settings.CONFIG_KEYFRAME_INTERVAL)
+    pending[blob.hash] = blob
+    return blob
+
+
+# Marks an unset compare-and-swap expectation (None means "nothing published")
+ANY_PUBLISHED_VERSION: Any = object()
+
+# Versions whose payloads are matched outside the index, loaded per round trip
+SEARCH_PAGE_SIZE = 200
 
 
 class SectionConfigService:
@@ -23,7 +181,7 @@ class SectionConfigService:
     def __init__(self, db: AsyncSession):
         self.db = db
     
-    def _verify_game_access(self, game_id: str, current_user: User) -> None:
+    def _verify_game_access(self, game_id: str, current_user: Principal) -> None:
         """Verify user has access to the game"""
         if not can_access_game(current_user, game_id):
             raise HTTPException(
@@ -31,11 +189,112 @@ class SectionConfigService:
                 detail="You don't have access to this game"
             )
     
+    async def _store_config_data(
+        self,
+        version: SectionConfigVersion,
+        config_data: Any,
+        section_type: SectionType
+    ) -> bool:
+        """
+        Validate config_data against its section schema and point the version
+        at the blob holding the normalized payload, storing the blob only if no
+        version has referenced that payload before (in delta history mode, as
+        a delta against the section's previous payload).
+        
+        Returns:
+            True if the version's payload changed
+        
+        Raises:
+            HTTPException: 422 if config_data does not match the section schema
+        """
+        try:
+            config_data, version.schema_hash = normalize_config(section_type, config_data)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid {SectionType(section_type).value} config: {describe_errors(e)}"
+            )
+        
+        if config_data is None:
+            changed = version.blob is not None
+            version.blob = None
+            return changed
+        
+        blob = ConfigBlob.from_data(config_data)
+        if version.blob is not None and version.blob.hash == blob.hash:
+            return False
+        
+        pending: Dict[str, ConfigBlob] = {}
+        blob = await stage_blob(
+            self.db, blob, await chain_tip(self.db, version.section_config_id), pending
+        )
+        if pending:
+            await insert_if_absent(self.db, ConfigBlob, blob.row(), REFRESH_ON_REUSE)
+        version.blob = await self.db.get(ConfigBlob, blob.hash)
+        return True
+    
+    async def _materialize_export(
+        self,
+        version: SectionConfigVersion,
+        section_type: SectionType
+    ) -> None:
+        """
+        Run the Unity transform for a version's config_data once and store the
+        serialized bytes, content-addressed, in config_exports.
+        """
+        await load_payloads(self.db, [version.blob])
+        row = export_row(version.section_config_id, section_type, version.config_data)
+        version.export_hash = None
+        if row is None:
+            return
+        
+        await insert_if_absent(self.db, ConfigExport, row, REFRESH_ON_REUSE)
+        version.export_hash = row["hash"]
+    
+    def _touch(self, section_config: SectionConfig) -> None:
+        """
+        Bump the section config's updated_at with every version write.
+        It doubles as the revision of the version list (ETags, cached totals).
+        """
+        section_config.updated_at = datetime.utcnow()
+    
+    def _change_event(
+        self,
+        section_config: SectionConfig,
+        version: SectionConfigVersion,
+        action: str
+    ) -> ConfigChangeEvent:
+        """Compact notification of a version write"""
+        return ConfigChangeEvent(
+            game_id=section_config.game_id,
+            section_type=SectionType(section_config.section_type).value,
+            action=action,
+            version_id=version.id,
+            config_hash=version.config_hash,
+            export_hash=version.export_hash,
+            experiment=version.experiment,
+            variant=version.variant,
+        )
+    
+    async def _on_versions_changed(
+        self,
+        section_config: SectionConfig,
+        *events: ConfigChangeEvent
+    ) -> None:
+        """
+        Rebuild derived delivery state and notify subscribers after versions
+        of the section config's game were committed
+        """
+        snapshot = await config_snapshot_cache.refresh(self.db, section_config.game_id)
+        await publish_if_configured(snapshot)
+        for event in events:
+            await config_event_broker.publish(self.db, event)
+    
     async def get_or_create_config(
         self, 
         game_id: str, 
         section_type: SectionType, 
-        current_user: User
+        current_user: Principal
     ) -> SectionConfig:
         """
         Get section config for a game+section combination.
@@ -70,50 +329,90 @@ class SectionConfigService:
     async def get_config_summary(
         self, 
         game_id: str, 
-        current_user: User
+        current_user: Principal
     ) -> List[SectionConfigSummary]:
         """Get summary of all section configs for a game"""
         # Check game access
         self._verify_game_access(game_id, current_user)
         
-        summaries = []
+        summaries = await self._summarize_games([game_id])
+        return summaries[game_id]
+    
+    async def get_config_summaries(
+        self,
+        game_ids: List[str],
+        current_user: Principal
+    ) -> List[GameSectionConfigSummary]:
+        """Get section config summaries for several games in a single query"""
+        # Preserve request order while dropping duplicates
+        game_ids = list(dict.fromkeys(game_ids))
+        
+        # Check game access for every requested game
+        for game_id in game_ids:
+            self._verify_game_access(game_id, current_user)
         
-        for section_type in SectionType:
-            # Get config for this section type
-            result = await self.db.execute(
-                select(SectionConfig).where(
-                    and_(
-                        SectionConfig.game_id == game_id,
-                        SectionConfig.section_type == section_type
-                    )
-                )
+        summaries = await self._summarize_games(game_ids)
+        return [
+            GameSectionConfigSummary(game_id=game_id, sections=summaries[game_id])
+            for game_id in game_ids
+        ]
+    
+    async def _summarize_games(
+        self,
+        game_ids: List[str]
+    ) -> Dict[str, List[SectionConfigSummary]]:
+        """
+        Build per-section summaries for the given games.
+        
+        Section configs, their version counts and timestamps are aggregated
+        in one grouped query; section types without a config row are filled
+        in with empty summaries.
+        """
+        if not game_ids:
+            return {}
+        
+        result = await self.db.execute(
+            select(
+                SectionConfig.game_id,
+                SectionConfig.section_type,
+                SectionConfig.updated_at,
+                func.count(SectionConfigVersion.id),
             )
-            config = result.scalar_one_or_none()
-            
-            # Count versions if config exists
-            version_count = 0
-            updated_at = None
-            if config:
-                count_result = await self.db.execute(
-                    select(func.count(SectionConfigVersion.id)).where(
-                        SectionConfigVersion.section_config_id == config.id
-                    )
-                )
-                version_count = count_result.scalar() or 0
-                updated_at = config.updated_at
-            
-            summaries.append(SectionConfigSummary(
-                section_type=section_type,
-                version_count=version_count,
-                updated_at=updated_at,
-            ))
+            .outerjoin(
+                SectionConfigVersion,
+                SectionConfigVersion.section_config_id == SectionConfig.id
+            )
+            .where(SectionConfig.game_id.in_(game_ids))
+            .group_by(
+                SectionConfig.id,
+                SectionConfig.game_id,
+                SectionConfig.section_type,
+                SectionConfig.updated_at,
+            )
+        )
+        rows = {
+            (game_id, section_type): (updated_at, version_count)
+            for game_id, section_type, updated_at, version_count in result.all()
+        }
+        
+        summaries: Dict[str, List[SectionConfigSummary]] = {}
+        for game_id in game_ids:
+            game_summaries = []
+            for section_type in SectionType:
+                updated_at, version_count = rows.get((game_id, section_type), (None, 0))
+                game_summaries.append(SectionConfigSummary(
+                    section_type=section_type,
+                    version_count=version_count,
+                    updated_at=updated_at,
+                ))
+            summaries[game_id] = game_summaries
         
         return summaries
     
     async def get_config_by_id(
         self, 
         config_id: str, 
-        current_user: User
+        current_user: Principal
     ) -> SectionConfig:
         """Get a specific section config by ID"""
         result = await self.db.execute(
@@ -150,41 +449,82 @@ class SectionConfigService:
     async def list_versions(
         self,
         config_id: str,
-        skip: int,
         limit: int,
-        current_user: User
+        current_user: Principal,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        include_total: bool = True
     ) -> SectionConfigVersionListResponse:
-        """List all versions for a section config"""
+        """
+        List versions for a section config, newest first.
+        
+        Pages are fetched by keyset on (created_at, id) when a cursor from a
+        previous page is given, so deep pages cost the same as the first.
+        skip is only honoured without a cursor. The total is counted once per
+        section revision and cached.
+        """
         section_config = await self._get_section_config(config_id)
         
         # Check game access
         self._verify_game_access(section_config.game_id, current_user)
         
-        # Count total
-        count_result = await self.db.execute(
-            select(func.count(SectionConfigVersion.id)).where(
-                SectionConfigVersion.section_config_id == config_id
-            )
-        )
-        total = count_result.scalar() or 0
-        
-        # Get paginated results
-        result = await self.db.execute(
+        query = (
             select(SectionConfigVersion)
             .where(SectionConfigVersion.section_config_id == config_id)
-            .order_by(desc(SectionConfigVersion.created_at))
-            .offset(skip)
-            .limit(limit)
+            .order_by(desc(SectionConfigVersion.created_at), desc(SectionConfigVersion.id))
         )
+        if cursor is not None:
+            try:
+                created_at, version_id = decode_cursor(cursor)
+                created_at = datetime.fromisoformat(created_at)
+                if not isinstance(version_id, str):
+                    raise CursorError("Invalid cursor")
+            except (CursorError, TypeError, ValueError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+            query = query.where(
+                tuple_(SectionConfigVersion.created_at, SectionConfigVersion.id)
+                < tuple_(created_at, version_id)
+            )
+        elif skip:
+            query = query.offset(skip)
+        
+        # One extra row tells whether another page follows
+        result = await self.db.execute(query.limit(limit + 1))
         versions = list(result.scalars().all())
         
-        return SectionConfigVersionListResponse(versions=versions, total=total)
+        next_cursor = None
+        if len(versions) > limit:
+            versions = versions[:limit]
+            last = versions[-1]
+            next_cursor = encode_cursor(last.created_at.isoformat(), last.id)
+        await load_payloads(self.db, [version.blob for version in versions])
+        
+        total = None
+        if include_total:
+            total = version_total_cache.get(config_id, section_config.updated_at)
+            if total is None:
+                count_result = await self.db.execute(
+                    select(func.count(SectionConfigVersion.id)).where(
+                        SectionConfigVersion.section_config_id == config_id
+                    )
+                )
+                total = count_result.scalar() or 0
+                version_total_cache.set(config_id, section_config.updated_at, total)
+        
+        return SectionConfigVersionListResponse(
+            versions=versions,
+            total=total,
+            next_cursor=next_cursor,
+        )
     
     async def create_version(
         self,
         config_id: str,
         version_data: SectionConfigVersionCreate,
-        current_user: User
+        current_user: Principal
     ) -> SectionConfigVersion:
         """Create a new version for a section config"""
         section_config = await self._get_section_config(config_id)
@@ -199,11 +539,19 @@ class SectionConfigService:
             description=version_data.description,
             experiment=version_data.experiment,
             variant=version_data.variant,
-            config_data=version_data.config_data,
         )
+        await self._store_config_data(
+            version, version_data.config_data, section_config.section_type
+        )
+        await self._materialize_export(version, section_config.section_type)
         self.db.add(version)
+        self._touch(section_config)
         await self.db.commit()
         await self.db.refresh(version)
+        await self._on_versions_changed(
+            section_config, self._change_event(section_config, version, "created")
+        )
+        await load_payloads(self.db, [version.blob])
         
         return version
     
@@ -211,7 +559,7 @@ class SectionConfigService:
         self,
         config_id: str,
         version_id: str,
-        current_user: User
+        current_user: Principal
     ) -> SectionConfigVersion:
         """Get a specific version"""
         section_config = await self._get_section_config(config_id)
@@ -235,15 +583,60 @@ class SectionConfigService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Version not found"
             )
+        await load_payloads(self.db, [version.blob])
         
         return version
     
+    async def get_version_with_config_json(
+        self,
+        config_id: str,
+        version_id: str,
+        current_user: Principal
+    ) -> Tuple[SectionConfigVersion, Optional[str]]:
+        """
+        Get a version and its config_data as the JSON text stored in the
+        database, without decoding it (payloads stored as deltas are
+        reconstructed and encoded). The returned version's blob is not
+        loaded, so its config_data reads as None.
+        """
+        section_config = await self._get_section_config(config_id)
+        
+        # Check game access
+        self._verify_game_access(section_config.game_id, current_user)
+        
+        result = await self.db.execute(
+            select(SectionConfigVersion, cast(ConfigBlob.data, Text))
+            .outerjoin(ConfigBlob, ConfigBlob.hash == SectionConfigVersion.config_hash)
+            .where(
+                and_(
+                    SectionConfigVersion.section_config_id == config_id,
+                    SectionConfigVersion.id == version_id
+                )
+            )
+            .options(noload(SectionConfigVersion.blob))
+        )
+        row = result.first()
+        
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Version not found"
+            )
+        
+        version, config_json = row
+        if config_json is None and version.config_hash is not None:
+            blob = await self.db.get(ConfigBlob, version.config_hash)
+            await load_payloads(self.db, [blob])
+            config_json = dumps(blob.payload).decode("utf-8")
+        
+        return version, config_json
+    
     async def update_version(
         self,
         config_id: str,
         version_id: str,
         update_data: SectionConfigVersionUpdate,
-        current_user: User
+        current_user: Principal
     ) -> SectionConfigVersion:
         """Update a version"""
         section_config = await self._get_section_config(config_id)
@@ -270,19 +663,322 @@ class SectionConfigService:
         
         # Update fields
         update_dict = update_data.model_dump(exclude_unset=True)
+        config_changed = False
+        if "config_data" in update_dict:
+            config_changed = await self._store_config_data(
+                version, update_dict.pop("config_data"), section_config.section_type
+            )
+        
         for field, value in update_dict.items():
             setattr(version, field, value)
         
+        if config_changed:
+            await self._materialize_export(version, section_config.section_type)
+        
+        self._touch(section_config)
         await self.db.commit()
         await self.db.refresh(version)
+        await self._on_versions_changed(
+            section_config, self._change_event(section_config, version, "updated")
+        )
+        await load_payloads(self.db, [version.blob])
         
         return version
     
+    async def bulk_write_versions(
+        self,
+        game_id: str,
+        items: Sequence[SectionConfigVersionBulkItem],
+        current_user: Principal
+    ) -> SectionConfigVersionBulkResponse:
+        """
+        Create and update versions across the sections of one game in a
+        single transaction.
+        
+        Game access is checked once. Every item is resolved and validated
+        before anything is written; items that fail are reported with their
+        status code and skipped. The rest are written with one multi-row
+        INSERT ... RETURNING for new versions, one executemany UPDATE for
+        existing ones and one multi-row insert each for the payload blobs and
+        exports they reference, then committed together.
+        """
+        self._verify_game_access(game_id, current_user)
+        
+        result = await self.db.execute(
+            select(SectionConfig).where(
+                and_(
+                    SectionConfig.game_id == game_id,
+                    SectionConfig.id.in_({item.section_config_id for item in items})
+                )
+            )
+        )
+        sections = {section.id: section for section in result.scalars().all()}
+        
+        # (section_config_id, config_hash) of every version to update
+        existing: Dict[str, Tuple[str, Optional[str]]] = {}
+        version_ids = {item.version_id for item in items if item.version_id is not None}
+        if version_ids:
+            result = await self.db.execute(
+                select(
+                    SectionConfigVersion.id,
+                    SectionConfigVersion.section_config_id,
+                    SectionConfigVersion.config_hash,
+                ).where(SectionConfigVersion.id.in_(version_ids))
+            )
+            existing = {row.id: (row.section_config_id, row.config_hash) for row in result}
+        
+        results: List[Optional[SectionConfigVersionBulkResult]] = [None] * len(items)
+        creates: List[Tuple[int, Dict[str, Any]]] = []
+        updates: List[Tuple[int, Dict[str, Any]]] = []
+        blobs: Dict[str, ConfigBlob] = {}
+        # Per section, the blob its next payload may be a delta against
+        tips: Dict[str, Optional[ConfigBlob]] = {}
+        exports: Dict[str, Dict[str, Any]] = {}
+        export_hashes: Dict[Tuple[SectionType, str], Optional[str]] = {}
+        updated_ids = set()
+        now = datetime.utcnow()
+        
+        def fail(index: int, status_code: int, detail: str) -> None:
+            results[index] = SectionConfigVersionBulkResult(
+                index=index, status="failed", status_code=status_code, detail=detail
+            )
+        
+        for index, item in enumerate(items):
+            section_config = sections.get(item.section_config_id)
+            if section_config is None:
+                fail(index, status.HTTP_404_NOT_FOUND, "Section config not found")
+                continue
+            section_type = SectionType(section_config.section_type)
+            
+            if item.version_id is not None:
+                if existing.get(item.version_id, (None, None))[0] != section_config.id:
+                    fail(index, status.HTTP_404_NOT_FOUND, "Version not found")
+                    continue
+                if item.version_id in updated_ids:
+                    fail(index, status.HTTP_409_CONFLICT, "Version is written more than once in this request")
+                    continue
+                updated_ids.add(item.version_id)
+                row = item.model_dump(exclude_unset=True, exclude={"section_config_id", "version_id"})
+                row.update(id=item.version_id, updated_at=now)
+            else:
+                row = item.model_dump(exclude={"section_config_id", "version_id"})
+                row.update(section_config_id=section_config.id, config_hash=None, export_hash=None)
+            
+            if "config_data" in row:
+                try:
+                    config_data, row["schema_hash"] = normalize_config(section_type, row.pop("config_data"))
+                except ValidationError as e:
+                    fail(
+                        index,
+                        status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        f"Invalid {section_type.value} config: {describe_errors(e)}"
+                    )
+                    continue
+                
+                blob = ConfigBlob.from_data(config_data) if config_data is not None else None
+                blob_hash = blob.hash if blob is not None else None
+                if item.version_id is None or existing[item.version_id][1] != blob_hash:
+                    row["config_hash"] = blob_hash
+                    row["export_hash"] = None
+                    if blob is not None:
+                        if section_config.id not in tips:
+                            tips[section_config.id] = await chain_tip(self.db, section_config.id)
+                        tips[section_config.id] = await stage_blob(
+                            self.db, blob, tips[section_config.id], blobs
+                        )
+                        key = (section_type, blob_hash)
+                        if key not in export_hashes:
+                            export = export_row(section_config.id, section_type, config_data)
+                            export_hashes[key] = export["hash"] if export is not None else None
+                            if export is not None:
+                                exports.setdefault(export["hash"], export)
+                        row["export_hash"] = export_hashes[key]
+            
+            (updates if item.version_id is not None else creates).append((index, row))
+        
+        written: Dict[int, Tuple[str, str]] = {}
+        if creates or updates:
+            await insert_many_if_absent(
+                self.db, ConfigBlob, [blob.row() for blob in blobs.values()], REFRESH_ON_REUSE
+            )
+            await insert_many_if_absent(self.db, ConfigExport, list(exports.values()), REFRESH_ON_REUSE)
+            if creates:
+                created_ids = await self.db.scalars(
+                    insert(SectionConfigVersion).returning(
+                        SectionConfigVersion.id, sort_by_parameter_order=True
+                    ),
+                    [row for _, row in creates],
+                )
+                for (index, _), version_id in zip(creates, created_ids.all()):
+                    written[index] = (version_id, "created")
+            if updates:
+                await self.db.execute(update(SectionConfigVersion), [row for _, row in updates])
+                for index, row in updates:
+                    written[index] = (row["id"], "updated")
+            
+            for section_id in {items[index].section_config_id for index in written}:
+                self._touch(sections[section_id])
+            await self.db.commit()
+        
+        events: List[ConfigChangeEvent] = []
+        if written:
+            # Load the written rows with their payloads for the response
+            result = await self.db.execute(
+                select(SectionConfigVersion)
+                .where(SectionConfigVersion.id.in_([version_id for version_id, _ in written.values()]))
+                .execution_options(populate_existing=True)
+            )
+            versions = {version.id: version for version in result.scalars().unique().all()}
+            await load_payloads(self.db, [version.blob for version in versions.values()])
+            for index, (version_id, action) in sorted(written.items()):
+                version = versions[version_id]
+                section_config = sections[version.section_config_id]
+                results[index] = SectionConfigVersionBulkResult(
+                    index=index,
+                    status=action,
+                    status_code=status.HTTP_201_CREATED if action == "created" else status.HTTP_200_OK,
+                    version=SectionConfigVersionResponse.model_validate(version),
+                )
+                events.append(self._change_event(section_config, version, action))
+            await self._on_versions_changed(next(iter(sections.values())), *events)
+        
+        return SectionConfigVersionBulkResponse(
+            results=results,
+            created=sum(1 for r in results if r.status == "created"),
+            updated=sum(1 for r in results if r.status == "updated"),
+            failed=sum(1 for r in results if r.status == "failed"),
+        )
+    
+    async def patch_version_config(
+        self,
+        config_id: str,
+        version_id: str,
+        operations: Sequence[Dict[str, Any]],
+        current_user: Principal,
+        precondition: Optional[Callable[[SectionConfigVersion], bool]] = None
+    ) -> SectionConfigVersion:
+        """
+        Update a version's config_data with RFC 6902 JSON Patch operations.
+        precondition, if given, is checked against the current version
+        (e.g. its ETag against If-Match) before the patch is applied.
+        
+        Raises:
+            HTTPException: 412 if the precondition fails,
+                422 if the patch cannot be applied to the current config
+        """
+        section_config = await self._get_section_config(config_id)
+        
+        # Check game access
+        self._verify_game_access(section_config.game_id, current_user)
+        
+        # Get version
+        result = await self.db.execute(
+            select(SectionConfigVersion).where(
+                and_(
+                    SectionConfigVersion.section_config_id == config_id,
+                    SectionConfigVersion.id == version_id
+                )
+            )
+        )
+        version = result.scalar_one_or_none()
+        
+        if not version:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Version not found"
+            )
+        
+        if precondition is not None and not precondition(version):
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Config data was modified by another request"
+            )
+        
+        await load_payloads(self.db, [version.blob])
+        try:
+            config_data = apply_patch(version.config_data, operations)
+        except JsonPatchError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Patch cannot be applied: {e}"
+            )
+        
+        if await self._store_config_data(version, config_data, section_config.section_type):
+            await self._materialize_export(version, section_config.section_type)
+            self._touch(section_config)
+            await self.db.commit()
+            await self.db.refresh(version)
+            await self._on_versions_changed(
+                section_config, self._change_event(section_config, version, "updated")
+            )
+            await load_payloads(self.db, [version.blob])
+        
+        return version
+    
+    async def diff_versions(
+        self,
+        config_id: str,
+        base_version_id: str,
+        version_id: str,
+        current_user: Principal
+    ) -> SectionConfigVersionDiff:
+        """
+        Diff the config_data of two versions of the same section config.
+        The patch turns the base version's config into the other version's.
+        """
+        section_config = await self._get_section_config(config_id)
+        
+        # Check game access
+        self._verify_game_access(section_config.game_id, current_user)
+        
+        result = await self.db.execute(
+            select(SectionConfigVersion).where(
+                and_(
+                    SectionConfigVersion.section_config_id == config_id,
+                    SectionConfigVersion.id.in_([base_version_id, version_id])
+                )
+            )
+        )
+        versions = {version.id: version for version in result.scalars()}
+        
+        if base_version_id not in versions or version_id not in versions:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Version not found"
+            )
+        
+        base = versions[base_version_id]
+        version = versions[version_id]
+        
+        # Equal content hashes mean equal payloads; skip the walk
+        identical = base.config_hash == version.config_hash
+        if not identical:
+            await load_payloads(self.db, [base.blob, version.blob])
+        changes = Diff() if identical else diff(base.config_data, version.config_data)
+        
+        return SectionConfigVersionDiff(
+            base_version_id=base.id,
+            version_id=version.id,
+            base_config_hash=base.config_hash,
+            config_hash=version.config_hash,
+            identical=identical,
+            patch=changes.patch,
+            changes=[
+                ConfigChange(
+                    kind=change.kind,
+                    path=change.path,
+                    old_value=change.old_value,
+                    new_value=change.new_value,
+                )
+                for change in changes.changes
+            ],
+        )
+    
     async def delete_version(
         self,
         config_id: str,
         version_id: str,
-        current_user: User
+        current_user: Principal
     ) -> None:
         """Delete a version"""
         section_config = await self._get_section_config(config_id)
@@ -307,16 +1003,24 @@ class SectionConfigService:
                 detail="Version not found"
             )
         
+        event = self._change_event(section_config, version, "deleted")
+        if section_config.published_version_id == version.id:
+            section_config.published_version_id = None
         await self.db.delete(version)
+        self._touch(section_config)
         await self.db.commit()
+        await self._on_versions_changed(section_config, event)
     
     async def duplicate_version(
         self,
         config_id: str,
         version_id: str,
-        current_user: User
+        current_user: Principal
     ) -> SectionConfigVersion:
-        """Duplicate a version (creates a copy with the same config_data)"""
+        """
+        Duplicate a version (creates a copy with the same config_data).
+        The copy references the source's payload and export instead of storing them again.
+        """
         section_config = await self._get_section_config(config_id)
         
         # Check game access
@@ -347,11 +1051,337 @@ class SectionConfigService:
             description=source_version.description,
             experiment=source_version.experiment,
             variant=source_version.variant,
-            config_data=source_version.config_data,
+            blob=source_version.blob,
+            schema_hash=source_version.schema_hash,
+            export_hash=source_version.export_hash,
         )
         self.db.add(new_version)
+        self._touch(section_config)
         await self.db.commit()
         await self.db.refresh(new_version)
+        await self._on_versions_changed(
+            section_config, self._change_event(section_config, new_version, "created")
+        )
+        await load_payloads(self.db, [new_version.blob])
         
         return new_version
-
+    
+    async def _swap_published_version(
+        self,
+        section_config: SectionConfig,
+        version_id: Optional[str],
+        expected_version_id: Any
+    ) -> None:
+        """
+        Point the section at version_id (or at nothing) in a single UPDATE.
+        The target version must still belong to the section, and the current
+        pointer must match expected_version_id unless it is ANY_PUBLISHED_VERSION.
+        """
+        statement = (
+            update(SectionConfig)
+            .where(SectionConfig.id == section_config.id)
+            .values(published_version_id=version_id, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if version_id is not None:
+            statement = statement.where(exists().where(
+                SectionConfigVersion.id == version_id,
+                SectionConfigVersion.section_config_id == section_config.id,
+            ))
+        if expected_version_id is None:
+            statement = statement.where(SectionConfig.published_version_id.is_(None))
+        elif expected_version_id is not ANY_PUBLISHED_VERSION:
+            statement = statement.where(SectionConfig.published_version_id == expected_version_id)
+        
+        result = await self.db.execute(statement)
+        if result.rowcount == 0:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Published version was changed by another request"
+            )
+        await self.db.commit()
+        await self.db.refresh(section_config)
+    
+    async def publish_version(
+        self,
+        config_id: str,
+        version_id: str,
+        current_user: Principal,
+        expected_version_id: Any = ANY_PUBLISHED_VERSION
+    ) -> SectionConfig:
+        """
+        Make a baseline version the live version of its section.
+        Its Unity export is materialized first, so serving the live config
+        never runs the transform.
+        
+        Raises:
+            HTTPException: 404 if the version is missing, 400 if it belongs to
+                an experiment, 409 if expected_version_id no longer matches
+        """
+        section_config = await self._get_section_config(config_id)
+        
+        # Check game access
+        self._verify_game_access(section_config.game_id, current_user)
+        
+        version = await self.db.get(SectionConfigVersion, version_id)
+        if version is None or version.section_config_id != config_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Version not found"
+            )
+        if version.experiment or version.variant:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only baseline versions (no experiment or variant) can be published"
+            )
+        
+        if version.export_hash is None and version.config_hash is not None:
+            await self._materialize_export(version, section_config.section_type)
+        
+        await self._swap_published_version(section_config, version_id, expected_version_id)
+        await self._on_versions_changed(
+            section_config, self._change_event(section_config, version, "published")
+        )
+        
+        return section_config
+    
+    async def unpublish_version(
+        self,
+        config_id: str,
+        current_user: Principal,
+        expected_version_id: Any = ANY_PUBLISHED_VERSION
+    ) -> SectionConfig:
+        """
+        Clear the section's live version; it falls back to its latest baseline version.
+        
+        Raises:
+            HTTPException: 409 if expected_version_id no longer matches
+        """
+        section_config = await self._get_section_config(config_id)
+        
+        # Check game access
+        self._verify_game_access(section_config.game_id, current_user)
+        
+        previous_version_id = section_config.published_version_id
+        if isinstance(expected_version_id, str):
+            previous_version_id = expected_version_id
+        if previous_version_id is None:
+            # Nothing published, as expected
+            return section_config
+        
+        await self._swap_published_version(section_config, None, expected_version_id)
+        await self._on_versions_changed(
+            section_config,
+            ConfigChangeEvent(
+                game_id=section_config.game_id,
+                section_type=SectionType(section_config.section_type).value,
+                action="unpublished",
+                version_id=previous_version_id,
+            ),
+        )
+        
+        return section_config
+    
+    async def get_published_export_hash(self, config_id: str, current_user: Principal) -> str:
+        """
+        Content hash of the live version's Unity export, by primary key lookups.
+        
+        Raises:
+            HTTPException: 404 if the section is missing or nothing is published
+        """
+        result = await self.db.execute(
+            select(SectionConfig.game_id, SectionConfigVersion.export_hash)
+            .outerjoin(
+                SectionConfigVersion,
+                SectionConfigVersion.id == SectionConfig.published_version_id,
+            )
+            .where(SectionConfig.id == config_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Section config not found"
+            )
+        
+        # Check game access
+        self._verify_game_access(row.game_id, current_user)
+        
+        if row.export_hash is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Section config has no published export"
+            )
+        
+        return row.export_hash
+    
+    async def get_version_export_hash(
+        self,
+        config_id: str,
+        version_id: str,
+        current_user: Principal
+    ) -> str:
+        """
+        Get the content hash of a version's Unity export.
+        Versions written before exports were precomputed are materialized once here.
+        """
+        version = await self.get_version(config_id, version_id, current_user)
+        
+        if version.export_hash is None and version.config_hash is not None:
+            section_config = await self._get_section_config(config_id)
+            await self._materialize_export(version, section_config.section_type)
+            await self.db.commit()
+        
+        if version.export_hash is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Version has no exportable config data"
+            )
+        
+        return version.export_hash
+    
+    async def get_export(self, export_hash: str) -> ConfigExport:
+        """Get a stored export and its precompressed variants by content hash"""
+        export = await self.db.get(ConfigExport, export_hash)
+        
+        if export is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Export not found"
+            )
+        
+        return export
+    
+    async def _match_payloads(
+        self,
+        query: Any,
+        contains: Any,
+        path: Optional[str],
+        limit: int
+    ) -> List[Any]:
+        """
+        Rows of a newest-first version query whose payloads match, read
+        SEARCH_PAGE_SIZE versions at a time until limit of them match.
+        Payloads are reconstructed per page; a JSONPath expression is
+        evaluated for the whole page in one PostgreSQL query.
+        """
+        query = query.add_columns(ConfigBlob).limit(SEARCH_PAGE_SIZE)
+        matches: List[Any] = []
+        page_query = query
+        while len(matches) < limit:
+            result = await self.db.execute(page_query)
+            page = result.all()
+            if not page:
+                break
+            await load_payloads(self.db, [row.ConfigBlob for row in page])
+            
+            candidates = [
+                row for row in page
+                if contains is None or json_contains(row.ConfigBlob.payload, contains)
+            ]
+            if path is not None and candidates:
+                documents = func.jsonb_array_elements(
+                    literal([row.ConfigBlob.payload for row in candidates], JSONB)
+                ).table_valued("value", with_ordinality="ordinal").render_derived()
+                found = set(await self.db.scalars(
+                    select(documents.c.ordinal).where(jsonb_path_exists(documents.c.value, path))
+                ))
+                candidates = [row for ordinal, row in enumerate(candidates, 1) if ordinal in found]
+            matches.extend(candidates)
+            
+            if len(page) < SEARCH_PAGE_SIZE:
+                break
+            last = page[-1]
+            page_query = query.where(
+                tuple_(SectionConfigVersion.updated_at, SectionConfigVersion.id)
+                < tuple_(last.updated_at, last.id)
+            )
+        return matches[:limit]
+    
+    async def search_versions(
+        self,
+        game_id: str,
+        current_user: Principal,
+        contains: Any = None,
+        path: Optional[str] = None,
+        section_type: Optional[SectionType] = None,
+        limit: int = 100
+    ) -> List[SectionConfigVersionMatch]:
+        """
+        Find a game's versions whose config data matches a query.
+        
+        contains matches documents that include the given JSON fragment
+        (e.g. {"currencies": [{"id": "gems"}]}); path matches documents where
+        a JSONPath expression finds an item
+        (e.g. '$.placements[*] ? (@.customAdUnitId == "X")'). On PostgreSQL
+        both run in the database against the GIN index on config_blobs;
+        payloads stored as deltas are reconstructed and matched in pages (see
+        _match_payloads), and only while they can still rank within limit.
+        """
+        # Check game access
+        self._verify_game_access(game_id, current_user)
+        
+        if contains is None and path is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide a contains fragment or a JSONPath expression"
+            )
+        
+        in_database = self.db.bind.dialect.name == "postgresql"
+        if path is not None and not in_database:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="JSONPath search requires PostgreSQL"
+            )
+        
+        query = (
+            select(
+                SectionConfigVersion.id,
+                SectionConfigVersion.section_config_id,
+                SectionConfig.section_type,
+                SectionConfigVersion.title,
+                SectionConfigVersion.experiment,
+                SectionConfigVersion.variant,
+                SectionConfigVersion.updated_at,
+            )
+            .join(SectionConfig, SectionConfig.id == SectionConfigVersion.section_config_id)
+            .where(SectionConfig.game_id == game_id)
+            .order_by(desc(SectionConfigVersion.updated_at), desc(SectionConfigVersion.id))
+        )
+        if section_type is not None:
+            query = query.where(SectionConfig.section_type == section_type)
+        
+        query = query.join(ConfigBlob, ConfigBlob.hash == SectionConfigVersion.config_hash)
+        if in_database:
+            keyframes = query.where(ConfigBlob.base_hash.is_(None))
+            if contains is not None:
+                keyframes = keyframes.where(jsonb_contains(ConfigBlob.data, contains))
+            if path is not None:
+                keyframes = keyframes.where(jsonb_path_exists(ConfigBlob.data, path))
+            result = await self.db.execute(keyframes.limit(limit))
+            rows = result.all()
+            
+            # Payloads stored as deltas have no indexed data: match them
+            # reconstructed, down to the oldest keyframe match once limit is full
+            deltas = query.where(ConfigBlob.base_hash.is_not(None))
+            if len(rows) == limit:
+                deltas = deltas.where(SectionConfigVersion.updated_at >= rows[-1].updated_at)
+            rows.extend(await self._match_payloads(deltas, contains, path, limit))
+            rows = sorted(rows, key=lambda row: row.updated_at, reverse=True)[:limit]
+        else:
+            # No JSON operators on this backend: filter the game's documents here
+            rows = await self._match_payloads(query, contains, None, limit)
+        
+        return [
+            SectionConfigVersionMatch(
+                id=row.id,
+                section_config_id=row.section_config_id,
+                section_type=row.section_type,
+                title=row.title,
+                experiment=row.experiment,
+                variant=row.variant,
+                updated_at=row.updated_at,
+            )
+            for row in rows
+        ]
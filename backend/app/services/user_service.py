@@ -7,7 +7,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.auth import get_password_hash
+from app.core.auth import get_password_hash_async
+from app.core.principal_cache import principal_cache
 from app.models.user import User
 from app.models.game import Game
 from app.schemas.auth import UserCreate, UserUpdate, ProfileUpdate
@@ -70,7 +71,7 @@ class UserService:
             email=user_data.email,
             name=user_data.name,
             role=user_data.role,
-            hashed_password=get_password_hash(user_data.password),
+            hashed_password=await get_password_hash_async(user_data.password),
         )
         self.db.add(new_user)
         await self.db.flush()
@@ -120,11 +121,12 @@ class UserService:
         
         # Hash password if provided
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+            update_data["hashed_password"] = await get_password_hash_async(update_data.pop("password"))
         
         for field, value in update_data.items():
             setattr(user, field, value)
         
+        principal_cache.invalidate_on_commit(self.db, user_id)
         await self.db.flush()
         await self.db.refresh(user)
         
@@ -155,11 +157,12 @@ class UserService:
         
         # Hash password if provided
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+            update_data["hashed_password"] = await get_password_hash_async(update_data.pop("password"))
         
         for field, value in update_data.items():
             setattr(user, field, value)
         
+        principal_cache.invalidate_on_commit(self.db, user_id)
         await self.db.flush()
         await self.db.refresh(user)
         
@@ -191,6 +194,7 @@ class UserService:
         
         await self.db.delete(user)
         await self.db.commit()
+        principal_cache.invalidate(user_id)
     
     async def assign_game(self, user_id: str, app_id: str) -> User:
         """
@@ -234,6 +238,7 @@ class UserService:
         
         # Assign game
         user.assigned_games.append(game)
+        principal_cache.invalidate_on_commit(self.db, user_id)
         await self.db.flush()
         await self.db.refresh(user)
         
@@ -274,6 +279,7 @@ class UserService:
             )
         
         user.assigned_games.remove(game_to_remove)
+        principal_cache.invalidate_on_commit(self.db, user_id)
         await self.db.flush()
         await self.db.refresh(user)
         
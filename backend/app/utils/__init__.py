@@ -2,10 +2,13 @@
 
 from app.utils.file_utils import save_logo, save_avatar
 from app.utils.unity_transform import transform_config_to_unity
+from app.utils.unity_export import serialize_unity_export, content_hash
 
 __all__ = [
     "save_logo",
     "save_avatar",
     "transform_config_to_unity",
+    "serialize_unity_export",
+    "content_hash",
 ]
 
@@ -0,0 +1,20 @@
+"""
+Canonical JSON encoding for content addressing.
+
+Two payloads that are equal as JSON values encode to the same bytes (keys
+sorted, no insignificant whitespace), so their hashes can be compared instead
+of the documents themselves.
+"""
+
+import json
+from typing import Any
+
+
+def canonical_json(value: Any) -> bytes:
+    """Encode a JSON value to its canonical UTF-8 bytes"""
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
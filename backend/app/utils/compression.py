@@ -0,0 +1,109 @@
+"""
+Precompressed response bodies.
+
+Export and delivery bytes are compressed once, when they are generated, and
+responses pick a stored variant from Accept-Encoding instead of compressing
+on every request. Brotli is preferred, gzip covers the remaining clients.
+"""
+
+import gzip
+from typing import Dict, Iterable, Optional
+
+import brotli
+
+GZIP = "gzip"
+BROTLI = "br"
+
+# Compression happens once per payload, so favour ratio over speed
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+# Bodies smaller than this are not worth a second round trip through a decoder
+MIN_COMPRESS_SIZE = 256
+
+# Preferred first when the client accepts several with the same q-value
+SUPPORTED_ENCODINGS = (BROTLI, GZIP)
+
+VARY_HEADERS = {"Vary": "Accept-Encoding"}
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Encode bytes with a supported content-coding"""
+    if encoding == GZIP:
+        # mtime=0 keeps the output deterministic for identical input
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == BROTLI:
+        return brotli.compress(data, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+    raise ValueError(f"Unsupported content-coding: {encoding!r}")
+
+
+def compress_variants(data: bytes) -> Dict[str, bytes]:
+    """
+    Every supported encoding of data that is smaller than the original.
+    Empty for small bodies.
+    """
+    if len(data) < MIN_COMPRESS_SIZE:
+        return {}
+    variants = {}
+    for encoding in SUPPORTED_ENCODINGS:
+        encoded = compress(data, encoding)
+        if len(encoded) < len(data):
+            variants[encoding] = encoded
+    return variants
+
+
+def parse_accept_encoding(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """Map each coding listed in an Accept-Encoding header to its q-value"""
+    weights: Dict[str, float] = {}
+    if not accept_encoding:
+        return weights
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding] = quality
+    return weights
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """
+    Pick the stored encoding to send, or None for the identity body.
+
+    Highest q-value wins; ties go to the order of SUPPORTED_ENCODINGS.
+    """
+    weights = parse_accept_encoding(accept_encoding)
+    available = set(available)
+    best, best_quality = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        if encoding not in available:
+            continue
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def encoded_etag(content_hash: str, encoding: Optional[str]) -> str:
+    """
+    Strong ETag of one encoding of a body.
+    Each encoding is a different representation, so it gets its own tag.
+    """
+    if encoding is None:
+        return f'"{content_hash}"'
+    return f'"{content_hash}-{encoding}"'
+
+
+def encoding_headers(encoding: Optional[str]) -> Dict[str, str]:
+    """Content-Encoding and Vary headers for a negotiated response"""
+    if encoding is None:
+        return dict(VARY_HEADERS)
+    return {**VARY_HEADERS, "Content-Encoding": encoding}
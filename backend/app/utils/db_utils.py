@@ -0,0 +1,126 @@
+"""Database helpers shared by services"""
+
+from typing import Any, Dict, Optional, Sequence, Type
+
+from sqlalchemy import String, cast, func, inspect, literal, select
+from sqlalchemy.dialects.postgresql import UUID, insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def _dialect_insert(db: AsyncSession):
+    return sqlite_insert if db.bind.dialect.name == "sqlite" else postgresql_insert
+
+
+def _on_conflict(model: Type[Any], statement, refresh: Sequence[str]):
+    if not refresh:
+        return statement.on_conflict_do_nothing()
+    return statement.on_conflict_do_update(
+        index_elements=[column.name for column in inspect(model).primary_key],
+        set_={name: statement.excluded[name] for name in refresh},
+    )
+
+
+async def insert_if_absent(
+    db: AsyncSession,
+    model: Type[Any],
+    values: Dict[str, Any],
+    refresh: Sequence[str] = ()
+) -> None:
+    """
+    INSERT a row, silently skipping it if the primary key already exists.
+    The refresh columns of an existing row are set from values instead
+    (e.g. created_at, so garbage collection sees the row was just reused).
+    
+    Used for content-addressed tables where concurrent writers may store
+    the same row at the same time.
+    """
+    statement = _dialect_insert(db)(model).values(**values)
+    await db.execute(_on_conflict(model, statement, refresh))
+
+
+async def insert_many_if_absent(
+    db: AsyncSession,
+    model: Type[Any],
+    rows: Sequence[Dict[str, Any]],
+    refresh: Sequence[str] = ()
+) -> None:
+    """Multi-row insert_if_absent: one INSERT ... VALUES statement for all rows"""
+    if rows:
+        statement = _dialect_insert(db)(model).values(list(rows))
+        await db.execute(_on_conflict(model, statement, refresh))
+
+
+def derived_id(db: AsyncSession, salt: str, source_id: ColumnElement) -> ColumnElement:
+    """
+    SQL expression for a new primary key derived from an existing one.
+    
+    Set-based copies (INSERT ... SELECT) use it for the new rows' ids and
+    again wherever a copied row references another one, so no id mapping has
+    to leave the database. On PostgreSQL it is md5(salt || source_id) as a
+    UUID. SQLite has no hash function: the first eight characters of the
+    source UUID are replaced by those of salt, which must be a fresh
+    random hex string per copy.
+    """
+    if db.bind.dialect.name == "sqlite":
+        return literal(salt[:8]) + func.substr(source_id, 9)
+    return cast(cast(func.md5(literal(salt) + source_id), UUID), String)
+
+
+class AdvisoryLock:
+    """
+    A PostgreSQL session-level advisory lock, held on a dedicated connection
+    from acquire until release (or until that connection drops), so one
+    process at a time can own a job across all of the app's workers.
+    Other backends have no advisory locks: acquire always succeeds.
+    """
+    
+    def __init__(self, engine: AsyncEngine, key: int):
+        self.engine = engine
+        self.key = key
+        self._connection: Optional[AsyncConnection] = None
+    
+    async def acquire(self) -> bool:
+        """Take the lock unless another session holds it; True while this process holds it"""
+        if self.engine.dialect.name != "postgresql":
+            return True
+        
+        if self._connection is not None:
+            try:
+                # The lock lives as long as the connection that took it
+                await self._connection.execute(select(1))
+                await self._connection.commit()
+                return True
+            except DBAPIError:
+                await self._connection.invalidate()
+                await self._connection.close()
+                self._connection = None
+        
+        connection = await self.engine.connect()
+        try:
+            acquired = await connection.scalar(select(func.pg_try_advisory_lock(self.key)))
+            await connection.commit()
+        except BaseException:
+            await connection.close()
+            raise
+        if not acquired:
+            await connection.close()
+            return False
+        self._connection = connection
+        return True
+    
+    async def release(self) -> None:
+        """Give the lock up, if held"""
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        try:
+            await connection.execute(select(func.pg_advisory_unlock(self.key)))
+            await connection.commit()
+        except DBAPIError:
+            # Dropping the server session releases the lock too
+            await connection.invalidate()
+        finally:
+            await connection.close()
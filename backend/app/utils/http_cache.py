@@ -0,0 +1,84 @@
+"""HTTP conditional request helpers (ETag / If-None-Match / If-Match)"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from fastapi import Response, status
+
+# Let browsers keep the body but revalidate it with If-None-Match on every use
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def strong_etag(content_hash: str) -> str:
+    """Strong ETag for byte-identical content"""
+    return f'"{content_hash}"'
+
+
+def _digest(parts: Any) -> str:
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Weak ETag derived from values that change whenever the representation does
+    (ids, updated_at timestamps, counts, content hashes).
+    """
+    return f'W/"{_digest(parts)}"'
+
+
+def derived_etag(*parts: Any) -> str:
+    """
+    Strong ETag derived from values that determine the representation byte
+    for byte, so it can also be sent back in If-Match.
+    """
+    return strong_etag(_digest(parts))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+    
+    Uses the weak comparison required for If-None-Match (RFC 9110 13.1.2).
+    """
+    if not if_none_match:
+        return False
+    
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque_tag:
+            return True
+    return False
+
+
+def if_match_matches(if_match: str, *etags: str) -> bool:
+    """
+    Check an If-Match header against the current ETag(s).
+    
+    Uses the strong comparison required for If-Match (RFC 9110 13.1.1):
+    weak tags never match.
+    """
+    for candidate in if_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or (not candidate.startswith("W/") and candidate in etags):
+            return True
+    return False
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach validator headers to a full response"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+
+
+def not_modified(etag: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Empty 304 response carrying the current validator (and e.g. Vary)"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={**(headers or {}), "ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL},
+    )
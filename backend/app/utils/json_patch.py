@@ -0,0 +1,324 @@
+"""
+Structural diff and RFC 6902 JSON Patch for config documents.
+
+Arrays of objects that share an identity field (id, name, Level, ...) are
+matched by that field, so reordering or editing one ad placement, notification
+strategy or tutorial level yields a few targeted operations instead of a
+rewrite of every element after it. Other arrays are compared by position.
+"""
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Fields tried, in order, to match array elements across two documents
+IDENTITY_KEYS = ("id", "Id", "productId", "name", "Name", "Level")
+
+_MISSING = object()
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch is malformed or cannot be applied"""
+
+
+@dataclass
+class Change:
+    """One entry of a human-readable change list"""
+    kind: str  # added | removed | modified | moved
+    path: str
+    old_value: Any = None
+    new_value: Any = None
+
+
+@dataclass
+class Diff:
+    """Result of diffing two documents"""
+    patch: List[Dict[str, Any]] = field(default_factory=list)
+    changes: List[Change] = field(default_factory=list)
+
+
+def escape_pointer_token(token: Any) -> str:
+    """Escape a key or index for use in a JSON Pointer"""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """Split a JSON Pointer (RFC 6901) into unescaped tokens"""
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON Pointer: {pointer!r}")
+    return [
+        token.replace("~1", "/").replace("~0", "~")
+        for token in pointer[1:].split("/")
+    ]
+
+
+def json_equal(a: Any, b: Any) -> bool:
+    """Compare JSON values, keeping booleans distinct from numbers"""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if isinstance(a, dict):
+        return isinstance(b, dict) and a.keys() == b.keys() and all(
+            json_equal(a[key], b[key]) for key in a
+        )
+    if isinstance(a, list):
+        return isinstance(b, list) and len(a) == len(b) and all(
+            json_equal(x, y) for x, y in zip(a, b)
+        )
+    if isinstance(b, (dict, list)):
+        return False
+    return a == b
+
+
+# ==================== Diff ====================
+
+
+def diff(old: Any, new: Any) -> Diff:
+    """
+    Compute a JSON Patch that turns old into new, plus a change list.
+
+    Applying result.patch to old with apply_patch yields a document equal
+    to new.
+    """
+    result = Diff()
+    _diff_value(old, new, "", result)
+    return result
+
+
+def _diff_value(old: Any, new: Any, path: str, result: Diff) -> None:
+    if json_equal(old, new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        _diff_object(old, new, path, result)
+    elif isinstance(old, list) and isinstance(new, list):
+        key = _identity_key(old, new)
+        if key is None:
+            _diff_array_by_position(old, new, path, result)
+        else:
+            _diff_array_by_key(old, new, key, path, result)
+    else:
+        result.patch.append({"op": "replace", "path": path, "value": new})
+        result.changes.append(Change("modified", path, old, new))
+
+
+def _diff_object(old: Dict[str, Any], new: Dict[str, Any], path: str, result: Diff) -> None:
+    for key in old:
+        if key not in new:
+            child = f"{path}/{escape_pointer_token(key)}"
+            result.patch.append({"op": "remove", "path": child})
+            result.changes.append(Change("removed", child, old[key], None))
+    for key, value in new.items():
+        child = f"{path}/{escape_pointer_token(key)}"
+        if key in old:
+            _diff_value(old[key], value, child, result)
+        else:
+            result.patch.append({"op": "add", "path": child, "value": value})
+            result.changes.append(Change("added", child, None, value))
+
+
+def _diff_array_by_position(old: List[Any], new: List[Any], path: str, result: Diff) -> None:
+    for index in range(min(len(old), len(new))):
+        _diff_value(old[index], new[index], f"{path}/{index}", result)
+    for index in range(len(old), len(new)):
+        child = f"{path}/{index}"
+        result.patch.append({"op": "add", "path": child, "value": new[index]})
+        result.changes.append(Change("added", child, None, new[index]))
+    for index in range(len(old) - 1, len(new) - 1, -1):
+        child = f"{path}/{index}"
+        result.patch.append({"op": "remove", "path": child})
+        result.changes.append(Change("removed", child, old[index], None))
+
+
+def _identity_key(old: List[Any], new: List[Any]) -> Optional[str]:
+    """First identity field present, scalar and unique in every element of both arrays"""
+    elements = old + new
+    if not elements or not all(isinstance(item, dict) for item in elements):
+        return None
+    for key in IDENTITY_KEYS:
+        if _is_identity(old, key) and _is_identity(new, key):
+            return key
+    return None
+
+
+def _is_identity(items: List[Dict[str, Any]], key: str) -> bool:
+    values = [item.get(key, _MISSING) for item in items]
+    if any(value is _MISSING or isinstance(value, (dict, list)) for value in values):
+        return False
+    return len(set(map(repr, values))) == len(values)
+
+
+class _Slots:
+    """
+    Which of n slots are still occupied, with the number of occupied slots
+    before a given one in O(log n) (a Fenwick tree)
+    """
+
+    def __init__(self, size: int):
+        self._tree = [0] + [1] * size
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                self._tree[parent] += self._tree[index]
+
+    def occupied_before(self, slot: int) -> int:
+        count, index = 0, slot
+        while index > 0:
+            count += self._tree[index]
+            index -= index & -index
+        return count
+
+    def vacate(self, slot: int) -> None:
+        index = slot + 1
+        while index < len(self._tree):
+            self._tree[index] -= 1
+            index += index & -index
+
+
+def _diff_array_by_key(
+    old: List[Dict[str, Any]],
+    new: List[Dict[str, Any]],
+    key: str,
+    path: str,
+    result: Diff
+) -> None:
+    old_by_id = {repr(item[key]): item for item in old}
+    new_ids = {repr(item[key]) for item in new}
+    old_ids = [repr(item[key]) for item in old]
+
+    # Removals first, from the end so earlier indices are unaffected
+    for index in range(len(old_ids) - 1, -1, -1):
+        if old_ids[index] not in new_ids:
+            child = f"{path}/{index}"
+            result.patch.append({"op": "remove", "path": child})
+            result.changes.append(Change("removed", child, old_by_id[old_ids[index]], None))
+
+    # Then place each element of new at its final index, left to right. While
+    # doing so the array holds new[:index] followed by the surviving old
+    # elements not placed yet, in their old order, so an element's current
+    # index is index plus the number of unplaced survivors before it.
+    survivors = {identity: slot for slot, identity in enumerate(i for i in old_ids if i in new_ids)}
+    unplaced = _Slots(len(survivors))
+    for index, item in enumerate(new):
+        identity = repr(item[key])
+        child = f"{path}/{index}"
+        if identity in old_by_id:
+            slot = survivors[identity]
+            position = index + unplaced.occupied_before(slot)
+            unplaced.vacate(slot)
+            if position != index:
+                result.patch.append({"op": "move", "from": f"{path}/{position}", "path": child})
+                result.changes.append(Change("moved", child, position, index))
+            _diff_value(old_by_id[identity], item, child, result)
+        else:
+            result.patch.append({"op": "add", "path": child, "value": item})
+            result.changes.append(Change("added", child, None, item))
+
+
+# ==================== Apply ====================
+
+
+def apply_patch(document: Any, operations: Sequence[Dict[str, Any]]) -> Any:
+    """
+    Apply RFC 6902 operations to a copy of document and return the result.
+
+    Raises:
+        JsonPatchError: If an operation is malformed, a path does not exist
+            or a test operation fails
+    """
+    document = copy.deepcopy(document)
+    for operation in operations:
+        document = _apply_operation(document, operation)
+    return document
+
+
+def _apply_operation(document: Any, operation: Dict[str, Any]) -> Any:
+    if not isinstance(operation, dict) or "op" not in operation or "path" not in operation:
+        raise JsonPatchError("Each operation needs 'op' and 'path'")
+
+    op = operation["op"]
+    path = parse_pointer(operation["path"])
+
+    if op in ("add", "replace", "test") and "value" not in operation:
+        raise JsonPatchError(f"'{op}' operation needs a 'value'")
+    if op in ("move", "copy") and "from" not in operation:
+        raise JsonPatchError(f"'{op}' operation needs a 'from'")
+
+    if op == "add":
+        return _add(document, path, copy.deepcopy(operation["value"]))
+    if op == "remove":
+        document, _ = _remove(document, path)
+        return document
+    if op == "replace":
+        _get(document, path)
+        document, _ = _remove(document, path)
+        return _add(document, path, copy.deepcopy(operation["value"]))
+    if op == "move":
+        source = parse_pointer(operation["from"])
+        if path[:len(source)] == source and path != source:
+            raise JsonPatchError("Cannot move a value into one of its children")
+        document, value = _remove(document, source)
+        return _add(document, path, value)
+    if op == "copy":
+        value = copy.deepcopy(_get(document, parse_pointer(operation["from"])))
+        return _add(document, path, value)
+    if op == "test":
+        if not json_equal(_get(document, path), operation["value"]):
+            raise JsonPatchError(f"Test failed at {operation['path']!r}")
+        return document
+    raise JsonPatchError(f"Unknown operation {op!r}")
+
+
+def _get(document: Any, path: List[str]) -> Any:
+    for token in path:
+        document = _child(document, token)
+    return document
+
+
+def _child(container: Any, token: str) -> Any:
+    if isinstance(container, dict):
+        if token not in container:
+            raise JsonPatchError(f"Path member {token!r} not found")
+        return container[token]
+    if isinstance(container, list):
+        return container[_index(container, token)]
+    raise JsonPatchError(f"Cannot traverse into a scalar at {token!r}")
+
+
+def _index(array: List[Any], token: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(array)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JsonPatchError(f"Invalid array index {token!r}")
+    index = int(token)
+    if index > len(array) or (index == len(array) and not allow_end):
+        raise JsonPatchError(f"Array index {index} out of range")
+    return index
+
+
+def _add(document: Any, path: List[str], value: Any) -> Any:
+    if not path:
+        return value
+    parent = _get(document, path[:-1])
+    token = path[-1]
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_index(parent, token, allow_end=True), value)
+    else:
+        raise JsonPatchError(f"Cannot add a member to a scalar at {token!r}")
+    return document
+
+
+def _remove(document: Any, path: List[str]) -> Tuple[Any, Any]:
+    if not path:
+        return None, document
+    parent = _get(document, path[:-1])
+    token = path[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchError(f"Path member {token!r} not found")
+        return document, parent.pop(token)
+    if isinstance(parent, list):
+        return document, parent.pop(_index(parent, token))
+    raise JsonPatchError(f"Cannot remove a member from a scalar at {token!r}")
@@ -0,0 +1,58 @@
+"""
+Queries over JSON config documents.
+
+On PostgreSQL config data is stored as JSONB and searched in the database with
+the GIN-indexable @> (containment) and @? (JSONPath) operators. Other backends
+(SQLite in tests and local development) fall back to json_contains evaluated
+in Python.
+"""
+
+from typing import Any
+
+from sqlalchemy import JSON, cast, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB, JSONPATH
+from sqlalchemy.sql.elements import ColumnElement
+
+# JSONB on PostgreSQL, generic JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+def jsonb_contains(column: Any, fragment: Any) -> ColumnElement:
+    """column @> fragment"""
+    return type_coerce(column, JSONB).contains(fragment)
+
+
+def jsonb_path_exists(column: Any, path: str) -> ColumnElement:
+    """column @? path"""
+    return type_coerce(column, JSONB).op("@?")(cast(path, JSONPATH))
+
+
+def json_contains(document: Any, fragment: Any) -> bool:
+    """
+    Python equivalent of PostgreSQL's jsonb @> operator.
+
+    Objects contain objects whose keys they share with contained values;
+    arrays contain arrays whose every element is contained by some element.
+    As in PostgreSQL, a top-level array also contains a matching scalar.
+    """
+    if isinstance(document, list) and not isinstance(fragment, (dict, list)):
+        fragment = [fragment]
+    return _contains(document, fragment)
+
+
+def _contains(document: Any, fragment: Any) -> bool:
+    if isinstance(document, dict):
+        return isinstance(fragment, dict) and all(
+            key in document and _contains(document[key], value)
+            for key, value in fragment.items()
+        )
+
+    if isinstance(document, list):
+        return isinstance(fragment, list) and all(
+            any(_contains(item, value) for item in document)
+            for value in fragment
+        )
+
+    if isinstance(document, bool) or isinstance(fragment, bool):
+        return document is fragment
+    return not isinstance(fragment, (dict, list)) and document == fragment
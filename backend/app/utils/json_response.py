@@ -0,0 +1,60 @@
+"""
+Fast JSON responses.
+
+FastJSONResponse is the app's default response class. It encodes with
+orjson and falls back to the stdlib encoder for values orjson rejects, such
+as non-string dict keys. Both produce compact UTF-8 JSON.
+
+Payloads that are already JSON text, such as config_data read from the
+database as text, are spliced into the body with embed_json instead of
+being decoded to Python objects and encoded again.
+"""
+
+import json
+from typing import Any, Dict
+
+import orjson
+from fastapi.responses import JSONResponse
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _stdlib_dumps(content: Any) -> bytes:
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode a JSON-compatible value to compact UTF-8 bytes"""
+    try:
+        return orjson.dumps(content)
+    except TypeError:
+        return _stdlib_dumps(content)
+
+
+def embed_json(document: Dict[str, Any], **encoded: bytes) -> bytes:
+    """
+    Encode document with additional members whose values are already JSON.
+
+    The encoded values are appended verbatim, so they must be valid JSON
+    and their keys must not be in document.
+    """
+    body = dumps(document)
+    if not encoded:
+        return body
+    members = b",".join(dumps(key) + b":" + value for key, value in encoded.items())
+    separator = b"," if len(body) > 2 else b""
+    return body[:-1] + separator + members + b"}"
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
@@ -0,0 +1,32 @@
+"""Opaque cursors for keyset pagination"""
+
+import base64
+import json
+from typing import Any, List
+
+
+class CursorError(ValueError):
+    """Raised when a cursor cannot be decoded"""
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque string"""
+    data = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Raises:
+        CursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise CursorError("Invalid cursor") from e
+    if not isinstance(values, list):
+        raise CursorError("Invalid cursor")
+    return values
@@ -0,0 +1,27 @@
+"""Server-sent events wire format (text/event-stream)"""
+
+from typing import Dict, Optional
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# Keep proxies from buffering or caching the stream
+SSE_HEADERS: Dict[str, str] = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse_message(data: str, event: Optional[str] = None, retry_ms: Optional[int] = None) -> bytes:
+    """Encode one event; multi-line data is split across data fields"""
+    lines = []
+    if retry_ms is not None:
+        lines.append(f"retry: {retry_ms}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+def sse_comment(text: str = "") -> bytes:
+    """Comment line, ignored by clients; used as a keep-alive"""
+    return f": {text}\n\n".encode("utf-8")
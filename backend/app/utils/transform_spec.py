@@ -0,0 +1,145 @@
+"""
+Declarative field mappings compiled to Python functions.
+
+A mapping spec lists the target keys of an output object in order, each
+with the source path it is read from and the default used when it is
+missing:
+
+    Value("Enabled", "enabled", False)
+    Value("AdFormat", "type", 0, enum=AD_FORMAT_MAP)
+    Group("Boosters", [...])                      nested object, same source
+    Group("Combo", [...], source="gameLogic.combo")
+    Items("Placements", "placements", [...])      one object per list element
+    Computed("Data", load_board_data)             function of the current object
+
+compile_mapping turns a spec into the source of a single function that
+returns one dict literal (list comprehensions for Items), compiles it once
+and returns the function. Missing objects and lists read as empty, as in the
+hand-written transforms the specs replace; a Value without a default is
+indexed directly and a missing field is an error.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+# Marks a Value without a default
+REQUIRED: Any = object()
+
+# Literal types a default is inlined as instead of referenced as a constant
+_LITERAL_TYPES = (str, int, float, bool, type(None))
+
+
+@dataclass(frozen=True)
+class Value:
+    """
+    Copy the value at source to target, or default when it is missing.
+    With an enum map, the mapped value is copied and default also stands in
+    for values the map does not know.
+    """
+    target: str
+    source: str
+    default: Any = REQUIRED
+    enum: Optional[Mapping[Any, Any]] = None
+
+
+@dataclass(frozen=True)
+class Group:
+    """Build a nested object from source (the current object if None)"""
+    target: str
+    fields: Sequence["MappingField"]
+    source: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Items:
+    """Map every element of the list at source with fields"""
+    target: str
+    source: str
+    fields: Sequence["MappingField"]
+
+
+@dataclass(frozen=True)
+class Computed:
+    """Set target to function(current object), for values no path can express"""
+    target: str
+    function: Callable[[Dict[str, Any]], Any]
+
+
+MappingField = Union[Value, Group, Items, Computed]
+
+
+class _Compiler:
+    """Generates the expression of one mapping and collects its constants"""
+
+    def __init__(self):
+        self.constants: Dict[str, Any] = {}
+        self._depth = 0
+        self._empty: Optional[str] = None
+
+    def constant(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def literal(self, value: Any) -> str:
+        if isinstance(value, _LITERAL_TYPES):
+            return repr(value)
+        if value == {}:
+            # Defaults are only read, so every missing object can share one
+            if self._empty is None:
+                self._empty = self.constant({})
+            return self._empty
+        return self.constant(value)
+
+    def path(self, variable: str, source: str, default: Any = REQUIRED) -> str:
+        keys = source.split(".")
+        if default is REQUIRED:
+            return variable + "".join(f"[{key!r}]" for key in keys)
+        parents = "".join(f".get({key!r}, {self.literal({})})" for key in keys[:-1])
+        return f"{variable}{parents}.get({keys[-1]!r}, {self.literal(default)})"
+
+    def mapping(self, fields: Sequence[MappingField], variable: str) -> str:
+        items = [f"{field.target!r}: {self.field(field, variable)}" for field in fields]
+        return "{" + ", ".join(items) + "}"
+
+    def field(self, field: MappingField, variable: str) -> str:
+        if isinstance(field, Value):
+            if field.enum is None:
+                return self.path(variable, field.source, field.default)
+            if field.default is REQUIRED:
+                source = self.path(variable, field.source)
+                return f"{self.constant(field.enum)}[{source}]"
+            source = self.path(variable, field.source, None)
+            return f"{self.constant(field.enum)}.get({source}, {self.literal(field.default)})"
+        if isinstance(field, Group):
+            source = variable if field.source is None else self.path(variable, field.source, {})
+            return self.mapping(field.fields, source)
+        if isinstance(field, Items):
+            self._depth += 1
+            item = f"_v{self._depth}"
+            body = self.mapping(field.fields, item)
+            self._depth -= 1
+            return f"[{body} for {item} in {self.path(variable, field.source, [])}]"
+        if isinstance(field, Computed):
+            return f"{self.constant(field.function)}({variable})"
+        raise TypeError(f"Unknown mapping field: {field!r}")
+
+
+def mapping_source(name: str, fields: Sequence[MappingField]) -> Tuple[str, Dict[str, Any]]:
+    """Python source of the function for a spec, and the constants it references"""
+    compiler = _Compiler()
+    body = compiler.mapping(fields, "config")
+    return f"def {name}(config):\n    return {body}\n", compiler.constants
+
+
+def compile_mapping(name: str, fields: Sequence[MappingField]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Compile a spec into a function from source config to target object.
+    The generated source is kept on the function as __source__.
+    """
+    source, constants = mapping_source(name, fields)
+    namespace: Dict[str, Any] = dict(constants)
+    exec(compile(source, f"<mapping {name}>", "exec"), namespace)
+    function = namespace[name]
+    function.__source__ = source
+    return function
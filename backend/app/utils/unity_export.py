@@ -0,0 +1,28 @@
+"""
+Serialized Unity exports.
+
+Exports are produced once per config payload: the Unity transform runs, the
+result is encoded to compact UTF-8 JSON and addressed by its SHA-256 hash.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from app.utils.unity_transform import transform_config_to_unity
+
+
+def serialize_unity_export(section_type: str, config_data: Any) -> bytes:
+    """
+    Transform a config to Unity format and encode it as JSON bytes.
+    
+    Raises:
+        ValueError: If the config cannot be transformed
+    """
+    transformed = transform_config_to_unity(section_type, config_data)
+    return json.dumps(transformed, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 hex digest used to address export bytes"""
+    return hashlib.sha256(data).hexdigest()
@@ -3,10 +3,18 @@ Transform internal config formats to Unity-compatible export format.
 
 This transforms camelCase/snake_case internal structure to PascalCase Unity format
 with numeric enum values where applicable.
+
+Each section is described by a declarative mapping spec (target key, source
+path, default, enum map) compiled once at import into a specialized function
+(see app.utils.transform_spec). The defaults are those of the hand-written
+transforms the specs replace, so payloads stored before validation export
+exactly as they always did.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List
+
+from app.utils.transform_spec import Computed, Group, Items, MappingField, Value, compile_mapping
 
 logger = logging.getLogger(__name__)
 
@@ -46,419 +54,334 @@ PRODUCT_TYPE_MAP = {
 
 
 # ============================================
-# SECTION-SPECIFIC TRANSFORMS
+# SECTION MAPPING SPECS
 # ============================================
 
-def transform_hint_offer_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform HintOfferConfig to Unity format."""
-    return {
-        "Enabled": config.get("enabled", False),
-        "Duration": config.get("duration", 0),
-        "DelayBeforeCountdown": config.get("delay_before_countdown", 0),
-        "MinLevel": config.get("min_level", 0),
-        "IdleTimeTrigger": config.get("idle_time_trigger", 0),
-        "MaxAppearancesPerLevel": config.get("max_appearances_per_level", 0),
-    }
-
-
-def transform_tutorial_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform TutorialConfig to Unity format."""
-    def transform_step(step: Dict[str, Any]) -> Dict[str, Any]:
-        data = step.get("Data", {})
-        # LoadBoard step (Type 0) - data is already in correct format
-        # GridTiles: [[column, -row, skinId], ...]
-        # HolderTiles: [skinId, ...]
-        if step.get("Type") == 0:
-            data = {
-                "Level": data.get("Level", 1),
-                "Moves": data.get("Moves", 10),
-                "GridTiles": data.get("GridTiles", []),
-                "HolderTiles": data.get("HolderTiles", []),
-            }
-        return {
-            "Type": step.get("Type", 0),
-            "Data": data,
-            "Focus": step.get("Focus", False),
-        }
-    
-    def transform_level(level: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "Level": level.get("Level", 1),
-            "Steps": [transform_step(s) for s in level.get("Steps", [])],
-        }
-    
-    # Return the tutorial data structure
-    data = config.get("data", {})
-    return {
-        "Id": data.get("Id", "1"),
-        "Levels": [transform_level(l) for l in data.get("Levels", [])],
-    }
-
-
-def transform_spin_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform SpinConfig to Unity format."""
-    def transform_reward_slot(slot: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "Probability": slot.get("probability", 0),
-            "ItemId": slot.get("item_id", ""),
-            "Amount": slot.get("amount", 0),
-            "UpgradeMultiplier": slot.get("upgrade_multiplier", 1),
-        }
-    
-    return {
-        "Enabled": config.get("enabled", False),
-        "MinLevel": config.get("min_level", 0),
-        "FreeSpinCount": config.get("free_spin_count", 0),
-        "AdSpinCount": config.get("ad_spin_count", 0),
-        "CooldownHours": config.get("cooldown_hours", 0),
-        "RewardSlots": [transform_reward_slot(slot) for slot in config.get("reward_slots", [])],
-    }
-
-
-def transform_rating_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform RatingConfig to Unity format."""
-    return {
-        "Enabled": config.get("enabled", False),
-        "MinStarRequired": config.get("min_star_required", 0),
-        "IntervalHours": config.get("interval_hours", 0),
-        "MinLevels": config.get("min_levels", 0),
-        "MaxShowCount": config.get("max_show_count", 0),
-    }
-
-
-def transform_link_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform LinkConfig to Unity format."""
-    return {
-        "PrivacyLink": config.get("privacy_link", ""),
-        "TermsLink": config.get("terms_link", ""),
-    }
-
-
-def transform_haptic_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform HapticConfig to Unity format."""
-    def transform_haptic_type(haptic: Dict[str, Any]) -> Dict[str, Any]:
-        android = haptic.get("android", {})
-        ios = haptic.get("ios", {})
-        return {
-            "Android": {
-                "Duration": android.get("duration", 0),
-                "Amplitude": android.get("amplitude", 0),
-            },
-            "IOS": {
-                "Intensity": ios.get("intensity", 0),
-                "Sharpness": ios.get("sharpness", 0),
-                "Duration": ios.get("duration", 0),
-            },
-        }
-    
-    return {
-        "Soft": transform_haptic_type(config.get("soft", {})),
-        "Light": transform_haptic_type(config.get("light", {})),
-        "Medium": transform_haptic_type(config.get("medium", {})),
-        "Heavy": transform_haptic_type(config.get("heavy", {})),
-        "Button": transform_haptic_type(config.get("button", {})),
-        "Success": transform_haptic_type(config.get("success", {})),
-        "Error": transform_haptic_type(config.get("error", {})),
-    }
-
-
-def transform_remove_ads_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform RemoveAdsConfig to Unity format."""
-    return {
-        "Enabled": config.get("enabled", False),
-        "MinLevel": config.get("minLevel", 0),
-        "AdWatchedTrigger": config.get("adWatchedTrigger", 0),
-        "DaysPlayedTrigger": config.get("daysPlayedTrigger", 0),
-        "DurationHours": config.get("durationHours", 0),
-        "MaxLifetimeShows": config.get("maxLifetimeShows", 0),
-        "MaxSessionShows": config.get("maxSessionShows", 0),
-        "CooldownPopupHours": config.get("cooldownPopupHours", 0),
-        "CooldownOfferHours": config.get("cooldownOfferHours", 0),
-    }
-
-
-def transform_tile_bundle_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform TileBundleConfig to Unity format."""
-    return {
-        "Enabled": config.get("enabled", False),
-        "Discount": config.get("discount", 0),
-        "MinLevel": config.get("minLevel", 0),
-        "DaysPlayedTrigger": config.get("daysPlayedTrigger", 0),
-        "SessionsPlayedTrigger": config.get("sessionsPlayedTrigger", 0),
-        "DurationHours": config.get("durationHours", 0),
-        "MaxLifetimeShows": config.get("maxLifetimeShows", 0),
-        "MaxSessionShows": config.get("maxSessionShows", 0),
-        "CooldownPopupHours": config.get("cooldownPopupHours", 0),
-        "CooldownOfferHours": config.get("cooldownOfferHours", 0),
-    }
-
-
-def transform_booster_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform BoosterConfig to Unity format."""
-    def transform_booster_item(item: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "UnlockLevel": item.get("unlock_level", 0),
-            "RefillAmount": item.get("refill_amount", 0),
-            "Start": item.get("start", 0),
-        }
-    
-    return {
-        "AutoUseAfterAds": config.get("auto_use_after_ads", False),
-        "TimeAutoSuggestion": config.get("time_auto_suggestion", 0),
-        "AutoSuggestionEnabled": config.get("auto_suggestion_enabled", False),
-        "Boosters": {
-            "Undo": transform_booster_item(config.get("undo", {})),
-            "Hint": transform_booster_item(config.get("hint", {})),
-            "Shuffle": transform_booster_item(config.get("shuffle", {})),
-        },
-    }
-
-
-def transform_chapter_reward_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform ChapterRewardConfig to Unity format."""
-    return {
-        "Undo": config.get("undo", 0),
-        "Hint": config.get("hint", 0),
-        "Shuffle": config.get("shuffle", 0),
-    }
-
-
-def transform_game_economy_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform GameEconomyConfig to Unity format."""
-    return {
-        "ReviveCoinCost": config.get("revive_coin_cost", 0),
-        "AdLevelCompleteCoinReward": config.get("ad_level_complete_coin_reward", 0),
-        "SceneryCompleteCoinReward": config.get("scenery_complete_coin_reward", 0),
-    }
-
-
-def transform_shop_settings_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform ShopSettingsConfig to Unity format."""
-    return {
-        "Enabled": config.get("enabled", False),
-        "RestoreMinLevel": config.get("restore_min_level", 0),
-    }
-
-
-def transform_analytics_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform AnalyticsConfig to Unity format."""
-    return {
-        "DevKey": config.get("dev_key", ""),
-        "AppId": config.get("app_id", ""),
-    }
-
-
-def transform_game_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform GameConfig to Unity format."""
-    game_logic = config.get("gameLogic", {})
-    game_logic_config = game_logic.get("gameLogicConfig", {})
-    combo = game_logic.get("combo", {})
-    view_config = config.get("viewConfig", {})
-    grid_view = view_config.get("gridView", {})
-    holder_view = view_config.get("holderView", {})
-    tile_size = grid_view.get("tileSize", {})
-    slot_size = holder_view.get("slotSize", {})
-    
-    return {
-        "GameLogic": {
-            "GameLogicConfig": {
-                "MatchCount": game_logic_config.get("matchCount", 0),
-                "CountUndoTileRevive": game_logic_config.get("countUndoTileRevive", 0),
-                "CountShuffleTileRevive": game_logic_config.get("countShuffleTileRevive", 0),
-                "CountSlotHolder": game_logic_config.get("countSlotHolder", 0),
-                "WarningThreshold": game_logic_config.get("warningThreshold", 0),
-            },
-            "Combo": {
-                "MatchEffect": combo.get("matchEffect", 0),
-                "MaxNoMatch": combo.get("maxNoMatch", 0),
-            },
-        },
-        "ViewConfig": {
-            "GridView": {
-                "TileSize": {
-                    "X": tile_size.get("x", 0),
-                    "Y": tile_size.get("y", 0),
-                },
-            },
-            "HolderView": {
-                "SlotSize": {
-                    "X": slot_size.get("x", 0),
-                    "Y": slot_size.get("y", 0),
-                },
-                "SlotSpace": holder_view.get("slotSpace", 0),
-                "RatioBetweenTwoTile": holder_view.get("ratioBetweenTwoTile", 0),
-                "SlotYPadding": holder_view.get("slotYPadding", 0),
-                "TileInHolderYPadding": holder_view.get("tileInHolderYPadding", 0),
-            },
-        },
-    }
-
-
-def transform_ad_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform AdConfig to Unity format."""
-    ad_unit_ids = config.get("adUnitIds", {})
-    advanced = config.get("advancedSettings", {})
-    optional = config.get("optionalSettings", {})
-    
-    def transform_placement(placement: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "PlacementId": placement.get("name", ""),
-            "AdFormat": AD_FORMAT_MAP.get(placement.get("type", ""), 0),
-            "Action": AD_ACTION_MAP.get(placement.get("action", ""), 0),
-            "MinLevel": placement.get("minLevel", 1),
-            "TimeBetween": placement.get("timeBetween", 0),
-            "ShowLoading": placement.get("showLoading", False),
-            "TimeOut": placement.get("timeOut", 30),
-            "Retry": placement.get("retry", 0),
-            "ShowAdNotice": placement.get("showAdNotice", False),
-            "DelayTime": placement.get("delayTime", 0),
-            "CustomAdUnitId": placement.get("customAdUnitId", ""),
-        }
-    
-    return {
-        "BannerAdUnitId": ad_unit_ids.get("banner", ""),
-        "InterstitialAdUnitId": ad_unit_ids.get("interstitial", ""),
-        "RewardedAdUnitId": ad_unit_ids.get("rewarded", ""),
-        "AutoHideBanner": advanced.get("autoHideBanner", True),
-        "BannerPosition": BANNER_POSITION_MAP.get(advanced.get("bannerPosition", "Bottom"), 0),
-        "BannerRefreshRate": advanced.get("bannerRefreshRate", 0),
-        "BannerMemoryThreshold": advanced.get("bannerMemoryThreshold", 1536),
-        "DestroyBannerOnLowMemory": advanced.get("destroyBannerOnLowMemory", True),
-        "PreloadInterstitial": advanced.get("preloadInterstitial", False),
-        "PreloadRewarded": advanced.get("preloadRewarded", True),
-        "EnableConsentFlow": optional.get("enableConsentFlow", True),
-        "Placements": [transform_placement(p) for p in config.get("placements", [])],
-    }
-
-
-def transform_notification_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform NotificationConfig to Unity format."""
-    def transform_message(msg: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "Title": msg.get("title", ""),
-            "Body": msg.get("body", ""),
-            "Payload": msg.get("payload", ""),
-            "AndroidChannelId": msg.get("androidChannelId", ""),
-            "IosCategory": msg.get("iosCategory", ""),
-            "OffsetSeconds": msg.get("offsetSeconds", 0),
-        }
-    
-    def transform_strategy(strategy: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "Id": strategy.get("id", ""),
-            "Name": strategy.get("name", ""),
-            "Mode": strategy.get("mode", 0),
-            "DelaySeconds": strategy.get("delaySeconds", 0),
-            "FixedHour": strategy.get("fixedHour", 0),
-            "FixedMinute": strategy.get("fixedMinute", 0),
-            "FixedDaysOffset": strategy.get("fixedDaysOffset", 0),
-            "RepeatPolicy": strategy.get("repeatPolicy", 0),
-            "RepeatSeconds": strategy.get("repeatSeconds", 0),
-            "Active": strategy.get("active", True),
-            "AutoScheduled": strategy.get("autoScheduled", False),
-            "SchedulingMode": strategy.get("schedulingMode", 0),
-            "DefaultChannelId": strategy.get("defaultChannelId", ""),
-            "Notifications": [transform_message(m) for m in strategy.get("notifications", [])],
-        }
-    
-    def transform_channel(channel: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "Id": channel.get("id", ""),
-            "Name": channel.get("name", ""),
-            "Description": channel.get("description", ""),
-            "DefaultBadge": channel.get("defaultBadge", 0),
-            "Importance": channel.get("importance", 3),
-            "EnableLights": channel.get("enableLights", True),
-            "EnableVibration": channel.get("enableVibration", True),
-            "CanBypassDnd": channel.get("canBypassDnd", False),
-            "CanShowBadge": channel.get("canShowBadge", True),
-            "LockScreenVisibility": channel.get("lockScreenVisibility", 1),
-        }
-    
-    return {
-        "Enable": config.get("enable", True),
-        "Strategies": [transform_strategy(s) for s in config.get("strategies", [])],
-        "Channels": [transform_channel(c) for c in config.get("channels", [])],
-    }
-
-
-def transform_economy_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform EconomyConfig to Unity format."""
-    def transform_currency(currency: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "Id": currency.get("id", ""),
-            "DisplayName": currency.get("displayName", ""),
-            "DefaultBalance": currency.get("startingBalance", 0),
-            "MaxValue": currency.get("maxValue", 999999999),
-            "AllowNegative": currency.get("allowNegative", False),
-        }
-    
-    def transform_inventory_item(item: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "Id": item.get("id", ""),
-            "DisplayName": item.get("displayName", ""),
-            "DefaultQuantity": item.get("startingQuantity", 0),
-            "IsStackable": item.get("isStackable", True),
-            "MaxStackSize": item.get("maxStackSize", 999),
-        }
-    
-    def transform_resource_ref(ref: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "ResourceType": RESOURCE_TYPE_MAP.get(ref.get("type", ""), 0),
-            "ResourceId": ref.get("resourceId", ""),
-            "Amount": ref.get("amount", 0),
-        }
-    
-    def transform_virtual_purchase(purchase: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "Id": purchase.get("id", ""),
-            "Name": purchase.get("name", ""),
-            "Costs": [transform_resource_ref(c) for c in purchase.get("costs", [])],
-            "Rewards": [transform_resource_ref(r) for r in purchase.get("rewards", [])],
-        }
-    
-    def transform_real_purchase(purchase: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "ProductId": purchase.get("productId", ""),
-            "ProductType": PRODUCT_TYPE_MAP.get(purchase.get("productType", ""), 0),
-            "Name": purchase.get("displayName", ""),
-            "Rewards": [transform_resource_ref(r) for r in purchase.get("rewards", [])],
+HINT_OFFER_SPEC: List[MappingField] = [
+    Value("Enabled", "enabled", False),
+    Value("Duration", "duration", 0),
+    Value("DelayBeforeCountdown", "delay_before_countdown", 0),
+    Value("MinLevel", "min_level", 0),
+    Value("IdleTimeTrigger", "idle_time_trigger", 0),
+    Value("MaxAppearancesPerLevel", "max_appearances_per_level", 0),
+]
+
+
+def _tutorial_step_data(step: Dict[str, Any]) -> Any:
+    """
+    LoadBoard step (Type 0) data is already in Unity format:
+    GridTiles: [[column, -row, skinId], ...], HolderTiles: [skinId, ...]
+    """
+    data = step.get("Data", {})
+    if step.get("Type") == 0:
+        data = {
+            "Level": data.get("Level", 1),
+            "Moves": data.get("Moves", 10),
+            "GridTiles": data.get("GridTiles", []),
+            "HolderTiles": data.get("HolderTiles", []),
         }
-    
-    settings = config.get("settings", {})
-    
-    return {
-        "CurrencyDefinitions": [transform_currency(c) for c in config.get("currencies", [])],
-        "InventoryItemDefinitions": [transform_inventory_item(i) for i in config.get("inventoryItems", [])],
-        "VirtualPurchaseDefinitions": [transform_virtual_purchase(p) for p in config.get("virtualPurchases", [])],
-        "RealMoneyProductDefinitions": [transform_real_purchase(p) for p in config.get("realPurchases", [])],
-        "EnableRefundProcessing": settings.get("enableRefundProcessing", False),
-    }
+    return data
+
+
+TUTORIAL_SPEC: List[MappingField] = [
+    Value("Id", "data.Id", "1"),
+    Items("Levels", "data.Levels", [
+        Value("Level", "Level", 1),
+        Items("Steps", "Steps", [
+            Value("Type", "Type", 0),
+            Computed("Data", _tutorial_step_data),
+            Value("Focus", "Focus", False),
+        ]),
+    ]),
+]
+
+SPIN_SPEC: List[MappingField] = [
+    Value("Enabled", "enabled", False),
+    Value("MinLevel", "min_level", 0),
+    Value("FreeSpinCount", "free_spin_count", 0),
+    Value("AdSpinCount", "ad_spin_count", 0),
+    Value("CooldownHours", "cooldown_hours", 0),
+    Items("RewardSlots", "reward_slots", [
+        Value("Probability", "probability", 0),
+        Value("ItemId", "item_id", ""),
+        Value("Amount", "amount", 0),
+        Value("UpgradeMultiplier", "upgrade_multiplier", 1),
+    ]),
+]
+
+RATING_SPEC: List[MappingField] = [
+    Value("Enabled", "enabled", False),
+    Value("MinStarRequired", "min_star_required", 0),
+    Value("IntervalHours", "interval_hours", 0),
+    Value("MinLevels", "min_levels", 0),
+    Value("MaxShowCount", "max_show_count", 0),
+]
+
+LINK_SPEC: List[MappingField] = [
+    Value("PrivacyLink", "privacy_link", ""),
+    Value("TermsLink", "terms_link", ""),
+]
+
+
+def _haptic_type(target: str, source: str) -> Group:
+    return Group(target, [
+        Group("Android", [
+            Value("Duration", "duration", 0),
+            Value("Amplitude", "amplitude", 0),
+        ], source="android"),
+        Group("IOS", [
+            Value("Intensity", "intensity", 0),
+            Value("Sharpness", "sharpness", 0),
+            Value("Duration", "duration", 0),
+        ], source="ios"),
+    ], source=source)
+
+
+HAPTIC_SPEC: List[MappingField] = [
+    _haptic_type("Soft", "soft"),
+    _haptic_type("Light", "light"),
+    _haptic_type("Medium", "medium"),
+    _haptic_type("Heavy", "heavy"),
+    _haptic_type("Button", "button"),
+    _haptic_type("Success", "success"),
+    _haptic_type("Error", "error"),
+]
+
+REMOVE_ADS_SPEC: List[MappingField] = [
+    Value("Enabled", "enabled", False),
+    Value("MinLevel", "minLevel", 0),
+    Value("AdWatchedTrigger", "adWatchedTrigger", 0),
+    Value("DaysPlayedTrigger", "daysPlayedTrigger", 0),
+    Value("DurationHours", "durationHours", 0),
+    Value("MaxLifetimeShows", "maxLifetimeShows", 0),
+    Value("MaxSessionShows", "maxSessionShows", 0),
+    Value("CooldownPopupHours", "cooldownPopupHours", 0),
+    Value("CooldownOfferHours", "cooldownOfferHours", 0),
+]
+
+TILE_BUNDLE_SPEC: List[MappingField] = [
+    Value("Enabled", "enabled", False),
+    Value("Discount", "discount", 0),
+    Value("MinLevel", "minLevel", 0),
+    Value("DaysPlayedTrigger", "daysPlayedTrigger", 0),
+    Value("SessionsPlayedTrigger", "sessionsPlayedTrigger", 0),
+    Value("DurationHours", "durationHours", 0),
+    Value("MaxLifetimeShows", "maxLifetimeShows", 0),
+    Value("MaxSessionShows", "maxSessionShows", 0),
+    Value("CooldownPopupHours", "cooldownPopupHours", 0),
+    Value("CooldownOfferHours", "cooldownOfferHours", 0),
+]
+
+
+def _booster_item(target: str, source: str) -> Group:
+    return Group(target, [
+        Value("UnlockLevel", "unlock_level", 0),
+        Value("RefillAmount", "refill_amount", 0),
+        Value("Start", "start", 0),
+    ], source=source)
+
+
+BOOSTER_SPEC: List[MappingField] = [
+    Value("AutoUseAfterAds", "auto_use_after_ads", False),
+    Value("TimeAutoSuggestion", "time_auto_suggestion", 0),
+    Value("AutoSuggestionEnabled", "auto_suggestion_enabled", False),
+    Group("Boosters", [
+        _booster_item("Undo", "undo"),
+        _booster_item("Hint", "hint"),
+        _booster_item("Shuffle", "shuffle"),
+    ]),
+]
+
+CHAPTER_REWARD_SPEC: List[MappingField] = [
+    Value("Undo", "undo", 0),
+    Value("Hint", "hint", 0),
+    Value("Shuffle", "shuffle", 0),
+]
+
+GAME_ECONOMY_SPEC: List[MappingField] = [
+    Value("ReviveCoinCost", "revive_coin_cost", 0),
+    Value("AdLevelCompleteCoinReward", "ad_level_complete_coin_reward", 0),
+    Value("SceneryCompleteCoinReward", "scenery_complete_coin_reward", 0),
+]
+
+SHOP_SETTINGS_SPEC: List[MappingField] = [
+    Value("Enabled", "enabled", False),
+    Value("RestoreMinLevel", "restore_min_level", 0),
+]
+
+ANALYTICS_SPEC: List[MappingField] = [
+    Value("DevKey", "dev_key", ""),
+    Value("AppId", "app_id", ""),
+]
+
+
+def _vector2(target: str, source: str) -> Group:
+    return Group(target, [Value("X", "x", 0), Value("Y", "y", 0)], source=source)
+
+
+GAME_SPEC: List[MappingField] = [
+    Group("GameLogic", [
+        Group("GameLogicConfig", [
+            Value("MatchCount", "matchCount", 0),
+            Value("CountUndoTileRevive", "countUndoTileRevive", 0),
+            Value("CountShuffleTileRevive", "countShuffleTileRevive", 0),
+            Value("CountSlotHolder", "countSlotHolder", 0),
+            Value("WarningThreshold", "warningThreshold", 0),
+        ], source="gameLogicConfig"),
+        Group("Combo", [
+            Value("MatchEffect", "matchEffect", 0),
+            Value("MaxNoMatch", "maxNoMatch", 0),
+        ], source="combo"),
+    ], source="gameLogic"),
+    Group("ViewConfig", [
+        Group("GridView", [
+            _vector2("TileSize", "tileSize"),
+        ], source="gridView"),
+        Group("HolderView", [
+            _vector2("SlotSize", "slotSize"),
+            Value("SlotSpace", "slotSpace", 0),
+            Value("RatioBetweenTwoTile", "ratioBetweenTwoTile", 0),
+            Value("SlotYPadding", "slotYPadding", 0),
+            Value("TileInHolderYPadding", "tileInHolderYPadding", 0),
+        ], source="holderView"),
+    ], source="viewConfig"),
+]
+
+AD_SPEC: List[MappingField] = [
+    Value("BannerAdUnitId", "adUnitIds.banner", ""),
+    Value("InterstitialAdUnitId", "adUnitIds.interstitial", ""),
+    Value("RewardedAdUnitId", "adUnitIds.rewarded", ""),
+    Value("AutoHideBanner", "advancedSettings.autoHideBanner", True),
+    Value("BannerPosition", "advancedSettings.bannerPosition", 0, enum=BANNER_POSITION_MAP),
+    Value("BannerRefreshRate", "advancedSettings.bannerRefreshRate", 0),
+    Value("BannerMemoryThreshold", "advancedSettings.bannerMemoryThreshold", 1536),
+    Value("DestroyBannerOnLowMemory", "advancedSettings.destroyBannerOnLowMemory", True),
+    Value("PreloadInterstitial", "advancedSettings.preloadInterstitial", False),
+    Value("PreloadRewarded", "advancedSettings.preloadRewarded", True),
+    Value("EnableConsentFlow", "optionalSettings.enableConsentFlow", True),
+    Items("Placements", "placements", [
+        Value("PlacementId", "name", ""),
+        Value("AdFormat", "type", 0, enum=AD_FORMAT_MAP),
+        Value("Action", "action", 0, enum=AD_ACTION_MAP),
+        Value("MinLevel", "minLevel", 1),
+        Value("TimeBetween", "timeBetween", 0),
+        Value("ShowLoading", "showLoading", False),
+        Value("TimeOut", "timeOut", 30),
+        Value("Retry", "retry", 0),
+        Value("ShowAdNotice", "showAdNotice", False),
+        Value("DelayTime", "delayTime", 0),
+        Value("CustomAdUnitId", "customAdUnitId", ""),
+    ]),
+]
+
+NOTIFICATION_SPEC: List[MappingField] = [
+    Value("Enable", "enable", True),
+    Items("Strategies", "strategies", [
+        Value("Id", "id", ""),
+        Value("Name", "name", ""),
+        Value("Mode", "mode", 0),
+        Value("DelaySeconds", "delaySeconds", 0),
+        Value("FixedHour", "fixedHour", 0),
+        Value("FixedMinute", "fixedMinute", 0),
+        Value("FixedDaysOffset", "fixedDaysOffset", 0),
+        Value("RepeatPolicy", "repeatPolicy", 0),
+        Value("RepeatSeconds", "repeatSeconds", 0),
+        Value("Active", "active", True),
+        Value("AutoScheduled", "autoScheduled", False),
+        Value("SchedulingMode", "schedulingMode", 0),
+        Value("DefaultChannelId", "defaultChannelId", ""),
+        Items("Notifications", "notifications", [
+            Value("Title", "title", ""),
+            Value("Body", "body", ""),
+            Value("Payload", "payload", ""),
+            Value("AndroidChannelId", "androidChannelId", ""),
+            Value("IosCategory", "iosCategory", ""),
+            Value("OffsetSeconds", "offsetSeconds", 0),
+        ]),
+    ]),
+    Items("Channels", "channels", [
+        Value("Id", "id", ""),
+        Value("Name", "name", ""),
+        Value("Description", "description", ""),
+        Value("DefaultBadge", "defaultBadge", 0),
+        Value("Importance", "importance", 3),
+        Value("EnableLights", "enableLights", True),
+        Value("EnableVibration", "enableVibration", True),
+        Value("CanBypassDnd", "canBypassDnd", False),
+        Value("CanShowBadge", "canShowBadge", True),
+        Value("LockScreenVisibility", "lockScreenVisibility", 1),
+    ]),
+]
+
+
+def _resource_refs(target: str, source: str) -> Items:
+    return Items(target, source, [
+        Value("ResourceType", "type", 0, enum=RESOURCE_TYPE_MAP),
+        Value("ResourceId", "resourceId", ""),
+        Value("Amount", "amount", 0),
+    ])
+
+
+ECONOMY_SPEC: List[MappingField] = [
+    Items("CurrencyDefinitions", "currencies", [
+        Value("Id", "id", ""),
+        Value("DisplayName", "displayName", ""),
+        Value("DefaultBalance", "startingBalance", 0),
+        Value("MaxValue", "maxValue", 999999999),
+        Value("AllowNegative", "allowNegative", False),
+    ]),
+    Items("InventoryItemDefinitions", "inventoryItems", [
+        Value("Id", "id", ""),
+        Value("DisplayName", "displayName", ""),
+        Value("DefaultQuantity", "startingQuantity", 0),
+        Value("IsStackable", "isStackable", True),
+        Value("MaxStackSize", "maxStackSize", 999),
+    ]),
+    Items("VirtualPurchaseDefinitions", "virtualPurchases", [
+        Value("Id", "id", ""),
+        Value("Name", "name", ""),
+        _resource_refs("Costs", "costs"),
+        _resource_refs("Rewards", "rewards"),
+    ]),
+    Items("RealMoneyProductDefinitions", "realPurchases", [
+        Value("ProductId", "productId", ""),
+        Value("ProductType", "productType", 0, enum=PRODUCT_TYPE_MAP),
+        Value("Name", "displayName", ""),
+        _resource_refs("Rewards", "rewards"),
+    ]),
+    Value("EnableRefundProcessing", "settings.enableRefundProcessing", False),
+]
 
 
 # ============================================
 # MAIN TRANSFORM FUNCTION
 # ============================================
 
-# Map section types to their transform functions
+# Mapping spec of each section type
+SECTION_SPECS: Dict[str, List[MappingField]] = {
+    "economy": ECONOMY_SPEC,
+    "ads": AD_SPEC,
+    "notification": NOTIFICATION_SPEC,
+    "game": GAME_SPEC,
+    "haptic": HAPTIC_SPEC,
+    "remove_ads": REMOVE_ADS_SPEC,
+    "tile_bundle": TILE_BUNDLE_SPEC,
+    "booster": BOOSTER_SPEC,
+    "rating": RATING_SPEC,
+    "link": LINK_SPEC,
+    "chapter_reward": CHAPTER_REWARD_SPEC,
+    "game_economy": GAME_ECONOMY_SPEC,
+    "shop_settings": SHOP_SETTINGS_SPEC,
+    "spin": SPIN_SPEC,
+    "hint_offer": HINT_OFFER_SPEC,
+    "analytics": ANALYTICS_SPEC,
+    "tutorial": TUTORIAL_SPEC,
+}
+
+# Map section types to their transform functions, compiled once per process
 SECTION_TRANSFORMS = {
-    "economy": transform_economy_config,
-    "ads": transform_ad_config,
-    "notification": transform_notification_config,
-    "game": transform_game_config,
-    "haptic": transform_haptic_config,
-    "remove_ads": transform_remove_ads_config,
-    "tile_bundle": transform_tile_bundle_config,
-    "booster": transform_booster_config,
-    "rating": transform_rating_config,
-    "link": transform_link_config,
-    "chapter_reward": transform_chapter_reward_config,
-    "game_economy": transform_game_economy_config,
-    "shop_settings": transform_shop_settings_config,
-    "spin": transform_spin_config,
-    "hint_offer": transform_hint_offer_config,
-    "analytics": transform_analytics_config,
-    "tutorial": transform_tutorial_config,
+    section_type: compile_mapping(f"transform_{section_type}_config", spec)
+    for section_type, spec in SECTION_SPECS.items()
 }
 
 
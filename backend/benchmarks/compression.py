@@ -0,0 +1,92 @@
+"""
+Benchmark: CPU per export response, on-the-fly vs precompressed.
+
+Builds a large synthetic export (tutorial levels with thousands of GridTiles)
+and compares, per request, compressing the body on the fly (as a compression
+middleware would) with negotiating Accept-Encoding and picking the variant
+stored by compress_variants when the export was written.
+
+Usage:
+    python -m benchmarks.compression --levels 40 --tiles 400 --requests 200
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, List
+
+from app.utils.compression import (
+    SUPPORTED_ENCODINGS,
+    compress,
+    compress_variants,
+    negotiate_encoding,
+)
+
+ACCEPT_ENCODING = "gzip, deflate, br"
+
+
+def build_export(levels: int, tiles: int) -> bytes:
+    """Serialized export shaped like a large tutorial config"""
+    document = {
+        "Levels": [
+            {
+                "Level": level,
+                "GridTiles": [
+                    {"X": tile % 20, "Y": tile // 20, "Type": tile % 7, "Locked": tile % 3 == 0}
+                    for tile in range(tiles)
+                ],
+                "Steps": [{"Text": f"Tap tile {step}", "Target": step} for step in range(10)],
+            }
+            for level in range(levels)
+        ]
+    }
+    return json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+
+def measure(label: str, fn: Callable[[], bytes], requests: int) -> None:
+    """Report CPU time per request and the size of the body sent"""
+    timings: List[float] = []
+    body = b""
+    for _ in range(requests):
+        start = time.process_time()
+        body = fn()
+        timings.append((time.process_time() - start) * 1000)
+    print(
+        f"{label:<32} cpu/request mean={statistics.mean(timings):8.3f} ms  "
+        f"p95={sorted(timings)[int(len(timings) * 0.95) - 1]:8.3f} ms  "
+        f"body={len(body):>9} B"
+    )
+
+
+def main(levels: int, tiles: int, requests: int) -> None:
+    data = build_export(levels, tiles)
+    print(f"export: {len(data)} B, encodings: {', '.join(SUPPORTED_ENCODINGS)}")
+
+    start = time.process_time()
+    variants = compress_variants(data)
+    print(f"one-time compress_variants: {(time.process_time() - start) * 1000:.1f} ms")
+
+    for encoding in SUPPORTED_ENCODINGS:
+        measure(f"on-the-fly {encoding}", lambda: compress(data, encoding), requests)
+
+    def precompressed() -> bytes:
+        encoding = negotiate_encoding(ACCEPT_ENCODING, variants)
+        return variants[encoding] if encoding else data
+
+    measure("precompressed (negotiated)", precompressed, requests)
+    for encoding in SUPPORTED_ENCODINGS:
+        measure(
+            f"precompressed {encoding} only",
+            lambda: variants[negotiate_encoding(encoding, variants)],
+            requests,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--levels", type=int, default=40)
+    parser.add_argument("--tiles", type=int, default=400)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    main(args.levels, args.tiles, args.requests)
@@ -0,0 +1,224 @@
+"""
+Benchmark: Unity transform throughput, hand-written vs compiled mappings.
+
+Builds large synthetic economy and notification configs and compares the
+previous hand-written mappers with the mappings compiled from SECTION_SPECS.
+Both must serialize to identical bytes; the benchmark aborts if they do not.
+
+Usage:
+    python -m benchmarks.unity_transform --items 2000 --strategies 300 --repeat 20
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from app.utils.unity_transform import PRODUCT_TYPE_MAP, RESOURCE_TYPE_MAP, SECTION_TRANSFORMS
+
+
+def build_economy(items: int) -> Dict[str, Any]:
+    """Economy with `items` currencies, inventory items and purchases each"""
+    return {
+        "currencies": [
+            {"id": f"cur_{i}", "displayName": f"Currency {i}", "startingBalance": i}
+            for i in range(items)
+        ],
+        "inventoryItems": [
+            {"id": f"item_{i}", "displayName": f"Item {i}", "startingQuantity": i % 5}
+            for i in range(items)
+        ],
+        "virtualPurchases": [
+            {
+                "id": f"vp_{i}",
+                "name": f"Pack {i}",
+                "costs": [{"type": "Currency", "resourceId": f"cur_{i}", "amount": 100}],
+                "rewards": [
+                    {"type": "Item", "resourceId": f"item_{i}", "amount": 1},
+                    {"type": "Currency", "resourceId": "cur_0", "amount": 5},
+                ],
+            }
+            for i in range(items)
+        ],
+        "realPurchases": [
+            {
+                "productId": f"com.game.product_{i}",
+                "displayName": f"Product {i}",
+                "productType": "Consumable" if i % 2 else "NonConsumable",
+                "rewards": [{"type": "Currency", "resourceId": "cur_1", "amount": 50}],
+            }
+            for i in range(items)
+        ],
+        "settings": {"enableRefundProcessing": True},
+    }
+
+
+def build_notifications(strategies: int) -> Dict[str, Any]:
+    """Notification config with `strategies` strategies of five messages each"""
+    return {
+        "strategies": [
+            {
+                "id": f"strategy_{i}",
+                "name": f"Strategy {i}",
+                "mode": i % 2,
+                "repeatPolicy": 2,
+                "schedulingMode": 1,
+                "defaultChannelId": f"channel_{i % 10}",
+                "notifications": [
+                    {"title": f"title_{i}_{n}", "body": f"body_{i}_{n}", "offsetSeconds": n * 60}
+                    for n in range(5)
+                ],
+            }
+            for i in range(strategies)
+        ],
+        "channels": [{"id": f"channel_{i}", "name": f"Channel {i}"} for i in range(10)],
+    }
+
+
+# ============================================
+# REFERENCE: hand-written mappers replaced by the compiled specs
+# ============================================
+
+def handwritten_economy(config: Dict[str, Any]) -> Dict[str, Any]:
+    def transform_currency(currency: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "Id": currency.get("id", ""),
+            "DisplayName": currency.get("displayName", ""),
+            "DefaultBalance": currency.get("startingBalance", 0),
+            "MaxValue": currency.get("maxValue", 999999999),
+            "AllowNegative": currency.get("allowNegative", False),
+        }
+    
+    def transform_inventory_item(item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "Id": item.get("id", ""),
+            "DisplayName": item.get("displayName", ""),
+            "DefaultQuantity": item.get("startingQuantity", 0),
+            "IsStackable": item.get("isStackable", True),
+            "MaxStackSize": item.get("maxStackSize", 999),
+        }
+    
+    def transform_resource_ref(ref: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "ResourceType": RESOURCE_TYPE_MAP.get(ref.get("type", ""), 0),
+            "ResourceId": ref.get("resourceId", ""),
+            "Amount": ref.get("amount", 0),
+        }
+    
+    def transform_virtual_purchase(purchase: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "Id": purchase.get("id", ""),
+            "Name": purchase.get("name", ""),
+            "Costs": [transform_resource_ref(c) for c in purchase.get("costs", [])],
+            "Rewards": [transform_resource_ref(r) for r in purchase.get("rewards", [])],
+        }
+    
+    def transform_real_purchase(purchase: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "ProductId": purchase.get("productId", ""),
+            "ProductType": PRODUCT_TYPE_MAP.get(purchase.get("productType", ""), 0),
+            "Name": purchase.get("displayName", ""),
+            "Rewards": [transform_resource_ref(r) for r in purchase.get("rewards", [])],
+        }
+    
+    settings = config.get("settings", {})
+    
+    return {
+        "CurrencyDefinitions": [transform_currency(c) for c in config.get("currencies", [])],
+        "InventoryItemDefinitions": [transform_inventory_item(i) for i in config.get("inventoryItems", [])],
+        "VirtualPurchaseDefinitions": [transform_virtual_purchase(p) for p in config.get("virtualPurchases", [])],
+        "RealMoneyProductDefinitions": [transform_real_purchase(p) for p in config.get("realPurchases", [])],
+        "EnableRefundProcessing": settings.get("enableRefundProcessing", False),
+    }
+
+
+def handwritten_notification(config: Dict[str, Any]) -> Dict[str, Any]:
+    def transform_message(msg: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "Title": msg.get("title", ""),
+            "Body": msg.get("body", ""),
+            "Payload": msg.get("payload", ""),
+            "AndroidChannelId": msg.get("androidChannelId", ""),
+            "IosCategory": msg.get("iosCategory", ""),
+            "OffsetSeconds": msg.get("offsetSeconds", 0),
+        }
+
+    def transform_strategy(strategy: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "Id": strategy.get("id", ""),
+            "Name": strategy.get("name", ""),
+            "Mode": strategy.get("mode", 0),
+            "DelaySeconds": strategy.get("delaySeconds", 0),
+            "FixedHour": strategy.get("fixedHour", 0),
+            "FixedMinute": strategy.get("fixedMinute", 0),
+            "FixedDaysOffset": strategy.get("fixedDaysOffset", 0),
+            "RepeatPolicy": strategy.get("repeatPolicy", 0),
+            "RepeatSeconds": strategy.get("repeatSeconds", 0),
+            "Active": strategy.get("active", True),
+            "AutoScheduled": strategy.get("autoScheduled", False),
+            "SchedulingMode": strategy.get("schedulingMode", 0),
+            "DefaultChannelId": strategy.get("defaultChannelId", ""),
+            "Notifications": [transform_message(m) for m in strategy.get("notifications", [])],
+        }
+
+    def transform_channel(channel: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "Id": channel.get("id", ""),
+            "Name": channel.get("name", ""),
+            "Description": channel.get("description", ""),
+            "DefaultBadge": channel.get("defaultBadge", 0),
+            "Importance": channel.get("importance", 3),
+            "EnableLights": channel.get("enableLights", True),
+            "EnableVibration": channel.get("enableVibration", True),
+            "CanBypassDnd": channel.get("canBypassDnd", False),
+            "CanShowBadge": channel.get("canShowBadge", True),
+            "LockScreenVisibility": channel.get("lockScreenVisibility", 1),
+        }
+
+    return {
+        "Enable": config.get("enable", True),
+        "Strategies": [transform_strategy(s) for s in config.get("strategies", [])],
+        "Channels": [transform_channel(c) for c in config.get("channels", [])],
+    }
+
+
+def encode(document: Dict[str, Any]) -> bytes:
+    """Same encoding as serialize_unity_export"""
+    return json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def measure(label: str, fn: Callable[[Dict[str, Any]], Dict[str, Any]], config: Dict[str, Any], repeat: int) -> float:
+    """Report transforms per second and return the best time per transform"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(config)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} best={best * 1000:8.3f} ms  throughput={1 / best:10.1f} transforms/s")
+    return best
+
+
+def compare(section_type: str, config: Dict[str, Any], handwritten: Callable, repeat: int) -> None:
+    compiled = SECTION_TRANSFORMS[section_type]
+    expected, actual = encode(handwritten(config)), encode(compiled(config))
+    if expected != actual:
+        raise SystemExit(f"{section_type}: compiled output differs from the hand-written mapper")
+
+    print(f"{section_type}: {len(actual)} B export, outputs byte-identical")
+    before = measure(f"  hand-written {section_type}", handwritten, config, repeat)
+    after = measure(f"  compiled {section_type}", compiled, config, repeat)
+    print(f"  speedup: {before / after:.2f}x")
+
+
+def main(items: int, strategies: int, repeat: int) -> None:
+    compare("economy", build_economy(items), handwritten_economy, repeat)
+    compare("notification", build_notifications(strategies), handwritten_notification, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--strategies", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.items, args.strategies, args.repeat)
@@ -59,3 +59,59 @@ async def test_get_current_user_unauthorized(client: AsyncClient):
     
     assert response.status_code == 401
 
+
+
+@pytest.mark.asyncio
+async def test_current_user_served_from_principal_cache(
+    client: AsyncClient, test_admin_user, test_engine
+):
+    """Test repeated authenticated requests do not reload the user"""
+    from sqlalchemy import event
+    
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "admin@test.com", "password": "testpassword"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    await client.get("/api/v1/auth/me", headers=headers)
+    
+    statements = []
+    
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(test_engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        response = await client.get("/api/v1/auth/me", headers=headers)
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", count_statement)
+    
+    assert response.status_code == 200
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_game_assignment_invalidates_principal_cache(
+    client: AsyncClient, test_operator_user, test_db
+):
+    """Test an operator sees a newly assigned game immediately"""
+    from app.services.user_service import UserService
+    from tests.utils.factories import create_game
+    
+    test_db.add(create_game(app_id="assigned-later"))
+    await test_db.commit()
+    
+    operator_login = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "operator@test.com", "password": "testpassword"}
+    )
+    operator_headers = {"Authorization": f"Bearer {operator_login.json()['access_token']}"}
+    
+    before = await client.get("/api/v1/games/assigned-later", headers=operator_headers)
+    assert before.status_code == 403
+    
+    await UserService(test_db).assign_game(test_operator_user.id, "assigned-later")
+    await test_db.commit()
+    
+    after = await client.get("/api/v1/games/assigned-later", headers=operator_headers)
+    assert after.status_code == 200
@@ -0,0 +1,355 @@
+"""Tests for config delivery API endpoints"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.endpoints.delivery import stream_config_events
+from app.core.config_events import PostgresEventListener, config_event_broker
+
+from app.models.config_blob import ConfigBlob
+from app.models.section_config import SectionConfig, SectionConfigVersion, SectionType
+from app.schemas.section_config import SectionConfigVersionCreate, SectionConfigVersionUpdate
+from app.services import delivery_service
+from app.services.delivery_service import ConfigSnapshotCache, config_snapshot_cache
+from app.services.section_config_service import SectionConfigService
+from tests.utils.factories import create_game
+
+
+async def _create_section(test_db, game_id: str, section_type: SectionType) -> SectionConfig:
+    config = SectionConfig(game_id=game_id, section_type=section_type)
+    test_db.add(config)
+    await test_db.flush()
+    return config
+
+
+@pytest.mark.asyncio
+async def test_get_game_configs(client: AsyncClient, test_db):
+    """Test delivery returns the latest baseline version transformed to Unity format"""
+    test_db.add(create_game(app_id="delivery-game"))
+    config = await _create_section(test_db, "delivery-game", SectionType.LINK)
+    test_db.add(SectionConfigVersion(
+        section_config_id=config.id,
+        blob=ConfigBlob.from_data({"privacy_link": "https://example.com/privacy", "terms_link": ""}),
+    ))
+    await test_db.commit()
+    
+    response = await client.get("/api/v1/delivery/delivery-game/configs")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sections"]["link"] == {
+        "PrivacyLink": "https://example.com/privacy",
+        "TermsLink": "",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_game_configs_exports_unvalidated_legacy_payload(client: AsyncClient, test_db):
+    """Test a payload stored before validation is delivered with the transform defaults"""
+    test_db.add(create_game(app_id="legacy-game"))
+    config = await _create_section(test_db, "legacy-game", SectionType.HAPTIC)
+    # Missing most fields the haptic schema requires
+    test_db.add(SectionConfigVersion(
+        section_config_id=config.id, blob=ConfigBlob.from_data({"soft": {"android": {"duration": 20}}})
+    ))
+    await test_db.commit()
+    
+    response = await client.get("/api/v1/delivery/legacy-game/configs")
+    
+    assert response.status_code == 200
+    haptic = response.json()["sections"]["haptic"]
+    assert haptic["Soft"] == {
+        "Android": {"Duration": 20, "Amplitude": 0},
+        "IOS": {"Intensity": 0, "Sharpness": 0, "Duration": 0},
+    }
+    assert haptic["Heavy"]["Android"] == {"Duration": 0, "Amplitude": 0}
+
+
+@pytest.mark.asyncio
+async def test_get_game_configs_variant_falls_back_to_baseline(client: AsyncClient, test_db):
+    """Test variant entries override the baseline only for their own section"""
+    test_db.add(create_game(app_id="variant-game"))
+    link = await _create_section(test_db, "variant-game", SectionType.LINK)
+    rating = await _create_section(test_db, "variant-game", SectionType.RATING)
+    test_db.add_all([
+        SectionConfigVersion(section_config_id=link.id, blob=ConfigBlob.from_data({"terms_link": "base"})),
+        SectionConfigVersion(
+            section_config_id=link.id,
+            experiment="exp",
+            variant="b",
+            blob=ConfigBlob.from_data({"terms_link": "variant-b"}),
+        ),
+        SectionConfigVersion(section_config_id=rating.id, blob=ConfigBlob.from_data({"max_show_count": 3})),
+    ])
+    await test_db.commit()
+    
+    response = await client.get(
+        "/api/v1/delivery/variant-game/configs",
+        params={"experiment": "exp", "variant": "b"},
+    )
+    
+    assert response.status_code == 200
+    sections = response.json()["sections"]
+    assert sections["link"]["TermsLink"] == "variant-b"
+    assert sections["rating"]["MaxShowCount"] == 3
+
+
+@pytest.mark.asyncio
+async def test_unknown_variants_share_the_baseline_document(test_db):
+    """Test variants without entries are served the cached baseline document"""
+    test_db.add(create_game(app_id="unknown-variant-game"))
+    link = await _create_section(test_db, "unknown-variant-game", SectionType.LINK)
+    test_db.add_all([
+        SectionConfigVersion(section_config_id=link.id, blob=ConfigBlob.from_data({"terms_link": "base"})),
+        SectionConfigVersion(
+            section_config_id=link.id,
+            experiment="exp",
+            variant="b",
+            blob=ConfigBlob.from_data({"terms_link": "variant-b"}),
+        ),
+    ])
+    await test_db.commit()
+    snapshot = await ConfigSnapshotCache().load(test_db, "unknown-variant-game")
+    
+    baseline = snapshot.document()
+    
+    for index in range(50):
+        assert snapshot.document("exp", f"unknown-{index}") is baseline
+    assert snapshot.document("other", "b") is baseline
+    assert b"variant-b" in snapshot.document("exp", "b").data
+    assert len(snapshot._documents) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_game_configs_rebuilt_after_version_update(
+    client: AsyncClient, test_db, test_admin_user
+):
+    """Test the snapshot is rebuilt when a version changes"""
+    test_db.add(create_game(app_id="rebuild-game"))
+    config = await _create_section(test_db, "rebuild-game", SectionType.LINK)
+    version = SectionConfigVersion(section_config_id=config.id, blob=ConfigBlob.from_data({"terms_link": "old"}))
+    test_db.add(version)
+    await test_db.commit()
+    
+    first = await client.get("/api/v1/delivery/rebuild-game/configs")
+    assert first.json()["sections"]["link"]["TermsLink"] == "old"
+    
+    service = SectionConfigService(test_db)
+    await service.update_version(
+        config.id,
+        version.id,
+        SectionConfigVersionUpdate(config_data={"terms_link": "new"}),
+        test_admin_user,
+    )
+    
+    second = await client.get("/api/v1/delivery/rebuild-game/configs")
+    assert second.json()["sections"]["link"]["TermsLink"] == "new"
+
+
+@pytest.mark.asyncio
+async def test_get_game_configs_unknown_game(client: AsyncClient):
+    """Test delivery for an unknown game returns 404"""
+    response = await client.get("/api/v1/delivery/missing-game/configs")
+    
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_player_configs_and_batch_assignments(
+    client: AsyncClient, test_db, test_admin_user
+):
+    """Test players are bucketed server-side and batch assignment groups cohorts"""
+    test_db.add(create_game(app_id="bucket-game"))
+    link = await _create_section(test_db, "bucket-game", SectionType.LINK)
+    test_db.add_all([
+        SectionConfigVersion(section_config_id=link.id, blob=ConfigBlob.from_data({"terms_link": "base"})),
+        SectionConfigVersion(
+            section_config_id=link.id,
+            experiment="terms",
+            variant="b",
+            blob=ConfigBlob.from_data({"terms_link": "variant-b"}),
+        ),
+    ])
+    await test_db.commit()
+    
+    login = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "admin@test.com", "password": "testpassword"}
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    created = await client.post(
+        "/api/v1/experiments",
+        json={"game_id": "bucket-game", "name": "terms", "splits": [{"variant": "b", "weight": 5000}]},
+        headers=headers,
+    )
+    assert created.status_code == 201
+    
+    player_ids = [f"player-{i}" for i in range(200)]
+    response = await client.post(
+        "/api/v1/delivery/bucket-game/assignments",
+        json={"player_ids": player_ids},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    cohorts = {
+        tuple(sorted(cohort["assignments"].items())): cohort
+        for cohort in response.json()["cohorts"]
+    }
+    assert set(cohorts) == {(), (("terms", "b"),)}
+    enrolled = cohorts[(("terms", "b"),)]
+    assert sorted(enrolled["player_ids"] + cohorts[()]["player_ids"]) == sorted(player_ids)
+    
+    player = await client.get(
+        "/api/v1/delivery/bucket-game/configs",
+        params={"player_id": enrolled["player_ids"][0]},
+    )
+    assert player.json()["assignments"] == {"terms": "b"}
+    assert player.json()["sections"]["link"]["TermsLink"] == "variant-b"
+    assert player.headers["etag"] == f'"{enrolled["content_hash"]}"'
+    
+    baseline = await client.get(
+        "/api/v1/delivery/bucket-game/configs",
+        params={"player_id": cohorts[()]["player_ids"][0]},
+    )
+    assert baseline.json()["assignments"] == {}
+    assert baseline.json()["sections"]["link"]["TermsLink"] == "base"
+    
+    unauthenticated = await client.post(
+        "/api/v1/delivery/bucket-game/assignments",
+        json={"player_ids": player_ids},
+    )
+    assert unauthenticated.status_code in (401, 403)
+
+
+@pytest.mark.asyncio
+async def test_sync_returns_only_changed_sections(client: AsyncClient, test_db):
+    """Test delta sync skips sections the client holds and reports removed ones"""
+    test_db.add(create_game(app_id="sync-game"))
+    link = await _create_section(test_db, "sync-game", SectionType.LINK)
+    rating = await _create_section(test_db, "sync-game", SectionType.RATING)
+    test_db.add_all([
+        SectionConfigVersion(section_config_id=link.id, blob=ConfigBlob.from_data({"terms_link": "t"})),
+        SectionConfigVersion(section_config_id=rating.id, blob=ConfigBlob.from_data({"max_show_count": 3})),
+    ])
+    await test_db.commit()
+    
+    first = await client.post("/api/v1/delivery/sync-game/sync", json={})
+    assert first.status_code == 200
+    hashes = first.json()["hashes"]
+    assert set(first.json()["sections"]) == {"link", "rating"}
+    
+    second = await client.post(
+        "/api/v1/delivery/sync-game/sync",
+        json={"known": {"link": hashes["link"], "rating": "stale", "spin": "gone"}},
+    )
+    data = second.json()
+    assert set(data["sections"]) == {"rating"}
+    assert data["sections"]["rating"]["MaxShowCount"] == 3
+    assert data["removed"] == ["spin"]
+    assert data["hashes"] == hashes
+
+
+@pytest.mark.asyncio
+async def test_version_writes_stream_change_events(client: AsyncClient, test_db, test_admin_user):
+    """Test committed version writes reach the game's event stream"""
+    test_db.add(create_game(app_id="events-game"))
+    config = await _create_section(test_db, "events-game", SectionType.LINK)
+    await test_db.commit()
+    service = SectionConfigService(test_db)
+    
+    async with config_event_broker.subscribe("events-game") as subscription:
+        version = await service.create_version(
+            config.id, SectionConfigVersionCreate(config_data={"terms_link": "t"}), test_admin_user
+        )
+        await service.delete_version(config.id, version.id, test_admin_user)
+        
+        disconnected = iter([False, False, False, True])
+        messages = [
+            message async for message in stream_config_events(
+                subscription, lambda: asyncio.sleep(0, next(disconnected)), heartbeat_seconds=0.01
+            )
+        ]
+    
+    assert messages[0].startswith(b"retry: 3000\nevent: ready\n")
+    created = json.loads(messages[1].split(b"data: ", 1)[1])
+    assert messages[1].startswith(b"event: change\n")
+    assert created["action"] == "created"
+    assert created["section_type"] == "link"
+    assert created["version_id"] == version.id
+    assert created["config_hash"] == version.config_hash
+    assert json.loads(messages[2].split(b"data: ", 1)[1])["action"] == "deleted"
+    assert messages[3] == b": keep-alive\n\n"
+    assert config_event_broker.stats()["subscribers"] == 0
+    
+    missing = await client.get("/api/v1/delivery/missing-game/events")
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_notified_changes_drop_stale_snapshots(test_db, test_admin_user):
+    """Test changes notified by other workers drop the game's cached snapshot"""
+    test_db.add(create_game(app_id="notify-game"))
+    config = await _create_section(test_db, "notify-game", SectionType.LINK)
+    await test_db.commit()
+    service = SectionConfigService(test_db)
+    version = await service.create_version(
+        config.id, SectionConfigVersionCreate(config_data={"terms_link": "t"}), test_admin_user
+    )
+    listener = PostgresEventListener(
+        config_event_broker, "postgresql+asyncpg://user@localhost/db", config_snapshot_cache.apply_event
+    )
+    event = service._change_event(config, version, "created")
+    
+    # The writer's own notification: its snapshot already serves the version
+    listener._on_notification(None, 0, "config_events", event.to_json())
+    assert config_snapshot_cache.get("notify-game") is not None
+    
+    remote = service._change_event(config, version, "deleted")
+    listener._on_notification(None, 0, "config_events", remote.to_json())
+    assert config_snapshot_cache.get("notify-game") is None
+
+
+@pytest.mark.asyncio
+async def test_snapshots_expire_after_ttl(test_db, monkeypatch):
+    """Test snapshots are rebuilt after the TTL so changes without an event are served"""
+    test_db.add(create_game(app_id="ttl-game"))
+    config = await _create_section(test_db, "ttl-game", SectionType.LINK)
+    await test_db.commit()
+    cache = ConfigSnapshotCache(ttl_seconds=30)
+    now = [1000.0]
+    monkeypatch.setattr(delivery_service, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    
+    assert (await cache.load(test_db, "ttl-game")).entries == {}
+    test_db.add(SectionConfigVersion(
+        section_config_id=config.id, blob=ConfigBlob.from_data({"terms_link": "t"})
+    ))
+    await test_db.commit()
+    
+    now[0] += 29
+    assert cache.get("ttl-game").entries == {}
+    now[0] += 1
+    assert cache.get("ttl-game") is None
+    assert len((await cache.load(test_db, "ttl-game")).entries) == 1
+
+
+@pytest.mark.asyncio
+async def test_document_variants_compressed_off_the_event_loop(monkeypatch):
+    """Test document encodings are built in a worker thread once and then reused"""
+    threads = []
+    
+    async def to_thread(function, *args):
+        threads.append(function)
+        return function(*args)
+    
+    monkeypatch.setattr(delivery_service, "asyncio", SimpleNamespace(to_thread=to_thread))
+    document = delivery_service.DeliveryDocument(data=b'{"sections":{}}' * 100, content_hash="h")
+    
+    variants = await document.load_variants()
+    
+    assert await document.load_variants() is variants
+    assert document.variants is variants
+    assert threads == [delivery_service.compress_variants]
@@ -2,6 +2,10 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.models.config_blob import ConfigBlob
+from app.models.section_config import SectionConfig, SectionConfigVersion, SectionType
 from tests.utils.factories import create_game
 
 
@@ -113,3 +117,216 @@ async def test_update_game(client: AsyncClient, test_admin_user, test_db):
     assert data["name"] == "Updated Name"
     assert data["description"] == "Updated Description"
 
+
+
+@pytest.mark.asyncio
+async def test_export_game_bundle(client: AsyncClient, test_admin_user, test_db):
+    """Test the bundle holds every section's export plus a manifest of hashes"""
+    test_db.add(create_game(app_id="bundle-game"))
+    link = SectionConfig(game_id="bundle-game", section_type=SectionType.LINK)
+    tutorial = SectionConfig(game_id="bundle-game", section_type=SectionType.TUTORIAL)
+    test_db.add_all([link, tutorial])
+    await test_db.flush()
+    old_link = SectionConfigVersion(section_config_id=link.id, blob=ConfigBlob.from_data({"terms_link": "old"}))
+    test_db.add(old_link)
+    await test_db.flush()
+    test_db.add_all([
+        SectionConfigVersion(section_config_id=link.id, blob=ConfigBlob.from_data({"terms_link": "new"})),
+        SectionConfigVersion(
+            section_config_id=link.id,
+            experiment="exp",
+            variant="b",
+            blob=ConfigBlob.from_data({"terms_link": "variant-b"}),
+        ),
+        SectionConfigVersion(
+            section_config_id=tutorial.id,
+            blob=ConfigBlob.from_data({"data": {"Id": "1", "Levels": [{"Level": 1, "Steps": []}]}}),
+        ),
+    ])
+    await test_db.commit()
+    
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "admin@test.com", "password": "testpassword"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    
+    response = await client.get("/api/v1/games/bundle-game/bundle", headers=headers)
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sections"]["link"] == {"PrivacyLink": "", "TermsLink": "new"}
+    assert data["sections"]["tutorial"]["Levels"][0]["Level"] == 1
+    assert set(data["manifest"]) == {"link", "tutorial"}
+    assert len(data["manifest"]["link"]["hash"]) == 64
+    
+    not_modified = await client.get(
+        "/api/v1/games/bundle-game/bundle",
+        headers={**headers, "If-None-Match": response.headers["etag"]},
+    )
+    assert not_modified.status_code == 304
+    
+    variant = await client.get(
+        "/api/v1/games/bundle-game/bundle",
+        params={"experiment": "exp", "variant": "b"},
+        headers=headers,
+    )
+    assert variant.json()["sections"]["link"]["TermsLink"] == "variant-b"
+    
+    pinned = await client.get(
+        "/api/v1/games/bundle-game/bundle",
+        params={"version_id": old_link.id},
+        headers=headers,
+    )
+    assert pinned.json()["sections"]["link"]["TermsLink"] == "old"
+    assert pinned.json()["manifest"]["link"]["version_id"] == old_link.id
+    
+    unknown = await client.get(
+        "/api/v1/games/bundle-game/bundle",
+        params={"version_id": "missing"},
+        headers=headers,
+    )
+    assert unknown.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_game_archive_round_trip(client: AsyncClient, test_admin_user, test_db):
+    """Test a game's archive imports into another game with its versions and published pointers"""
+    test_db.add(create_game(app_id="archive-game", name="Archive Game"))
+    link = SectionConfig(game_id="archive-game", section_type=SectionType.LINK)
+    rating = SectionConfig(game_id="archive-game", section_type=SectionType.RATING)
+    test_db.add_all([link, rating])
+    await test_db.flush()
+    published = SectionConfigVersion(
+        section_config_id=link.id, title="live", blob=ConfigBlob.from_data({"terms_link": "t"})
+    )
+    test_db.add_all([
+        published,
+        SectionConfigVersion(section_config_id=link.id, title="draft", experiment="exp", variant="a"),
+        SectionConfigVersion(section_config_id=rating.id, blob=ConfigBlob.from_data({"min_levels": 3})),
+    ])
+    await test_db.flush()
+    link.published_version_id = published.id
+    await test_db.commit()
+    
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "admin@test.com", "password": "testpassword"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    
+    archive = await client.get("/api/v1/games/archive-game/archive", headers=headers)
+    
+    assert archive.status_code == 200
+    assert archive.headers["content-type"] == "application/x-ndjson"
+    lines = archive.content.splitlines()
+    assert [line.split(b'"type":"')[1].split(b'"')[0] for line in lines] == [
+        b"game", b"section", b"section", b"version", b"version", b"version"
+    ]
+    
+    imported = await client.post(
+        "/api/v1/games/copy-game/archive", content=archive.content, headers=headers
+    )
+    
+    assert imported.status_code == 200
+    assert imported.json() == {
+        "game_id": "copy-game", "game_created": True, "sections_created": 2, "versions_imported": 3
+    }
+    game = await client.get("/api/v1/games/copy-game", headers=headers)
+    assert game.json()["name"] == "Archive Game"
+    
+    copied_link = await client.get(
+        "/api/v1/section-configs", params={"game_id": "copy-game", "section_type": "link"}, headers=headers
+    )
+    link_id = copied_link.json()["id"]
+    versions = (await client.get(f"/api/v1/section-configs/{link_id}/versions", headers=headers)).json()
+    by_title = {version["title"]: version for version in versions["versions"]}
+    assert set(by_title) == {"live", "draft"}
+    assert by_title["live"]["config_data"] == {"privacy_link": "", "terms_link": "t"}
+    assert by_title["live"]["id"] != published.id
+    assert by_title["draft"]["config_data"] is None
+    assert (by_title["draft"]["experiment"], by_title["draft"]["variant"]) == ("exp", "a")
+    assert copied_link.json()["published_version_id"] == by_title["live"]["id"]
+    
+    export = await client.get(
+        f"/api/v1/section-configs/{link_id}/versions/{by_title['live']['id']}/export", headers=headers
+    )
+    assert export.content == b'{"PrivacyLink":"","TermsLink":"t"}'
+    
+    malformed = await client.post(
+        "/api/v1/games/other-game/archive", content=lines[0] + b"\n{not json}\n", headers=headers
+    )
+    assert malformed.status_code == 400
+    assert malformed.json()["detail"] == "Line 2: invalid JSON"
+    missing = await client.get("/api/v1/games/other-game", headers=headers)
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_clone_game(client: AsyncClient, test_admin_user, test_db):
+    """Test cloning copies sections and the selected versions and remaps published pointers"""
+    test_db.add(create_game(app_id="clone-source", name="Source"))
+    link = SectionConfig(game_id="clone-source", section_type=SectionType.LINK)
+    rating = SectionConfig(game_id="clone-source", section_type=SectionType.RATING)
+    test_db.add_all([link, rating])
+    await test_db.flush()
+    published = SectionConfigVersion(
+        section_config_id=link.id, title="live", blob=ConfigBlob.from_data({"terms_link": "live"})
+    )
+    test_db.add(published)
+    await test_db.flush()
+    test_db.add_all([
+        SectionConfigVersion(section_config_id=link.id, title="draft", blob=ConfigBlob.from_data({"terms_link": "draft"})),
+        SectionConfigVersion(section_config_id=rating.id, title="rating"),
+    ])
+    link.published_version_id = published.id
+    await test_db.commit()
+    
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "admin@test.com", "password": "testpassword"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    
+    async def cloned_titles(app_id: str, versions: str) -> dict:
+        response = await client.post(
+            "/api/v1/games/clone-source/clone",
+            json={"app_id": app_id, "versions": versions},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        assert response.json()["name"] == "Source"
+        sections = (await test_db.execute(
+            select(SectionConfig).where(SectionConfig.game_id == app_id)
+        )).scalars().all()
+        titles = {}
+        for section in sections:
+            copies = (await test_db.execute(
+                select(SectionConfigVersion).where(SectionConfigVersion.section_config_id == section.id)
+            )).scalars().all()
+            published_title = next(
+                (copy.title for copy in copies if copy.id == section.published_version_id), None
+            )
+            titles[section.section_type.value] = (sorted(copy.title for copy in copies), published_title)
+        return titles
+    
+    assert await cloned_titles("clone-all", "all") == {
+        "link": (["draft", "live"], "live"), "rating": (["rating"], None)
+    }
+    assert await cloned_titles("clone-latest", "latest") == {
+        "link": (["draft"], None), "rating": (["rating"], None)
+    }
+    assert await cloned_titles("clone-published", "published") == {
+        "link": (["live"], "live"), "rating": ([], None)
+    }
+    
+    delivered = await client.get("/api/v1/delivery/clone-all/configs")
+    assert delivered.json()["sections"]["link"]["TermsLink"] == "live"
+    
+    source_versions = await test_db.scalar(select(func.count()).select_from(SectionConfigVersion))
+    assert source_versions == 3 + 3 + 2 + 1
+    
+    duplicate = await client.post(
+        "/api/v1/games/clone-source/clone", json={"app_id": "clone-all"}, headers=headers
+    )
+    assert duplicate.status_code == 400
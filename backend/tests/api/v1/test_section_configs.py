@@ -0,0 +1,514 @@
+"""Tests for section configs API endpoints"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.models.config_blob import ConfigBlob
+from app.models.config_export import ConfigExport
+from app.models.section_config import SectionConfig, SectionType
+from tests.utils.factories import create_game
+
+
+async def _login(client: AsyncClient) -> dict:
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "admin@test.com", "password": "testpassword"}
+    )
+    return {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+
+async def _create_section(test_db, game_id: str, section_type: SectionType) -> SectionConfig:
+    test_db.add(create_game(app_id=game_id))
+    config = SectionConfig(game_id=game_id, section_type=section_type)
+    test_db.add(config)
+    await test_db.commit()
+    return config
+
+
+@pytest.mark.asyncio
+async def test_export_version(client: AsyncClient, test_admin_user, test_db):
+    """Test export serves precomputed Unity bytes with a strong ETag"""
+    headers = await _login(client)
+    config = await _create_section(test_db, "export-game", SectionType.LINK)
+    
+    create_response = await client.post(
+        f"/api/v1/section-configs/{config.id}/versions",
+        json={"title": "v1", "config_data": {"privacy_link": "p", "terms_link": "t"}},
+        headers=headers,
+    )
+    version_id = create_response.json()["id"]
+    
+    response = await client.get(
+        f"/api/v1/section-configs/{config.id}/versions/{version_id}/export",
+        headers=headers,
+    )
+    
+    assert response.status_code == 200
+    assert response.content == b'{"PrivacyLink":"p","TermsLink":"t"}'
+    etag = response.headers["etag"]
+    assert not etag.startswith("W/")
+    
+    not_modified = await client.get(
+        f"/api/v1/section-configs/{config.id}/versions/{version_id}/export",
+        headers={**headers, "If-None-Match": etag},
+    )
+    
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+@pytest.mark.asyncio
+async def test_export_version_precompressed(client: AsyncClient, test_admin_user, test_db):
+    """Test large exports are served from the stored gzip variant"""
+    headers = await _login(client)
+    config = await _create_section(test_db, "gzip-game", SectionType.LINK)
+    privacy_link = "https://example.com/privacy/" + "a" * 1000
+    
+    create_response = await client.post(
+        f"/api/v1/section-configs/{config.id}/versions",
+        json={"config_data": {"privacy_link": privacy_link, "terms_link": "t"}},
+        headers=headers,
+    )
+    url = f"/api/v1/section-configs/{config.id}/versions/{create_response.json()['id']}/export"
+    export = (await test_db.execute(select(ConfigExport))).scalar_one()
+    
+    compressed = await client.get(url, headers={**headers, "Accept-Encoding": "gzip"})
+    identity = await client.get(url, headers={**headers, "Accept-Encoding": "identity"})
+    
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert int(compressed.headers["content-length"]) == len(export.gzip_data)
+    assert compressed.content == identity.content == export.data
+    assert "content-encoding" not in identity.headers
+    assert int(identity.headers["content-length"]) == export.size
+    assert compressed.headers["etag"] != identity.headers["etag"]
+    
+    not_modified = await client.get(
+        url,
+        headers={**headers, "Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]},
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.asyncio
+async def test_duplicate_version_reuses_export(client: AsyncClient, test_admin_user, test_db):
+    """Test duplicated versions share the stored export instead of re-serializing"""
+    headers = await _login(client)
+    config = await _create_section(test_db, "dup-game", SectionType.RATING)
+    
+    create_response = await client.post(
+        f"/api/v1/section-configs/{config.id}/versions",
+        json={"config_data": {"enabled": True, "max_show_count": 2}},
+        headers=headers,
+    )
+    version_id = create_response.json()["id"]
+    duplicate_response = await client.post(
+        f"/api/v1/section-configs/{config.id}/versions/{version_id}/duplicate",
+        headers=headers,
+    )
+    duplicate_id = duplicate_response.json()["id"]
+    
+    original = await client.get(
+        f"/api/v1/section-configs/{config.id}/versions/{version_id}/export", headers=headers
+    )
+    duplicate = await client.get(
+        f"/api/v1/section-configs/{config.id}/versions/{duplicate_id}/export", headers=headers
+    )
+    
+    assert original.headers["etag"] == duplicate.headers["etag"]
+    export_count = await test_db.execute(select(func.count()).select_from(ConfigExport))
+    assert export_count.scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_identical_payloads_share_one_blob(client: AsyncClient, test_admin_user, test_db):
+    """Test versions with equal payloads reference the same content-addressed blob"""
+    headers = await _login(client)
+    config = await _create_section(test_db, "blob-game", SectionType.RATING)
+    
+    first = await client.post(
+        f"/api/v1/section-configs/{config.id}/versions",
+        json={"config_data": {"enabled": True, "max_show_count": 2}},
+        headers=headers,
+    )
+    # Same JSON value, different key order
+    second = await client.post(
+        f"/api/v1/section-configs/{config.id}/versions",
+        json={"config_data": {"max_show_count": 2, "enabled": True}},
+        headers=headers,
+    )
+    duplicate = await client.post(
+        f"/api/v1/section-configs/{config.id}/versions/{first.json()['id']}/duplicate",
+        headers=headers,
+    )
+    
+    config_hash = first.json()["config_hash"]
+    assert config_hash is not None
+    assert second.json()["config_hash"] == config_hash
+    assert duplicate.json()["config_hash"] == config_hash
+    assert duplicate.json()["config_data"]["max_show_count"] == 2
+    blob_count = await test_db.execute(select(func.count()).select_from(ConfigBlob))
+    assert blob_count.scalar() == 1
+    
+    updated = await client.patch(
+        f"/api/v1/section-configs/{config.id}/versions/{second.json()['id']}",
+        json={"config_data": {"enabled": False}},
+        headers=headers,
+    )
+    assert updated.json()["config_hash"] != config_hash
+    assert updated.json()["config_data"]["enabled"] is False
+    assert updated.json()["config_data"]["max_show_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_config_data_validated_on_write(client: AsyncClient, test_admin_user, test_db):
+    """Test config_data is validated by its section schema and stored normalized"""
+    headers = await _login(client)
+    config = await _create_section(test_db, "schema-game", SectionType.ADS)
+    url = f"/api/v1/section-configs/{config.id}/versions"
+    
+    invalid = await client.post(
+        url, json={"config_data": {"placements": [{"type": "Banner"}]}}, headers=headers
+    )
+    assert invalid.status_code == 422
+    assert "placements.0.name" in invalid.json()["detail"]
+    
+    created = await client.post(
+        url, json={"config_data": {"placements": [{"name": "reward", "type": "Rewarded"}]}}, headers=headers
+    )
+    assert created.status_code == 201
+    body = created.json()
+    assert body["schema_hash"] is not None
+    assert body["config_data"]["placements"][0]["timeOut"] == 30
+    assert body["config_data"]["advancedSettings"]["bannerPosition"] == "Bottom"
+    
+    patched = await client.patch(
+        f"{url}/{body['id']}/config",
+        json=[{"op": "replace", "path": "/placements/0/type", "value": "Popup"}],
+        headers=headers,
+    )
+    assert patched.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_version_conditional(client: AsyncClient, test_admin_user, test_db):
+    """Test get_version answers a matching If-None-Match with 304 and no body"""
+    headers = await _login(client)
+    config = await _create_section(test_db, "etag-game", SectionType.LINK)
+    
+    create_response = await client.post(
+        f"/api/v1/section-configs/{config.id}/versions",
+        json={"title": "v1", "config_data": {"terms_link": "t"}},
+        headers=headers,
+    )
+    version_id = create_response.json()["id"]
+    url = f"/api/v1/section-configs/{config.id}/versions/{version_id}"
+    
+    first = await client.get(url, headers=headers)
+    etag = first.headers["etag"]
+    second = await client.get(url, headers={**headers, "If-None-Match": etag})
+    
+    assert first.status_code == 200
+    assert first.json()["config_data"] == create_response.json()["config_data"]
+    assert first.json()["config_hash"] == create_response.json()["config_hash"]
+    assert second.status_code == 304
+    assert second.content == b""
+    
+    await client.patch(url, json={"title": "v2"}, headers=headers)
+    third = await client.get(url, headers={**headers, "If-None-Match": etag})
+    
+    assert third.status_code == 200
+    assert third.json()["title"] == "v2"
+
+
+@pytest.mark.asyncio
+async def test_list_versions_conditional(client: AsyncClient, test_admin_user, test_db):
+    """Test list_versions ETag changes when a version is added"""
+    headers = await _login(client)
+    config = await _create_section(test_db, "list-etag-game", SectionType.LINK)
+    url = f"/api/v1/section-configs/{config.id}/versions"
+    
+    first = await client.get(url, headers=headers)
+    etag = first.headers["etag"]
+    unchanged = await client.get(url, headers={**headers, "If-None-Match": etag})
+    
+    assert unchanged.status_code == 304
+    
+    await client.post(url, json={"title": "v1"}, headers=headers)
+    changed = await client.get(url, headers={**headers, "If-None-Match": etag})
+    
+    assert changed.status_code == 200
+    assert changed.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_search_versions_by_containment(client: AsyncClient, test_admin_user, test_db):
+    """Test searching a game's versions by a JSON fragment"""
+    headers = await _login(client)
+    economy = await _create_section(test_db, "search-game", SectionType.ECONOMY)
+    ads = SectionConfig(game_id="search-game", section_type=SectionType.ADS)
+    test_db.add(ads)
+    await test_db.commit()
+    
+    versions = [
+        (economy.id, "gems", {"currencies": [
+            {"id": "coins", "displayName": "Coins"},
+            {"id": "gems", "displayName": "Gems", "startingBalance": 5},
+        ]}),
+        (economy.id, "coins", {"currencies": [{"id": "coins", "displayName": "Coins"}]}),
+        (ads.id, "ads", {"placements": [{"name": "reward", "customAdUnitId": "unit-1"}]}),
+    ]
+    ids = {}
+    for config_id, title, config_data in versions:
+        response = await client.post(
+            f"/api/v1/section-configs/{config_id}/versions",
+            json={"title": title, "config_data": config_data},
+            headers=headers,
+        )
+        ids[title] = response.json()["id"]
+    
+    response = await client.get(
+        "/api/v1/section-configs/search",
+        params={"game_id": "search-game", "contains": '{"currencies":[{"id":"gems"}]}'},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert [match["id"] for match in response.json()] == [ids["gems"]]
+    assert response.json()[0]["section_type"] == "economy"
+    
+    response = await client.get(
+        "/api/v1/section-configs/search",
+        params={
+            "game_id": "search-game",
+            "section_type": "ads",
+            "contains": '{"placements":[{"customAdUnitId":"unit-1"}]}',
+        },
+        headers=headers,
+    )
+    assert [match["id"] for match in response.json()] == [ids["ads"]]
+    
+    response = await client.get(
+        "/api/v1/section-configs/search",
+        params={"game_id": "search-game", "contains": "{not json"},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_diff_and_json_patch_versions(client: AsyncClient, test_admin_user, test_db):
+    """Test diffing two versions and editing a version with JSON Patch"""
+    headers = await _login(client)
+    config = await _create_section(test_db, "patch-game", SectionType.ADS)
+    base_config = {"placements": [{"name": "reward", "customAdUnitId": "a"}]}
+    
+    base = await client.post(
+        f"/api/v1/section-configs/{config.id}/versions",
+        json={"config_data": base_config},
+        headers=headers,
+    )
+    other = await client.post(
+        f"/api/v1/section-configs/{config.id}/versions/{base.json()['id']}/duplicate",
+        headers=headers,
+    )
+    base_id, other_id = base.json()["id"], other.json()["id"]
+    
+    patched = await client.patch(
+        f"/api/v1/section-configs/{config.id}/versions/{other_id}/config",
+        json=[{"op": "replace", "path": "/placements/0/customAdUnitId", "value": "b"}],
+        headers={**headers, "If-Match": f'"{other.json()["config_hash"]}"'},
+    )
+    assert patched.status_code == 200
+    assert patched.json()["config_data"]["placements"][0]["customAdUnitId"] == "b"
+    
+    stale = await client.patch(
+        f"/api/v1/section-configs/{config.id}/versions/{other_id}/config",
+        json=[{"op": "remove", "path": "/placements/0"}],
+        headers={**headers, "If-Match": f'"{other.json()["config_hash"]}"'},
+    )
+    assert stale.status_code == 412
+    
+    # The ETag of the version GET is accepted as If-Match too
+    etag = (await client.get(f"/api/v1/section-configs/{config.id}/versions/{other_id}", headers=headers)).headers["ETag"]
+    for expected_status in (200, 412):
+        response = await client.patch(
+            f"/api/v1/section-configs/{config.id}/versions/{other_id}/config",
+            json=[{"op": "replace", "path": "/placements/0/customAdUnitId", "value": "c"}],
+            headers={**headers, "If-Match": etag},
+        )
+        assert response.status_code == expected_status
+    await client.patch(
+        f"/api/v1/section-configs/{config.id}/versions/{other_id}/config",
+        json=[{"op": "replace", "path": "/placements/0/customAdUnitId", "value": "b"}],
+        headers=headers,
+    )
+    
+    invalid = await client.patch(
+        f"/api/v1/section-configs/{config.id}/versions/{other_id}/config",
+        json=[{"op": "remove", "path": "/missing"}],
+        headers=headers,
+    )
+    assert invalid.status_code == 422
+    
+    response = await client.get(
+        f"/api/v1/section-configs/{config.id}/versions/{other_id}/diff",
+        params={"base": base_id},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["identical"] is False
+    assert data["patch"] == [
+        {"op": "replace", "path": "/placements/0/customAdUnitId", "value": "b"}
+    ]
+    assert data["changes"][0]["old_value"] == "a"
+    
+    same = await client.get(
+        f"/api/v1/section-configs/{config.id}/versions/{base_id}/diff",
+        params={"base": base_id},
+        headers=headers,
+    )
+    assert same.json()["identical"] is True
+    assert same.json()["patch"] == []
+
+
+@pytest.mark.asyncio
+async def test_list_versions_cursor_pagination(client: AsyncClient, test_admin_user, test_db):
+    """Test following next_cursor walks every version exactly once, newest first"""
+    headers = await _login(client)
+    config = await _create_section(test_db, "cursor-game", SectionType.LINK)
+    url = f"/api/v1/section-configs/{config.id}/versions"
+    
+    created = []
+    for i in range(5):
+        response = await client.post(url, json={"title": f"v{i}"}, headers=headers)
+        created.append(response.json()["id"])
+    
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = await client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        page = response.json()
+        assert page["total"] == 5
+        seen.extend(version["id"] for version in page["versions"])
+        if page["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": page["next_cursor"]}
+    
+    assert seen == list(reversed(created))
+    
+    without_total = await client.get(url, params={"include_total": "false"}, headers=headers)
+    assert without_total.json()["total"] is None
+    
+    invalid = await client.get(url, params={"cursor": "not-a-cursor"}, headers=headers)
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_publish_and_unpublish_version(client: AsyncClient, test_admin_user, test_db):
+    """Test the published pointer decides the live config and swaps atomically"""
+    headers = await _login(client)
+    config = await _create_section(test_db, "publish-game", SectionType.LINK)
+    url = f"/api/v1/section-configs/{config.id}"
+    
+    first = await client.post(
+        f"{url}/versions", json={"config_data": {"terms_link": "old"}}, headers=headers
+    )
+    second = await client.post(
+        f"{url}/versions", json={"config_data": {"terms_link": "new"}}, headers=headers
+    )
+    variant = await client.post(
+        f"{url}/versions",
+        json={"experiment": "exp", "variant": "b", "config_data": {"terms_link": "b"}},
+        headers=headers,
+    )
+    first_id = first.json()["id"]
+    
+    assert (await client.get(f"{url}/published/export", headers=headers)).status_code == 404
+    
+    published = await client.post(f"{url}/publish", json={"version_id": first_id}, headers=headers)
+    assert published.status_code == 200
+    assert published.json()["published_version_id"] == first_id
+    
+    live = await client.get(f"{url}/published/export", headers=headers)
+    assert live.json()["TermsLink"] == "old"
+    delivered = await client.get("/api/v1/delivery/publish-game/configs")
+    assert delivered.json()["versions"]["link"] == first_id
+    
+    stale = await client.post(
+        f"{url}/publish",
+        json={"version_id": second.json()["id"], "expected_version_id": None},
+        headers=headers,
+    )
+    assert stale.status_code == 409
+    rejected = await client.post(
+        f"{url}/publish", json={"version_id": variant.json()["id"]}, headers=headers
+    )
+    assert rejected.status_code == 400
+    
+    unpublished = await client.post(
+        f"{url}/unpublish", json={"expected_version_id": first_id}, headers=headers
+    )
+    assert unpublished.json()["published_version_id"] is None
+    delivered = await client.get("/api/v1/delivery/publish-game/configs")
+    assert delivered.json()["versions"]["link"] == second.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_versions(client: AsyncClient, test_admin_user, test_db):
+    """Test bulk writes span sections in one request and report failures per item"""
+    headers = await _login(client)
+    link = await _create_section(test_db, "bulk-game", SectionType.LINK)
+    rating = SectionConfig(game_id="bulk-game", section_type=SectionType.RATING)
+    test_db.add(rating)
+    await test_db.commit()
+    
+    existing = await client.post(
+        f"/api/v1/section-configs/{link.id}/versions",
+        json={"title": "old", "config_data": {"privacy_link": "p", "terms_link": "t"}},
+        headers=headers,
+    )
+    links = {"privacy_link": "p2", "terms_link": "t2"}
+    
+    response = await client.post(
+        "/api/v1/section-configs/versions/bulk",
+        json={
+            "game_id": "bulk-game",
+            "items": [
+                {"section_config_id": link.id, "title": "a", "config_data": links},
+                {"section_config_id": rating.id, "config_data": {"min_levels": 7}},
+                {"section_config_id": link.id, "version_id": existing.json()["id"], "config_data": links},
+                {"section_config_id": rating.id, "config_data": {"min_levels": "many"}},
+                {"section_config_id": "missing", "title": "x"},
+                {"section_config_id": link.id, "version_id": "missing"},
+            ],
+        },
+        headers=headers,
+    )
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["updated"], body["failed"]) == (2, 1, 3)
+    assert [r["status_code"] for r in body["results"]] == [201, 201, 200, 422, 404, 404]
+    assert body["results"][0]["version"]["config_data"] == links
+    assert body["results"][1]["version"]["config_data"]["min_levels"] == 7
+    assert body["results"][2]["version"]["title"] == "old"
+    assert body["results"][2]["version"]["config_hash"] == body["results"][0]["version"]["config_hash"]
+    assert "min_levels" in body["results"][3]["detail"]
+    
+    # Identical payloads share one blob; every written version has its export
+    blob_count = await test_db.scalar(select(func.count()).select_from(ConfigBlob))
+    assert blob_count == 3
+    for result in body["results"][:3]:
+        version = result["version"]
+        export = await client.get(
+            f"/api/v1/section-configs/{version['section_config_id']}/versions/{version['id']}/export",
+            headers=headers,
+        )
+        assert export.status_code == 200
+    
+    versions = await client.get(f"/api/v1/section-configs/{link.id}/versions", headers=headers)
+    assert versions.json()["total"] == 2
@@ -15,6 +15,10 @@ from app.core.database import Base
 from app.api.dependencies.common import get_db
 from app.models.user import User, UserRole
 from app.core.auth import get_password_hash
+from app.core.principal_cache import principal_cache
+from app.models.config_blob import reconstruction_cache
+from app.services.delivery_service import config_snapshot_cache
+from app.services.section_config_service import version_total_cache
 
 
 # Test database URL (in-memory SQLite)
@@ -29,6 +33,20 @@ def event_loop() -> Generator:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_process_caches() -> Generator:
+    """Keep process-wide caches (delivery snapshots, principals, version totals, payloads) isolated per test."""
+    config_snapshot_cache.clear()
+    principal_cache.clear()
+    version_total_cache.clear()
+    reconstruction_cache.clear()
+    yield
+    config_snapshot_cache.clear()
+    principal_cache.clear()
+    version_total_cache.clear()
+    reconstruction_cache.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_engine():
     """Create a test database engine."""
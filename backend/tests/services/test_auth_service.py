@@ -42,3 +42,48 @@ async def test_authenticate_user_invalid_password(test_db, test_admin_user):
     assert exc_info.value.status_code == 401
     assert "Incorrect email or password" in str(exc_info.value.detail)
 
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_runs_off_event_loop():
+    """Test hashing and verification on the password hashing pool"""
+    from app.core.auth import PasswordHasher
+
+    hasher = PasswordHasher(max_workers=1, max_pending=4)
+    try:
+        hashed = await hasher.hash("secret")
+        assert await hasher.verify("secret", hashed) is True
+        assert await hasher.verify("wrong", hashed) is False
+        assert hasher.pending == 0
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_rejects_when_saturated():
+    """Test that a saturated hashing pool fails fast with 503"""
+    import asyncio
+    import threading
+
+    from app.core.auth import PasswordHasher
+    from app.core.exceptions import ServiceBusyError
+
+    hasher = PasswordHasher(max_workers=1, max_pending=2)
+    release = threading.Event()
+    try:
+        blocked = [asyncio.create_task(hasher.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert hasher.pending == 2
+        assert hasher.queue_depth == 1
+
+        with pytest.raises(ServiceBusyError) as exc_info:
+            await hasher.hash("secret")
+        assert exc_info.value.status_code == 503
+        assert hasher.stats()["rejected"] == 1
+
+        release.set()
+        await asyncio.gather(*blocked)
+        assert hasher.pending == 0
+    finally:
+        release.set()
+        hasher.shutdown()
@@ -0,0 +1,76 @@
+"""Tests for the static publish service"""
+
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.models.section_config import SectionConfig, SectionType
+from app.schemas.section_config import SectionConfigVersionCreate, SectionConfigVersionUpdate
+from app.services.game_service import GameService
+from app.services.publish_service import MANIFEST_NAME, PublishService, game_directory
+from app.services.section_config_service import SectionConfigService
+from tests.utils.factories import create_game
+
+
+@pytest.mark.asyncio
+async def test_version_writes_publish_hashed_files(test_db, test_admin_user, tmp_path, monkeypatch):
+    """Test every version change republishes immutable files and swaps latest.json"""
+    monkeypatch.setattr(settings, "STATIC_PUBLISH_DIR", str(tmp_path))
+    test_db.add(create_game(app_id="static-game"))
+    config = SectionConfig(game_id="static-game", section_type=SectionType.LINK)
+    test_db.add(config)
+    await test_db.commit()
+    service = SectionConfigService(test_db)
+    directory = tmp_path / "static-game"
+    
+    version = await service.create_version(
+        config.id,
+        SectionConfigVersionCreate(config_data={"privacy_link": "p1", "terms_link": "t"}),
+        test_admin_user,
+    )
+    first = json.loads((directory / MANIFEST_NAME).read_bytes())
+    link = first["sections"]["link"]
+    
+    assert link["version_id"] == version.id
+    assert link["file"] == f"link.{link['hash']}.json"
+    assert (directory / link["file"]).read_bytes() == b'{"PrivacyLink":"p1","TermsLink":"t"}'
+    assert (directory / first["document"]["file"]).exists()
+    assert set(first["files"]) <= {path.name for path in directory.iterdir()}
+    
+    for privacy_link in ("p2", "p3"):
+        await service.update_version(
+            config.id,
+            version.id,
+            SectionConfigVersionUpdate(config_data={"privacy_link": privacy_link, "terms_link": "t"}),
+            test_admin_user,
+        )
+    latest = json.loads((directory / MANIFEST_NAME).read_bytes())
+    second_link = latest["sections"]["link"]["file"]
+    
+    assert second_link != link["file"]
+    # Files of the previous manifest survive one publish, older ones are pruned
+    assert not (directory / link["file"]).exists()
+    assert len(list(directory.glob("link.*.json"))) == 2
+    assert not list(directory.glob(".*"))
+    
+    await GameService(test_db).delete_game("static-game")
+    assert not (directory / MANIFEST_NAME).exists()
+
+
+@pytest.mark.asyncio
+async def test_publish_games(test_db, tmp_path):
+    """Test publishing every game to an explicit directory"""
+    test_db.add(create_game(app_id="first-game"))
+    test_db.add(create_game(app_id="second-game"))
+    await test_db.commit()
+    
+    results = await PublishService(test_db).publish_games(str(tmp_path))
+    
+    assert [result.game_id for result in results] == ["first-game", "second-game"]
+    manifest = json.loads((tmp_path / "first-game" / MANIFEST_NAME).read_bytes())
+    assert manifest["sections"] == {}
+    assert manifest["variants"] == []
+    
+    with pytest.raises(ValueError):
+        game_directory(str(tmp_path), "../escape")
@@ -0,0 +1,203 @@
+"""Tests for version retention and pruning"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.models.config_blob import ConfigBlob
+from app.models.config_export import ConfigExport
+from app.models.experiment import Experiment
+from app.models.retention_policy import RetentionPolicy
+from app.models.section_config import SectionConfig, SectionConfigVersion, SectionType
+from app.schemas.retention import RetentionPolicyCreate
+from app.schemas.section_config import SectionConfigVersionCreate
+from app.services import retention_service
+from app.services.retention_service import RetentionService, retention_pruner
+from app.services.section_config_service import REFRESH_ON_REUSE, SectionConfigService, export_row
+from app.utils.db_utils import insert_if_absent
+from tests.utils.factories import create_game
+
+
+async def _versions(test_db, section_config: SectionConfig, *specs) -> dict:
+    """Add versions (title, experiment, blob) one minute apart, oldest first"""
+    start = datetime.utcnow() - timedelta(days=30)
+    versions = {}
+    for minute, (title, experiment, blob) in enumerate(specs):
+        versions[title] = SectionConfigVersion(
+            section_config_id=section_config.id,
+            title=title,
+            experiment=experiment,
+            variant="a" if experiment else None,
+            blob=blob,
+            created_at=start + timedelta(minutes=minute),
+        )
+    test_db.add_all(versions.values())
+    await test_db.flush()
+    return versions
+
+
+@pytest.mark.asyncio
+async def test_prune_keeps_published_and_delivered_versions(test_db, test_admin_user):
+    """Test pruning honours keep_last but never deletes published or delivered versions"""
+    test_db.add(create_game(app_id="prune-game"))
+    link = SectionConfig(game_id="prune-game", section_type=SectionType.LINK)
+    test_db.add_all([link, Experiment(game_id="prune-game", name="exp", splits=[])])
+    await test_db.flush()
+    shared = ConfigBlob.from_data({"terms_link": "shared"})
+    orphan = ConfigBlob.from_data({"terms_link": "only-b1"})
+    orphan.created_at = datetime.utcnow() - timedelta(hours=2)
+    versions = await _versions(
+        test_db, link,
+        ("b1", None, orphan),
+        ("b2", None, None),
+        ("g1", "gone", shared),
+        ("g2", "gone", None),
+        ("e1", "exp", None),
+        ("b3", None, None),
+        ("b4", None, shared),
+    )
+    link.published_version_id = versions["b2"].id
+    await test_db.commit()
+    
+    service = RetentionService(test_db, batch_size=1)
+    await service.create_policy(RetentionPolicyCreate(game_id="prune-game", keep_last=2), test_admin_user)
+    
+    dry_run = await service.prune_game("prune-game", test_admin_user, dry_run=True)
+    
+    assert dry_run.versions == 2
+    assert dry_run.sections[0].version_ids == [versions["b1"].id, versions["g1"].id]
+    assert dry_run.blobs is None
+    
+    report = await service.prune_game("prune-game", test_admin_user, dry_run=False)
+    
+    assert report.versions == 2
+    assert report.sections[0].version_ids == []
+    assert (report.blobs, report.exports) == (1, 0)
+    remaining = (await test_db.execute(
+        select(SectionConfigVersion.title).where(SectionConfigVersion.section_config_id == link.id)
+    )).scalars().all()
+    assert sorted(remaining) == ["b2", "b3", "b4", "e1", "g2"]
+    assert await test_db.get(ConfigBlob, shared.hash) is not None
+    
+    again = await service.prune_game("prune-game", test_admin_user, dry_run=True)
+    assert again.versions == 0
+
+
+@pytest.mark.asyncio
+async def test_reused_blobs_and_exports_restart_the_grace_period(test_db, test_admin_user):
+    """Test a write reusing an old unreferenced blob and export refreshes created_at"""
+    test_db.add(create_game(app_id="reuse-game"))
+    link = SectionConfig(game_id="reuse-game", section_type=SectionType.LINK)
+    test_db.add(link)
+    await test_db.flush()
+    link_id = link.id
+    payload = {"privacy_link": "", "terms_link": "reused"}
+    export = export_row(link_id, SectionType.LINK, payload)
+    old = datetime.utcnow() - timedelta(hours=2)
+    blob = ConfigBlob.from_data(payload)
+    blob.created_at = old
+    blob_hash = blob.hash
+    test_db.add_all([blob, ConfigExport(**export, created_at=old)])
+    await test_db.commit()
+    
+    await SectionConfigService(test_db).create_version(
+        link_id, SectionConfigVersionCreate(config_data=payload), test_admin_user
+    )
+    
+    cutoff = datetime.utcnow() - retention_service.ORPHAN_GRACE_PERIOD
+    test_db.expire_all()
+    assert (await test_db.get(ConfigBlob, blob_hash)).created_at > cutoff
+    assert (await test_db.get(ConfigExport, export["hash"])).created_at > cutoff
+
+
+@pytest.mark.asyncio
+async def test_collect_garbage_keeps_refreshed_orphans(test_db):
+    """Test an unreferenced blob whose created_at was refreshed is not collected"""
+    blob = ConfigBlob.from_data({"terms_link": "staged"})
+    blob.created_at = datetime.utcnow() - timedelta(hours=2)
+    stale = ConfigBlob.from_data({"terms_link": "stale"})
+    stale.created_at = blob.created_at
+    row, stale_hash = blob.row(), stale.hash
+    test_db.add_all([blob, stale])
+    await test_db.commit()
+    
+    # A concurrent write storing the same payload again
+    await insert_if_absent(test_db, ConfigBlob, row, REFRESH_ON_REUSE)
+    await test_db.commit()
+    
+    assert await RetentionService(test_db).collect_garbage() == {"blobs": 1, "exports": 0}
+    test_db.expire_all()
+    assert await test_db.get(ConfigBlob, row["hash"]) is not None
+    assert await test_db.get(ConfigBlob, stale_hash) is None
+
+
+@pytest.mark.asyncio
+async def test_section_policy_overrides_game_policy(test_db, test_admin_user):
+    """Test a section's own policy replaces the game-wide one"""
+    test_db.add(create_game(app_id="policy-game"))
+    link = SectionConfig(game_id="policy-game", section_type=SectionType.LINK)
+    rating = SectionConfig(game_id="policy-game", section_type=SectionType.RATING)
+    test_db.add_all([link, rating])
+    await test_db.flush()
+    await _versions(test_db, link, *[(f"l{i}", None, None) for i in range(4)])
+    await _versions(test_db, rating, *[(f"r{i}", None, None) for i in range(4)])
+    test_db.add_all([
+        RetentionPolicy(game_id="policy-game", keep_last=1),
+        RetentionPolicy(game_id="policy-game", section_type=SectionType.RATING, keep_last=3),
+    ])
+    await test_db.commit()
+    service = RetentionService(test_db)
+    
+    report = await service.prune_game("policy-game", test_admin_user, dry_run=True)
+    
+    assert {section.section_type: section.versions for section in report.sections} == {
+        SectionType.LINK: 3, SectionType.RATING: 1
+    }
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_policy(RetentionPolicyCreate(game_id="policy-game", keep_days=7), test_admin_user)
+    assert exc_info.value.status_code == 400
+    
+    policy = (await test_db.execute(
+        select(RetentionPolicy).where(RetentionPolicy.section_type.is_(None))
+    )).scalar_one()
+    policy.keep_days = 60
+    await test_db.commit()
+    
+    report = await service.prune("policy-game", dry_run=True)
+    
+    assert {section.section_type: section.versions for section in report.sections} == {
+        SectionType.LINK: 0, SectionType.RATING: 1
+    }
+
+
+@pytest.mark.asyncio
+async def test_pruner_runs_only_while_holding_the_lock(monkeypatch):
+    """Test the scheduled prune is skipped by workers that do not hold the advisory lock"""
+    held = iter([False, True, True])
+    runs = []
+    
+    class FakeLock:
+        def __init__(self, engine, key):
+            pass
+        
+        async def acquire(self):
+            return next(held, False)
+        
+        async def release(self):
+            runs.append("released")
+    
+    async def prune_all(self):
+        runs.append("pruned")
+        return []
+    
+    monkeypatch.setattr(retention_service, "AdvisoryLock", FakeLock)
+    monkeypatch.setattr(RetentionService, "prune_all", prune_all)
+    
+    async with retention_pruner(0.01):
+        await asyncio.sleep(0.1)
+    
+    assert runs == ["pruned", "pruned", "released"]
@@ -0,0 +1,179 @@
+"""Tests for SectionConfigService"""
+
+import json
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.models.config_blob import ConfigBlob, reconstruction_cache
+from app.models.user import User
+from app.models.section_config import SectionConfig, SectionConfigVersion, SectionType
+from app.schemas.section_config import SectionConfigVersionCreate
+from app.services import section_config_service
+from app.services.section_config_service import SectionConfigService
+from tests.utils.factories import create_game
+
+
+@pytest.mark.asyncio
+async def test_get_config_summary(test_db, test_admin_user):
+    """Test summary reports version counts for existing sections only"""
+    service = SectionConfigService(test_db)
+    
+    game = create_game(app_id="summary-game")
+    test_db.add(game)
+    config = SectionConfig(game_id="summary-game", section_type=SectionType.ECONOMY)
+    test_db.add(config)
+    await test_db.flush()
+    test_db.add_all([
+        SectionConfigVersion(section_config_id=config.id, title="v1"),
+        SectionConfigVersion(section_config_id=config.id, title="v2"),
+    ])
+    await test_db.commit()
+    
+    summaries = await service.get_config_summary("summary-game", test_admin_user)
+    
+    assert len(summaries) == len(SectionType)
+    by_type = {s.section_type: s for s in summaries}
+    assert by_type[SectionType.ECONOMY].version_count == 2
+    assert by_type[SectionType.ECONOMY].updated_at is not None
+    assert by_type[SectionType.ADS].version_count == 0
+    assert by_type[SectionType.ADS].updated_at is None
+
+
+@pytest.mark.asyncio
+async def test_get_config_summary_single_query(test_db, test_engine, test_admin_user):
+    """Test summary is computed with one database round-trip"""
+    service = SectionConfigService(test_db)
+    
+    test_db.add(create_game(app_id="query-game"))
+    await test_db.commit()
+    
+    statements = []
+    
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(test_engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        await service.get_config_summary("query-game", test_admin_user)
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", count_statement)
+    
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_config_summaries_multiple_games(test_db, test_admin_user):
+    """Test multi-game summaries keep request order and per-game counts"""
+    service = SectionConfigService(test_db)
+    
+    test_db.add(create_game(app_id="game-a"))
+    test_db.add(create_game(app_id="game-b"))
+    config = SectionConfig(game_id="game-b", section_type=SectionType.ADS)
+    test_db.add(config)
+    await test_db.flush()
+    test_db.add(SectionConfigVersion(section_config_id=config.id, title="v1"))
+    await test_db.commit()
+    
+    results = await service.get_config_summaries(["game-b", "game-a", "game-b"], test_admin_user)
+    
+    assert [r.game_id for r in results] == ["game-b", "game-a"]
+    game_b = {s.section_type: s.version_count for s in results[0].sections}
+    game_a = {s.section_type: s.version_count for s in results[1].sections}
+    assert game_b[SectionType.ADS] == 1
+    assert sum(game_a.values()) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_config_summaries_forbidden_for_unassigned_game(test_db, test_operator_user):
+    """Test operators cannot fetch summaries for games they are not assigned to"""
+    service = SectionConfigService(test_db)
+    
+    result = await test_db.execute(
+        select(User)
+        .options(selectinload(User.assigned_games))
+        .where(User.id == test_operator_user.id)
+    )
+    user = result.scalar_one()
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_config_summaries(["other-game"], user)
+    
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_delta_history_mode(test_db, test_engine, test_admin_user, monkeypatch):
+    """Test delta mode stores keyframes every K payloads and reads reconstruct them"""
+    monkeypatch.setattr(settings, "CONFIG_HISTORY_MODE", "delta")
+    monkeypatch.setattr(settings, "CONFIG_KEYFRAME_INTERVAL", 3)
+    service = SectionConfigService(test_db)
+    
+    test_db.add(create_game(app_id="delta-game"))
+    config = SectionConfig(game_id="delta-game", section_type=SectionType.ECONOMY)
+    test_db.add(config)
+    await test_db.commit()
+    
+    payloads = []
+    for balance in range(5):
+        payload = {
+            "currencies": [
+                {"id": f"cur_{i}", "displayName": f"Currency {i}", "startingBalance": balance if i == 0 else i}
+                for i in range(30)
+            ]
+        }
+        version = await service.create_version(
+            config.id, SectionConfigVersionCreate(title=f"v{balance}", config_data=payload), test_admin_user
+        )
+        payloads.append((version.id, version.config_data))
+    
+    result = await test_db.execute(
+        select(SectionConfigVersion.title, ConfigBlob.depth, ConfigBlob.size, ConfigBlob.data.is_(None))
+        .join(ConfigBlob, ConfigBlob.hash == SectionConfigVersion.config_hash)
+        .order_by(SectionConfigVersion.title)
+    )
+    rows = result.all()
+    assert [row.depth for row in rows] == [0, 1, 2, 0, 1]
+    assert [row[3] for row in rows] == [False, True, True, False, True]
+    assert all(row.size * 10 < rows[0].size for row in rows if row.depth)
+    
+    # A new session and an empty cache read the deltas back from the database
+    reconstruction_cache.clear()
+    async with AsyncSession(test_engine) as db:
+        reader = SectionConfigService(db)
+        for version_id, config_data in payloads:
+            version = await reader.get_version(config.id, version_id, test_admin_user)
+            assert version.config_data == config_data
+            # Chains are reconstructed from one query, never loaded as objects
+            assert "base" not in version.blob.__dict__
+        _, config_json = await reader.get_version_with_config_json(config.id, payloads[2][0], test_admin_user)
+        assert json.loads(config_json) == payloads[2][1]
+        
+        matches = await reader.search_versions(
+            "delta-game", test_admin_user, contains={"currencies": [{"id": "cur_0", "startingBalance": 2}]}
+        )
+        assert [match.id for match in matches] == [payloads[2][0]]
+        
+        # Candidates are read a page at a time, newest first, until limit match
+        monkeypatch.setattr(section_config_service, "SEARCH_PAGE_SIZE", 2)
+        matches = await reader.search_versions(
+            "delta-game", test_admin_user, contains={"currencies": [{"id": "cur_1"}]}, limit=3
+        )
+        assert [match.id for match in matches] == [version_id for version_id, _ in payloads[:1:-1]]
+
+
+def test_export_row_exports_unvalidated_legacy_payload():
+    """Test a payload stored before validation is exported as stored, not dropped"""
+    legacy = {"enabled": True, "minLevel": 5}
+    
+    row = section_config_service.export_row("legacy-config", SectionType.TILE_BUNDLE, legacy)
+    
+    assert row is not None
+    exported = json.loads(row["data"])
+    assert exported["Enabled"] is True
+    assert exported["MinLevel"] == 5
+    assert exported["Discount"] == 0
@@ -0,0 +1,34 @@
+"""Tests for experiment bucketing"""
+
+import pytest
+
+from app.utils.bucketing import BUCKET_COUNT, VariantAllocator, player_bucket
+
+
+def test_player_bucket_is_stable_and_per_experiment():
+    """Test buckets depend only on (experiment, player_id)"""
+    assert player_bucket("exp", "player-1") == player_bucket("exp", "player-1")
+    assert 0 <= player_bucket("exp", "player-1") < BUCKET_COUNT
+    buckets = {player_bucket(f"exp-{i}", "player-1") for i in range(20)}
+    assert len(buckets) > 1
+
+
+def test_allocator_splits_traffic_by_weight():
+    """Test weights map to traffic shares and the remainder is not enrolled"""
+    allocator = VariantAllocator("exp", [("a", 2500), ("b", 2500)])
+    player_ids = [f"player-{i}" for i in range(20000)]
+    
+    assigned = allocator.assign_many(player_ids)
+    
+    assert assigned == [allocator.assign(player_id) for player_id in player_ids]
+    assert abs(assigned.count("a") / len(assigned) - 0.25) < 0.02
+    assert abs(assigned.count("b") / len(assigned) - 0.25) < 0.02
+    assert abs(assigned.count(None) / len(assigned) - 0.5) < 0.02
+
+
+def test_allocator_rejects_invalid_weights():
+    """Test weights over 100% or negative are rejected"""
+    with pytest.raises(ValueError):
+        VariantAllocator("exp", [("a", 6000), ("b", 6000)])
+    with pytest.raises(ValueError):
+        VariantAllocator("exp", [("a", -1)])
@@ -0,0 +1,48 @@
+"""Tests for precompressed response helpers"""
+
+import gzip
+
+import brotli
+
+from app.utils.compression import (
+    BROTLI,
+    GZIP,
+    MIN_COMPRESS_SIZE,
+    compress_variants,
+    encoded_etag,
+    negotiate_encoding,
+)
+
+
+def test_compress_variants_only_keeps_smaller_encodings():
+    """Test small bodies stay uncompressed and large ones round-trip"""
+    assert compress_variants(b"{}") == {}
+    
+    data = b'{"GridTiles":[' + b",".join(b'{"X":1,"Y":2}' for _ in range(100)) + b"]}"
+    assert len(data) >= MIN_COMPRESS_SIZE
+    variants = compress_variants(data)
+    
+    assert gzip.decompress(variants[GZIP]) == data
+    assert brotli.decompress(variants[BROTLI]) == data
+    assert all(len(encoded) < len(data) for encoded in variants.values())
+    assert compress_variants(data)[GZIP] == variants[GZIP]
+
+
+def test_negotiate_encoding():
+    """Test Accept-Encoding q-values, wildcards and unavailable encodings"""
+    available = {"gzip": b"", "br": b""}
+    
+    assert negotiate_encoding(None, available) is None
+    assert negotiate_encoding("gzip, deflate", available) == "gzip"
+    assert negotiate_encoding("gzip, deflate, br", available) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", available) == "gzip"
+    assert negotiate_encoding("gzip;q=0", available) is None
+    assert negotiate_encoding("*", {"gzip": b""}) == "gzip"
+    assert negotiate_encoding("br", {"gzip": b""}) is None
+    assert negotiate_encoding("GZIP;Q=0.8", available) == "gzip"
+
+
+def test_encoded_etag_differs_per_encoding():
+    """Test each encoding is a distinct representation"""
+    assert encoded_etag("abc", None) == '"abc"'
+    assert encoded_etag("abc", "gzip") == '"abc-gzip"'
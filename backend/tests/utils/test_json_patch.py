@@ -0,0 +1,77 @@
+"""Tests for JSON diff and patch utilities"""
+
+import pytest
+
+from app.utils.json_patch import JsonPatchError, apply_patch, diff
+
+
+def test_diff_matches_array_elements_by_id():
+    """Test keyed arrays yield targeted operations that round-trip"""
+    old = {
+        "placements": [
+            {"name": "interstitial", "customAdUnitId": "a"},
+            {"name": "reward", "customAdUnitId": "b"},
+            {"name": "banner", "customAdUnitId": "c"},
+        ]
+    }
+    new = {
+        "placements": [
+            {"name": "reward", "customAdUnitId": "b2"},
+            {"name": "interstitial", "customAdUnitId": "a"},
+            {"name": "native", "customAdUnitId": "d"},
+        ]
+    }
+    
+    result = diff(old, new)
+    
+    assert apply_patch(old, result.patch) == new
+    assert {"op": "remove", "path": "/placements/2"} in result.patch
+    assert {"op": "move", "from": "/placements/1", "path": "/placements/0"} in result.patch
+    assert {"op": "replace", "path": "/placements/0/customAdUnitId", "value": "b2"} in result.patch
+    assert [change.kind for change in result.changes] == ["removed", "moved", "modified", "added"]
+
+
+def test_diff_reorders_large_keyed_arrays():
+    """Test reordered, trimmed and extended keyed arrays round-trip with one move per element at most"""
+    old = [{"id": f"item_{i}", "amount": i} for i in range(5000)]
+    new = [dict(item) for item in reversed(old[1000:])] + [{"id": "item_new", "amount": -1}]
+    new[10]["amount"] = 0
+    
+    result = diff(old, new)
+    
+    assert apply_patch(old, result.patch) == new
+    assert sum(1 for op in result.patch if op["op"] == "move") < len(new)
+    assert sum(1 for op in result.patch if op["op"] == "remove") == 1000
+
+
+def test_diff_positional_arrays_and_objects():
+    """Test arrays without identity fields are compared by position"""
+    old = {"Levels": [1, 2, 3], "enabled": True, "a/b": 1}
+    new = {"Levels": [1, 5], "enabled": 1, "extra": None}
+    
+    result = diff(old, new)
+    
+    assert apply_patch(old, result.patch) == new
+    assert diff(new, new).patch == []
+
+
+def test_apply_patch_operations_and_errors():
+    """Test RFC 6902 operations and failure modes"""
+    document = {"steps": [{"Type": 0}], "title": "t"}
+    
+    patched = apply_patch(document, [
+        {"op": "test", "path": "/title", "value": "t"},
+        {"op": "add", "path": "/steps/-", "value": {"Type": 1}},
+        {"op": "copy", "from": "/title", "path": "/name"},
+        {"op": "replace", "path": "/steps/0/Type", "value": 2},
+    ])
+    
+    assert patched == {"steps": [{"Type": 2}, {"Type": 1}], "title": "t", "name": "t"}
+    assert document == {"steps": [{"Type": 0}], "title": "t"}
+    
+    with pytest.raises(JsonPatchError):
+        apply_patch(document, [{"op": "remove", "path": "/missing"}])
+    with pytest.raises(JsonPatchError):
+        apply_patch(document, [{"op": "test", "path": "/title", "value": "x"}])
+    with pytest.raises(JsonPatchError):
+        apply_patch(document, [{"op": "replace", "path": "/steps/5", "value": 1}])
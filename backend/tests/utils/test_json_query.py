@@ -0,0 +1,27 @@
+"""Tests for JSON query helpers"""
+
+from app.utils.json_query import json_contains
+
+
+def test_json_contains_objects_and_arrays():
+    """Test containment follows PostgreSQL jsonb @> semantics"""
+    document = {
+        "currencies": [{"id": "coins", "startingBalance": 0}, {"id": "gems"}],
+        "enabled": True,
+    }
+    
+    assert json_contains(document, {"currencies": [{"id": "gems"}]})
+    assert json_contains(document, {"currencies": [{"id": "gems"}, {"id": "coins"}]})
+    assert json_contains(document, {})
+    assert not json_contains(document, {"currencies": [{"id": "stars"}]})
+    assert not json_contains(document, {"currencies": {"id": "gems"}})
+    assert not json_contains(document, {"missing": None})
+
+
+def test_json_contains_scalars():
+    """Test scalar matching, including the top-level array exception"""
+    assert json_contains(["a", "b"], "a")
+    assert not json_contains({"tags": ["a", "b"]}, {"tags": "a"})
+    assert json_contains({"enabled": True}, {"enabled": True})
+    assert not json_contains({"enabled": 1}, {"enabled": True})
+    assert json_contains({"value": 1}, {"value": 1.0})
@@ -0,0 +1,37 @@
+"""Tests for fast JSON response encoding"""
+
+import json
+
+import orjson
+
+from app.utils import json_response
+from app.utils.json_response import FastJSONResponse, dumps, embed_json
+
+
+def test_dumps_is_compact_and_falls_back_for_non_string_keys():
+    """Test encoding matches the stdlib's compact output, including values orjson rejects"""
+    value = {"name": "Kẹo", "items": [1, 2.5, None, True]}
+    
+    assert dumps(value) == json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    assert json.loads(dumps({1: "a"})) == {"1": "a"}
+    assert FastJSONResponse({"ok": True}).body == b'{"ok":true}'
+
+
+def test_dumps_encodes_with_orjson(monkeypatch):
+    """Test the stdlib encoder is only the fallback for values orjson rejects"""
+    def stdlib_dumps(content):
+        raise AssertionError("encoded with the stdlib encoder")
+    
+    monkeypatch.setattr(json_response, "_stdlib_dumps", stdlib_dumps)
+    value = {"name": "Kẹo", "items": [1, 2.5, None, True]}
+    
+    assert dumps(value) == orjson.dumps(value)
+    assert FastJSONResponse(value).body == orjson.dumps(value)
+
+
+def test_embed_json_splices_encoded_members():
+    """Test already-encoded JSON is appended to the document verbatim"""
+    body = embed_json({"id": "v1"}, config_data=b'{"a": [1, 2]}')
+    
+    assert body == b'{"id":"v1","config_data":{"a": [1, 2]}}'
+    assert json.loads(embed_json({}, config_data=b"null")) == {"config_data": None}
@@ -1,7 +1,14 @@
 """Tests for Unity transform utilities"""
 
+import json
+from pathlib import Path
+
 import pytest
-from app.utils.unity_transform import transform_config_to_unity
+from app.schemas.config_sections.registry import normalize_config
+from app.utils.transform_spec import Group, Items, Value, compile_mapping
+from app.utils.unity_export import serialize_unity_export
+from app.utils.unity_transform import SECTION_TRANSFORMS, transform_config_to_unity
+from tests.utils.unity_export_samples import SAMPLE_PAYLOADS
 
 
 def test_transform_economy_config():
@@ -82,3 +89,76 @@ def test_transform_haptic_config():
     assert "IOS" in result["Soft"]
     assert result["Soft"]["Android"]["Duration"] == 100
 
+
+def test_transform_normalized_defaults():
+    """Test normalizing a payload does not change its export"""
+    payloads = {
+        "economy": {"currencies": [{"id": "coin", "name": "Coins", "starting_amount": 10}], "inventoryItems": [{"id": "a", "displayName": "A"}]},
+        "ads": {"placements": [{"name": "level_end", "type": "Interstitial"}]},
+        "notification": {
+            "strategies": [{
+                "id": "s", "name": "S", "mode": 0, "repeatPolicy": 0, "schedulingMode": 0,
+                "defaultChannelId": "c", "notifications": [{"title": "t", "body": "b"}],
+            }],
+            "channels": [{"id": "c", "name": "C"}],
+        },
+        "spin": {"cooldown_hours": 24, "reward_slots": [{"item_id": "coin", "amount": 5, "probability": 1}]},
+    }
+    
+    for section_type, payload in payloads.items():
+        config, schema_hash = normalize_config(section_type, payload)
+        
+        assert schema_hash is not None
+        assert serialize_unity_export(section_type, config) == serialize_unity_export(section_type, payload)
+    
+    config, _ = normalize_config("economy", payloads["economy"])
+    assert transform_config_to_unity("economy", config)["CurrencyDefinitions"][0]["MaxValue"] == 999999999
+
+
+def test_normalize_config_rejects_invalid_payload():
+    """Test payloads that do not match their section schema are rejected"""
+    with pytest.raises(ValueError):
+        normalize_config("ads", {"placements": [{"name": ""}]})
+    
+    assert normalize_config("ux", {"anything": 1}) == ({"anything": 1}, None)
+
+
+def test_compiled_transforms_match_recorded_exports():
+    """Test the compiled mappings reproduce the hand-written transforms byte for byte"""
+    golden_path = Path(__file__).with_name("unity_export_golden.json")
+    golden = json.loads(golden_path.read_text(encoding="utf-8"))
+    
+    assert set(SAMPLE_PAYLOADS) == set(SECTION_TRANSFORMS)
+    for section_type, config in SAMPLE_PAYLOADS.items():
+        assert serialize_unity_export(section_type, config).decode("utf-8") == golden[section_type]
+
+
+def test_compile_mapping_generates_single_expression():
+    """Test a spec compiles to one function returning a dict literal"""
+    transform = compile_mapping("transform_sample", [
+        Value("Name", "meta.name"),
+        Value("Kind", "kind", enum={"a": 0, "b": 1}),
+        Group("Flags", [Value("On", "enabled")]),
+        Items("Rows", "rows", [Value("Id", "id")]),
+    ])
+    
+    result = transform({"meta": {"name": "n"}, "kind": "b", "enabled": True, "rows": [{"id": 1}, {"id": 2}]})
+    
+    assert result == {"Name": "n", "Kind": 1, "Flags": {"On": True}, "Rows": [{"Id": 1}, {"Id": 2}]}
+    assert list(result) == ["Name", "Kind", "Flags", "Rows"]
+    assert "for _v1 in config.get('rows', " in transform.__source__
+    with pytest.raises(KeyError):
+        transform({"meta": {}, "kind": "b", "enabled": True, "rows": []})
+
+
+def test_compile_mapping_defaults_missing_fields():
+    """Test missing fields take their defaults and unknown enum values the enum default"""
+    transform = compile_mapping("transform_defaults", [
+        Value("Name", "meta.name", ""),
+        Value("Kind", "kind", 0, enum={"a": 0, "b": 1}),
+        Group("Flags", [Value("On", "enabled", False)], source="flags"),
+        Items("Rows", "rows", [Value("Id", "id", 0)]),
+    ])
+    
+    assert transform({}) == {"Name": "", "Kind": 0, "Flags": {"On": False}, "Rows": []}
+    assert transform({"kind": "z", "rows": [{}]}) == {"Name": "", "Kind": 0, "Flags": {"On": False}, "Rows": [{"Id": 0}]}
@@ -0,0 +1,178 @@
+"""
+Sample config_data for every exported section type.
+
+The expected Unity exports in unity_export_golden.json were recorded from
+the hand-written transforms on these payloads as given; the compiled
+transforms must reproduce them byte for byte.
+"""
+
+
+def _haptic(duration: int, intensity: float) -> dict:
+    return {
+        "android": {"duration": duration, "amplitude": 120},
+        "ios": {"intensity": intensity, "sharpness": 0.4, "duration": 0.2},
+    }
+
+
+SAMPLE_PAYLOADS = {
+    "economy": {
+        "currencies": [
+            {"id": "coin", "displayName": "Coins", "startingBalance": 100, "maxValue": 99999},
+            {"id": "gem", "name": "Gems", "starting_amount": 5, "allowNegative": True},
+        ],
+        "inventoryItems": [
+            {"id": "hammer", "displayName": "Hammer", "startingQuantity": 2, "maxStackSize": 10},
+        ],
+        "virtualPurchases": [
+            {
+                "id": "hammer_pack",
+                "name": "Hammer Pack",
+                "costs": [{"type": "Currency", "resourceId": "coin", "amount": 300}],
+                "rewards": [{"type": "Item", "resourceId": "hammer", "amount": 3}],
+            },
+        ],
+        "realPurchases": [
+            {
+                "productId": "com.game.gems_small",
+                "displayName": "Small Gems",
+                "productType": "NonConsumable",
+                "rewards": [{"type": "Currency", "resourceId": "gem", "amount": 50}],
+            },
+        ],
+        "settings": {"enableRefundProcessing": True},
+    },
+    "ads": {
+        "adUnitIds": {"banner": "b-1", "interstitial": "i-1", "rewarded": "r-1"},
+        "placements": [
+            {"name": "level_end", "type": "Interstitial", "action": "Show", "minLevel": 3},
+            {"name": "revive", "type": "Rewarded", "customAdUnitId": "r-2", "showAdNotice": True},
+        ],
+        "advancedSettings": {"bannerPosition": "Top", "bannerRefreshRate": 30},
+        "optionalSettings": {"enableConsentFlow": False},
+    },
+    "notification": {
+        "enable": True,
+        "strategies": [
+            {
+                "id": "comeback",
+                "name": "Come back",
+                "mode": 1,
+                "fixedHour": 19,
+                "repeatPolicy": 2,
+                "schedulingMode": 1,
+                "defaultChannelId": "general",
+                "notifications": [
+                    {"title": "title_1", "body": "body_1", "offsetSeconds": 60},
+                    {"title": "title_2", "body": "body_2", "payload": "open_shop"},
+                ],
+            },
+        ],
+        "channels": [{"id": "general", "name": "General", "importance": 4}],
+    },
+    "game": {
+        "gameLogic": {
+            "gameLogicConfig": {
+                "matchCount": 3,
+                "countUndoTileRevive": 1,
+                "countShuffleTileRevive": 2,
+                "countSlotHolder": 7,
+                "warningThreshold": 5,
+            },
+            "combo": {"matchEffect": 2, "maxNoMatch": 4},
+        },
+        "viewConfig": {
+            "gridView": {"tileSize": {"x": 1.25, "y": 1.5}},
+            "holderView": {
+                "slotSize": {"x": 1.1, "y": 1.2},
+                "slotSpace": 0.1,
+                "ratioBetweenTwoTile": 0.9,
+                "slotYPadding": 0.05,
+                "tileInHolderYPadding": 0.02,
+            },
+        },
+    },
+    "haptic": {
+        "soft": _haptic(10, 0.2),
+        "light": _haptic(20, 0.3),
+        "medium": _haptic(30, 0.5),
+        "heavy": _haptic(40, 0.8),
+        "button": _haptic(15, 0.25),
+        "success": _haptic(25, 0.6),
+        "error": _haptic(35, 0.9),
+    },
+    "remove_ads": {
+        "enabled": True,
+        "minLevel": 5,
+        "adWatchedTrigger": 10,
+        "daysPlayedTrigger": 2,
+        "durationHours": 48,
+        "maxLifetimeShows": 5,
+        "maxSessionShows": 1,
+        "cooldownPopupHours": 12,
+        "cooldownOfferHours": 24,
+    },
+    "tile_bundle": {
+        "discount": 40,
+        "minLevel": 8,
+        "daysPlayedTrigger": 1,
+        "sessionsPlayedTrigger": 3,
+        "durationHours": 24,
+        "maxLifetimeShows": 4,
+        "maxSessionShows": 1,
+        "cooldownPopupHours": 6,
+        "cooldownOfferHours": 48,
+    },
+    "booster": {
+        "undo": {"unlock_level": 2, "refill_amount": 1, "start": 3},
+        "hint": {"unlock_level": 4, "refill_amount": 1, "start": 2},
+        "shuffle": {"unlock_level": 6, "refill_amount": 2, "start": 1},
+        "auto_use_after_ads": True,
+        "time_auto_suggestion": 7.5,
+        "auto_suggestion_enabled": True,
+    },
+    "rating": {"enabled": True, "min_star_required": 4, "interval_hours": 72, "min_levels": 10, "max_show_count": 3},
+    "link": {"privacy_link": "https://example.com/privacy", "terms_link": "https://example.com/terms"},
+    "chapter_reward": {"undo": 1, "hint": 2, "shuffle": 3},
+    "game_economy": {"revive_coin_cost": 900, "ad_level_complete_coin_reward": 20, "scenery_complete_coin_reward": 150},
+    "shop_settings": {"enabled": True, "restore_min_level": 3},
+    "spin": {
+        "enabled": True,
+        "min_level": 4,
+        "free_spin_count": 1,
+        "ad_spin_count": 3,
+        "cooldown_hours": 24,
+        "reward_slots": [
+            {"probability": 0.7, "item_id": "coin", "amount": 50, "upgrade_multiplier": 2},
+            {"probability": 0.3, "item_id": "hint", "amount": 1},
+        ],
+    },
+    "hint_offer": {
+        "enabled": True,
+        "duration": 30,
+        "delay_before_countdown": 3,
+        "min_level": 6,
+        "idle_time_trigger": 20,
+        "max_appearances_per_level": 2,
+    },
+    "analytics": {"dev_key": "dev-key", "app_id": "id123"},
+    "tutorial": {
+        "option": 2,
+        "data": {
+            "Id": "2",
+            "Levels": [
+                {
+                    "Level": 1,
+                    "Steps": [
+                        {"Type": 0, "Data": {"Level": 1, "Moves": 12, "GridTiles": [[0, 0, 3], [1.5, -1, 4]]}},
+                        {
+                            "Type": 2,
+                            "Data": {"Toast": {"M": "tap", "W": 4, "H": 1, "X": 0.5, "Y": 0.2}, "FinishStep": 3},
+                            "Focus": True,
+                        },
+                        {"Type": 3, "Data": {"TileId": 7, "AdditionInfo": {"HandId": 2}}},
+                    ],
+                },
+            ],
+        },
+    },
+}
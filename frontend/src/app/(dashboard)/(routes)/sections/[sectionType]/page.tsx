@@ -8,6 +8,7 @@ import {
   useSectionConfigVersions,
   useUpdateVersion,
   useCreateVersion,
+  useConfigEvents,
 } from '@/hooks/useSectionConfigs';
 import type { SectionType, SectionConfigVersion } from '@/types/api';
 import { SECTION_METADATA } from '@/types/api';
@@ -93,6 +94,9 @@ export default function SectionEditorPage() {
     ux: useRef(null),
   };
 
+  // Refetch versions when they change elsewhere
+  useConfigEvents(selectedGameId || '');
+
   // Fetch the single config for this game+section (auto-creates if needed)
   const { data: config, isLoading: isLoadingConfig } = useSectionConfig({
     game_id: selectedGameId || '',
@@ -1,13 +1,16 @@
+import { useEffect } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { apiClient } from '../lib/api';
 import type { 
   SectionConfig, 
   SectionType, 
   SectionConfigSummary, 
+  GameSectionConfigSummary,
   SectionConfigVersion,
   SectionConfigVersionListResponse,
   SectionConfigVersionCreate,
   SectionConfigVersionUpdate,
+  ConfigChangeEvent,
 } from '../types/api';
 
 interface SectionConfigFilters {
@@ -69,29 +72,21 @@ export function useSectionConfigsSummary(gameId: string) {
 }
 
 /**
- * Fetch all summaries for multiple games in parallel
+ * Fetch all summaries for multiple games in a single request
  * Shared utility for aggregation hooks
  */
 async function fetchAllGameSummaries(gameIds: string[]): Promise<SectionConfigSummary[]> {
-      if (!gameIds || gameIds.length === 0) {
+  if (!gameIds || gameIds.length === 0) {
     return [];
-      }
+  }
 
-      const summaryPromises = gameIds.map(async (gameId) => {
-        try {
-          const response = await apiClient.get<SectionConfigSummary[]>(
-            `/section-configs/summary?game_id=${gameId}`
-          );
-          return response.data || [];
-        } catch (error) {
-          // If a game fails, return empty array
-          console.error(`Failed to fetch configs for game ${gameId}:`, error);
-          return [];
-        }
-      });
+  const params = new URLSearchParams();
+  gameIds.forEach((gameId) => params.append('game_ids', gameId));
 
-      const allSummaries = await Promise.all(summaryPromises);
-  return allSummaries.flat();
+  const response = await apiClient.get<GameSectionConfigSummary[]>(
+    `/section-configs/summaries?${params.toString()}`
+  );
+  return (response.data || []).flatMap((summary) => summary.sections);
 }
 
 /**
@@ -160,6 +155,40 @@ export function useSectionConfigVersion(sectionConfigId: string, versionId: stri
   });
 }
 
+/**
+ * Refetch a game's version queries when the server reports a change,
+ * instead of polling. Changes made by other users and workers arrive
+ * through the game's server-sent event stream.
+ */
+export function useConfigEvents(gameId: string) {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    if (!gameId || typeof EventSource === 'undefined') return;
+
+    const source = new EventSource(`${apiClient.defaults.baseURL}/delivery/${gameId}/events`);
+    const invalidateLists = () => {
+      queryClient.invalidateQueries({ queryKey: ['section-config-versions'] });
+      queryClient.invalidateQueries({ queryKey: ['section-configs-summary', gameId] });
+    };
+    source.addEventListener('change', (message) => {
+      const event: ConfigChangeEvent = JSON.parse((message as MessageEvent).data);
+      invalidateLists();
+      queryClient.invalidateQueries({
+        predicate: (query) =>
+          query.queryKey[0] === 'section-config-version' && query.queryKey[2] === event.version_id,
+      });
+    });
+    // Events were dropped server-side: refetch everything
+    source.addEventListener('resync', () => {
+      invalidateLists();
+      queryClient.invalidateQueries({ queryKey: ['section-config-version'] });
+    });
+
+    return () => source.close();
+  }, [gameId, queryClient]);
+}
+
 /**
  * Create a new version for a section config
  */
@@ -55,6 +55,7 @@ export interface SectionConfig {
   id: string;
   game_id: string;
   section_type: SectionType;
+  published_version_id: string | null;  // live baseline version; null serves the latest baseline
   created_at: string;
   updated_at: string;
 }
@@ -70,6 +71,8 @@ export interface SectionConfigVersion {
   experiment: string | null;
   variant: string | null;
   config_data: any | null;
+  config_hash: string | null;  // SHA-256 of canonical config_data; equal hashes mean equal payloads
+  schema_hash: string | null;  // Section schema config_data was validated with; null if unvalidated
   created_at: string;
   updated_at: string;
 }
@@ -101,7 +104,8 @@ export interface SectionConfigVersionUpdate {
  */
 export interface SectionConfigVersionListResponse {
   versions: SectionConfigVersion[];
-  total: number;
+  total: number | null;  // null when requested with include_total=false
+  next_cursor: string | null;  // pass as ?cursor= to fetch the next page
 }
 
 /**
@@ -113,6 +117,56 @@ export interface SectionConfigSummary {
   updated_at: string | null;
 }
 
+/**
+ * Section config summaries for a single game (multi-game dashboard views).
+ */
+export interface GameSectionConfigSummary {
+  game_id: string;
+  sections: SectionConfigSummary[];
+}
+
+/**
+ * RFC 6902 JSON Patch operation.
+ */
+export interface JsonPatchOperation {
+  op: 'add' | 'remove' | 'replace' | 'move' | 'copy' | 'test';
+  path: string;
+  value?: any;
+  from?: string;
+}
+
+/**
+ * Pushed on GET /delivery/{game_id}/events whenever a version is written.
+ */
+export interface ConfigChangeEvent {
+  game_id: string;
+  section_type: SectionType;
+  action: 'created' | 'updated' | 'deleted' | 'published' | 'unpublished';
+  version_id: string;
+  config_hash: string | null;
+  export_hash: string | null;
+  experiment: string | null;
+  variant: string | null;
+}
+
+/**
+ * Structural diff between two versions of a section config.
+ */
+export interface SectionConfigVersionDiff {
+  base_version_id: string;
+  version_id: string;
+  base_config_hash: string | null;
+  config_hash: string | null;
+  identical: boolean;
+  patch: JsonPatchOperation[];
+  changes: Array<{
+    kind: 'added' | 'removed' | 'modified' | 'moved';
+    path: string;
+    old_value: any;
+    new_value: any;
+  }>;
+}
+
 // Section metadata for UI display
 export const SECTION_METADATA: Record<SectionType, { label: string; icon: string; description: string }> = {
   economy: { label: 'Economy', icon: '💰', description: 'Currencies, IAP packages, rewards' },